@@ -0,0 +1,41 @@
+"""
+Time and peak allocations to send and receive a multi-million vertex mesh, whose
+vertices and faces are chunked.
+
+Run from the repository root with `python -m benchmarks.chunking`.
+"""
+
+import time
+import tracemalloc
+
+from benchmarks.mesh_send import grid_mesh
+from specklepy.core.api import operations
+from specklepy.transports.memory import MemoryTransport
+
+
+def measure(function, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+if __name__ == "__main__":
+    mesh = grid_mesh(1000)
+    print(f"{len(mesh.vertices) // 3} vertices")
+    transport = MemoryTransport()
+    # the first send is timed without tracing allocations
+    start = time.perf_counter()
+    obj_id = operations.send(mesh, [transport], False)
+    print(f"send: {time.perf_counter() - start:.2f}s")
+    _, elapsed, peak = measure(operations.send, mesh, [MemoryTransport()], False)
+    print(f"send (traced): {elapsed:.2f}s, peak {peak / 2**20:.1f} MiB")
+
+    start = time.perf_counter()
+    operations.receive(obj_id, local_transport=transport)
+    print(f"receive: {time.perf_counter() - start:.2f}s")
+    _, elapsed, peak = measure(operations.receive, obj_id, None, transport)
+    print(f"receive (traced): {elapsed:.2f}s, peak {peak / 2**20:.1f} MiB")
@@ -0,0 +1,39 @@
+"""
+Time to serialize deep trees with many detached references, where tracking the
+closures of the objects is most of the work.
+
+Run from the repository root with `python -m benchmarks.closures`.
+"""
+
+import time
+
+from specklepy.objects import Base
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.memory import MemoryTransport
+
+
+def deep_tree(depth: int, leaves: int) -> Base:
+    """A chain of `depth` detached objects, each holding `leaves` detached leaves"""
+    root = Base(name="0")
+    current = root
+    for i in range(1, depth):
+        current["@leaves"] = [Base(level=i, leaf=j) for j in range(leaves)]
+        current["@child"] = Base(name=str(i))
+        current = current["@child"]
+    return root
+
+
+def time_serialize(base: Base, passes: int = 3) -> float:
+    best = float("inf")
+    for _ in range(passes):
+        serializer = BaseObjectSerializer(write_transports=[MemoryTransport()])
+        start = time.perf_counter()
+        serializer.write_json(base)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    for depth, leaves in ((100, 100), (500, 20), (2000, 5)):
+        tree = deep_tree(depth, leaves)
+        print(f"depth {depth}, {leaves} leaves each: {time_serialize(tree):.2f}s")
@@ -0,0 +1,52 @@
+"""
+Encoding and decoding speed, and size, of each codec on mesh heavy payloads.
+
+Run from the repository root with `python -m benchmarks.codecs`.
+"""
+
+import time
+
+from benchmarks.mesh_send import grid_mesh
+from specklepy.core.api import operations
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.serialization.codecs import CODECS, JSON, get_codec
+from specklepy.transports.memory import MemoryTransport
+
+
+def best_of(repeat: int, function, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    transport = MemoryTransport()
+    obj_id = operations.send(grid_mesh(500), [transport], False)
+    payloads = list(transport.objects.values())
+    objects = [JSON.loads(payload) for payload in payloads]
+    json_size = sum(len(payload.encode()) for payload in payloads)
+    print(f"{len(payloads)} objects, {json_size / 2**20:.1f} MiB of json")
+
+    for name in CODECS:
+        try:
+            codec = get_codec(name)
+        except SpeckleException:
+            print(f"{name}: not installed")
+            continue
+        encoded = [codec.dumps(obj) for obj in objects]
+        size = sum(len(e if codec.binary else e.encode()) for e in encoded)
+        encode = best_of(3, lambda: [codec.dumps(obj) for obj in objects])
+        decode = best_of(3, lambda: [codec.loads(e) for e in encoded])
+        print(
+            f"{name}: encode {encode * 1000:.0f}ms, decode {decode * 1000:.0f}ms,"
+            f" size {size / 2**20:.1f} MiB"
+        )
+        if not codec.binary:
+            serializer = BaseObjectSerializer(read_transport=transport, codec=codec)
+            root = transport.get_object(obj_id)
+            receive = best_of(3, serializer.read_json, root)
+            print(f"\treceive: {receive * 1000:.0f}ms")
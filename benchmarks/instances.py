@@ -0,0 +1,60 @@
+"""
+Time to serialize a model of many instances of a few block definitions and render
+materials, shared by the instances.
+
+Run from the repository root with `python -m benchmarks.instances`.
+"""
+
+import time
+
+from specklepy.objects.geometry import Mesh, Point
+from specklepy.objects.other import (
+    BlockDefinition,
+    BlockInstance,
+    Collection,
+    RenderMaterial,
+    Transform,
+)
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.memory import MemoryTransport
+
+
+def instanced_model(instance_count: int, family_count: int) -> Collection:
+    materials = [RenderMaterial(name=f"material {i}", opacity=0.5) for i in range(5)]
+    definitions = []
+    for i in range(family_count):
+        mesh = Mesh(
+            vertices=[float(i + j % 7) for j in range(600)],
+            faces=[3, 0, 1, 2] * 50,
+        )
+        mesh["renderMaterial"] = materials[i % len(materials)]
+        definitions.append(
+            BlockDefinition(name=f"family {i}", basePoint=Point(x=i), geometry=[mesh])
+        )
+
+    instances = []
+    for i in range(instance_count):
+        instance = BlockInstance(
+            transform=Transform.from_list(
+                [1.0, 0, 0, i, 0, 1.0, 0, i % 10, 0, 0, 1.0, 0, 0, 0, 0, 1.0]
+            ),
+            definition=definitions[i % family_count],
+        )
+        instance["renderMaterial"] = materials[i % len(materials)]
+        instances.append(instance)
+    return Collection(name="model", collectionType="model", elements=instances)
+
+
+def time_serialize(model: Collection, passes: int = 3) -> float:
+    best = float("inf")
+    for _ in range(passes):
+        serializer = BaseObjectSerializer(write_transports=[MemoryTransport()])
+        start = time.perf_counter()
+        serializer.write_json(model)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    model = instanced_model(20000, 50)
+    print(f"20000 instances of 50 families: {time_serialize(model):.2f}s")
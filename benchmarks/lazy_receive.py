@@ -0,0 +1,38 @@
+"""
+Time to first attribute and memory of receiving a large model lazily and eagerly.
+
+Run from the repository root with `python -m benchmarks.lazy_receive`.
+"""
+
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.resend import layered_model
+from specklepy.core.api import operations
+from specklepy.transports.sqlite import SQLiteTransport
+
+
+def time_first_attribute(obj_id: str, transport: SQLiteTransport, lazy: bool):
+    tracemalloc.start()
+    start = time.perf_counter()
+    received = operations.receive(obj_id, local_transport=transport, lazy=lazy)
+    name = received.elements[10].name
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return name, elapsed, peak
+
+
+if __name__ == "__main__":
+    model = layered_model(100, 1000)
+    with tempfile.TemporaryDirectory() as base_path:
+        transport = SQLiteTransport(base_path=base_path)
+        obj_id = operations.send(model, [transport], False)
+        del model
+        for lazy in (False, True):
+            name, elapsed, peak = time_first_attribute(obj_id, transport, lazy)
+            print(f"LAZY: {lazy}")
+            print(f"\ttime to `{name}`: {elapsed:.3f}s")
+            print(f"\tpeak memory: {peak / 2**20:.1f} MiB")
+        transport.close()
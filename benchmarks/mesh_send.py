@@ -0,0 +1,43 @@
+"""
+Time spent decomposing and encoding a large mesh during `operations.send`.
+
+Run from the repository root with `python -m benchmarks.mesh_send`.
+"""
+
+import time
+
+from specklepy.core.api import operations
+from specklepy.objects.geometry import Mesh
+from specklepy.transports.memory import MemoryTransport
+
+
+def grid_mesh(side: int) -> Mesh:
+    """A flat quad mesh with `side` x `side` vertices"""
+    vertices = []
+    for i in range(side):
+        for j in range(side):
+            vertices.extend((i * 0.5, j * 0.25, (i * j) % 7 * 0.125))
+
+    faces = []
+    for i in range(side - 1):
+        for j in range(side - 1):
+            v = i * side + j
+            faces.extend((4, v, v + 1, v + side + 1, v + side))
+
+    return Mesh.create(vertices=vertices, faces=faces)
+
+
+def time_send(mesh: Mesh, passes: int = 3) -> float:
+    best = float("inf")
+    for _ in range(passes):
+        transport = MemoryTransport()
+        start = time.perf_counter()
+        operations.send(mesh, [transport], use_default_cache=False)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    mesh = grid_mesh(1000)
+    elapsed = time_send(mesh)
+    print(f"send of a {len(mesh.vertices) // 3:,} vertex mesh: {elapsed:.3f}s")
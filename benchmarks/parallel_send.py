@@ -0,0 +1,30 @@
+"""
+Scaling of `operations.send` with the number of serialization worker processes.
+
+Run from the repository root with `python -m benchmarks.parallel_send`.
+"""
+
+import os
+import time
+
+from benchmarks.resend import layered_model
+from specklepy.core.api import operations
+from specklepy.transports.memory import MemoryTransport
+
+
+def time_send(model, workers: int):
+    transport = MemoryTransport()
+    start = time.perf_counter()
+    obj_id = operations.send(model, [transport], False, workers=workers)
+    return obj_id, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    model = layered_model(100, 1000)
+    print(f"CPUS: {os.cpu_count()}")
+    serial_id, serial_time = time_send(model, 1)
+    print(f"\t1 worker: {serial_time:.2f}s")
+    for workers in (2, 4, 8):
+        obj_id, elapsed = time_send(model, workers)
+        assert obj_id == serial_id
+        print(f"\t{workers} workers: {elapsed:.2f}s ({serial_time / elapsed:.2f}x)")
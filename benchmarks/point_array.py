@@ -0,0 +1,42 @@
+"""
+Peak resident memory of a million points held as a list of `Point` objects, and
+as a `PointArray`, each measured in a fresh process.
+
+Run from the repository root with `python -m benchmarks.point_array`.
+"""
+
+import multiprocessing
+from typing import Any, Callable, Dict
+
+from benchmarks.suite.cases import peak_rss_mib
+from specklepy.objects.geometry import Point, PointArray
+
+COUNT = 1_000_000
+
+
+def point_list() -> Any:
+    return [Point(x=i, y=i * 0.5, z=0.0, units="m") for i in range(COUNT)]
+
+
+def point_array() -> Any:
+    return PointArray(Point(x=i, y=i * 0.5, z=0.0, units="m") for i in range(COUNT))
+
+
+HOLDERS: Dict[str, Callable[[], Any]] = {
+    "list": point_list,
+    "PointArray": point_array,
+}
+
+
+def measure(name: str) -> float:
+    start = peak_rss_mib()
+    points = HOLDERS[name]()
+    assert len(points) == COUNT
+    return peak_rss_mib() - start
+
+
+if __name__ == "__main__":
+    context = multiprocessing.get_context("spawn")
+    for name in HOLDERS:
+        with context.Pool(1) as pool:
+            print(f"{name}: {pool.apply(measure, (name,)):.1f} MiB for 1M points")
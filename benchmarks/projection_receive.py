@@ -0,0 +1,56 @@
+"""
+Time to receive a few named attributes of a model with geometry, in full and with
+`include`.
+
+Run from the repository root with `python -m benchmarks.projection_receive`.
+"""
+
+import tempfile
+import time
+
+from specklepy.core.api import operations
+from specklepy.objects import Base
+from specklepy.objects.geometry import Mesh
+from specklepy.objects.other import Collection
+from specklepy.transports.sqlite import SQLiteTransport
+
+
+def team_model(element_count: int, vertex_count: int) -> Base:
+    elements = []
+    for i in range(element_count):
+        element = Base(name=f"element {i}", level=i % 7)
+        element["@displayValue"] = [
+            Mesh(
+                vertices=[float(i + j) for j in range(vertex_count * 3)],
+                faces=[3, 0, 1, 2] * (vertex_count // 3),
+            )
+        ]
+        elements.append(element)
+    data = Base(
+        ListOfUnitFunctions=["living", "retail", "office"],
+        NumberOfUnitsOfASingleFunction=[120, 8, 20],
+    )
+    model = Collection(name="model", collectionType="model", elements=elements)
+    model["@Data"] = data
+    return model
+
+
+def time_receive(obj_id: str, transport: SQLiteTransport, include=None):
+    start = time.perf_counter()
+    operations.receive(obj_id, local_transport=transport, include=include)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    model = team_model(5000, 300)
+    includes = {
+        "full": None,
+        "names": ["ListOfUnitFunctions", "NumberOfUnitsOfASingleFunction"],
+        "paths": ["@Data.ListOfUnitFunctions", "@Data.NumberOfUnitsOfASingleFunction"],
+    }
+    with tempfile.TemporaryDirectory() as base_path:
+        transport = SQLiteTransport(base_path=base_path)
+        obj_id = operations.send(model, [transport], False)
+        for name, include in includes.items():
+            print(f"{name}: {time_receive(obj_id, transport, include):.3f}s")
+        transport.close()
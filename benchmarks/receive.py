@@ -0,0 +1,24 @@
+"""
+Time to receive a large model from a local SQLite transport.
+
+Run from the repository root with `python -m benchmarks.receive`.
+"""
+
+import tempfile
+import time
+
+from benchmarks.resend import layered_model
+from specklepy.core.api import operations
+from specklepy.transports.sqlite import SQLiteTransport
+
+if __name__ == "__main__":
+    model = layered_model(100, 1000)
+    with tempfile.TemporaryDirectory() as base_path:
+        transport = SQLiteTransport(base_path=base_path)
+        obj_id = operations.send(model, [transport], False)
+        del model
+        for _ in range(3):
+            start = time.perf_counter()
+            operations.receive(obj_id, local_transport=transport)
+            print(f"receive: {time.perf_counter() - start:.2f}s")
+        transport.close()
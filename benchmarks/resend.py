@@ -0,0 +1,49 @@
+"""
+Time to resend a large, mostly unchanged model with and without `cache_subtrees`.
+
+Run from the repository root with `python -m benchmarks.resend`.
+"""
+
+import tempfile
+import time
+
+from specklepy.core.api import operations
+from specklepy.objects import Base
+from specklepy.objects.other import Collection
+from specklepy.transports.sqlite import SQLiteTransport
+
+
+def layered_model(layer_count: int, elements_per_layer: int) -> Collection:
+    layers = []
+    for i in range(layer_count):
+        elements = [
+            Base(name=f"element {i}-{j}", level=j % 7, area=j * 1.5, tags=["x", j])
+            for j in range(elements_per_layer)
+        ]
+        layers.append(Collection(name=f"layer {i}", elements=elements))
+    return Collection(name="model", collectionType="model", elements=layers)
+
+
+def timed_send(model: Base, transport: SQLiteTransport, cache_subtrees: bool):
+    start = time.perf_counter()
+    operations.send(model, [transport], False, cache_subtrees=cache_subtrees)
+    return time.perf_counter() - start
+
+
+def modify(model: Collection, count: int, value: int):
+    for layer in model.elements[:count]:
+        layer.elements[0].level = value
+
+
+if __name__ == "__main__":
+    model = layered_model(200, 1000)
+    with tempfile.TemporaryDirectory() as base_path:
+        transport = SQLiteTransport(base_path=base_path)
+        for cache_subtrees in (False, True):
+            print(f"CACHE SUBTREES: {cache_subtrees}")
+            print(f"\tfirst send: {timed_send(model, transport, cache_subtrees):.2f}s")
+            for i in range(3):
+                modify(model, 10, 100 + i)
+                elapsed = timed_send(model, transport, cache_subtrees)
+                print(f"\tresend after modifying 10 elements: {elapsed:.2f}s")
+        transport.close()
@@ -0,0 +1,43 @@
+"""
+Peak memory of exporting a large model to a file, by sending it to a memory
+transport and writing the transport out, and by streaming it with
+`serialize_iter`.
+
+Run from the repository root with `python -m benchmarks.serialize_iter`.
+"""
+
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.projection_receive import team_model
+from specklepy.core.api import operations
+from specklepy.objects import Base
+from specklepy.transports.memory import MemoryTransport
+
+
+def export_sent(model: Base, path: str) -> None:
+    transport = MemoryTransport()
+    operations.send(model, [transport], False)
+    with open(path, "w") as file:
+        for obj_id, serialized in transport.objects.items():
+            file.write(f"{obj_id}\t{serialized}\n")
+
+
+def export_streamed(model: Base, path: str) -> None:
+    with open(path, "w") as file:
+        for obj_id, serialized in operations.serialize_iter(model):
+            file.write(f"{obj_id}\t{serialized}\n")
+
+
+if __name__ == "__main__":
+    model = team_model(5000, 1000)
+    with tempfile.NamedTemporaryFile() as file:
+        for export in (export_sent, export_streamed):
+            tracemalloc.start()
+            start = time.perf_counter()
+            export(model, file.name)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{export.__name__}: {elapsed:.2f}s, peak {peak / 2**20:.1f} MiB")
@@ -0,0 +1,106 @@
+"""
+Write and read throughput, and size on disk, of a SQLite transport storing a mesh
+heavy model uncompressed and compressed with each compressor.
+
+The meshes are bumpy grids with full precision coordinates, as exported from a
+modelling application, which compress much less than the synthetic grids of the
+other benchmarks.
+
+Run from the repository root with `python -m benchmarks.sqlite_compression`.
+"""
+
+import os
+import random
+import tempfile
+import time
+from typing import List, Optional
+
+from specklepy.core.api import operations
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.objects import Base
+from specklepy.objects.geometry import Mesh
+from specklepy.serialization.codecs import (
+    Compressor,
+    ZlibCompressor,
+    ZstdCompressor,
+)
+from specklepy.transports.memory import MemoryTransport
+from specklepy.transports.sqlite import SQLiteTransport
+
+
+def bumpy_mesh(rng: random.Random, side: int) -> Mesh:
+    vertices = []
+    for i in range(side):
+        for j in range(side):
+            vertices.extend(
+                (
+                    i * 0.3 + rng.uniform(-0.01, 0.01),
+                    j * 0.3 + rng.uniform(-0.01, 0.01),
+                    rng.gauss(12.5, 0.4),
+                )
+            )
+    faces = []
+    for i in range(side - 1):
+        for j in range(side - 1):
+            v = i * side + j
+            faces.extend((3, v, v + 1, v + side, 3, v + 1, v + side + 1, v + side))
+    return Mesh.create(vertices=vertices, faces=faces, colors=[-1] * side * side)
+
+
+def mesh_heavy_model(count: int = 200, side: int = 60) -> Base:
+    rng = random.Random(0)
+    root = Base(name="mesh heavy")
+    root["@elements"] = [
+        Base(name=f"element {i}", displayValue=[bumpy_mesh(rng, side)])
+        for i in range(count)
+    ]
+    return root
+
+
+def compressors() -> List[Optional[Compressor]]:
+    found = [None, ZlibCompressor(1), ZlibCompressor(6)]
+    for level in (1, 3):
+        try:
+            found.append(ZstdCompressor(level))
+        except SpeckleException:
+            print("zstd: not installed")
+            break
+    return found
+
+
+if __name__ == "__main__":
+    source = MemoryTransport()
+    obj_id = operations.send(mesh_heavy_model(), [source], False)
+    ids = list(source.objects)
+    json_mb = sum(len(obj.encode()) for obj in source.objects.values()) / 1e6
+    print(f"{len(ids)} objects, {json_mb:.1f} MB of json")
+
+    for compressor in compressors():
+        label = "none"
+        if compressor is not None:
+            label = f"{compressor.name} (level {compressor.level})"
+        with tempfile.TemporaryDirectory() as base_path:
+            transport = SQLiteTransport(base_path=base_path, compression=compressor)
+            start = time.perf_counter()
+            transport.begin_write()
+            for id in ids:
+                transport.save_object(id, source.objects[id])
+            transport.end_write()
+            write = time.perf_counter() - start
+            transport.close()
+            disk_mb = os.path.getsize(os.path.join(base_path, "Objects.db")) / 1e6
+
+            transport = SQLiteTransport(base_path=base_path)
+            start = time.perf_counter()
+            transport.get_objects(ids)
+            read = time.perf_counter() - start
+            start = time.perf_counter()
+            operations.receive(obj_id, local_transport=transport)
+            receive = time.perf_counter() - start
+            transport.close()
+
+        print(
+            f"{label}: {disk_mb:.1f} MB on disk ({json_mb / disk_mb:.1f}x),"
+            f" write {json_mb / write:.0f} MB/s, read {json_mb / read:.0f} MB/s,"
+            f" receive {receive:.2f}s"
+        )
@@ -0,0 +1,47 @@
+"""
+Time to save and read back 200k objects of about 1 kB in a SQLite transport
+without a max size and with one of half their size, and to wait for the eviction
+the writes start in the background.
+
+Run from the repository root with `python -m benchmarks.sqlite_eviction`.
+"""
+
+import hashlib
+import tempfile
+import time
+from typing import Optional
+
+from specklepy.transports.sqlite import SQLiteTransport
+
+COUNT = 200_000
+
+
+def run(max_size_mb: Optional[float]) -> None:
+    ids = [hashlib.md5(str(i).encode()).hexdigest() for i in range(COUNT)]
+    with tempfile.TemporaryDirectory() as base_path:
+        transport = SQLiteTransport(base_path=base_path, max_size_mb=max_size_mb)
+        start = time.perf_counter()
+        transport.begin_write()
+        for obj_id in ids:
+            transport.save_object(obj_id, f'{{"id":"{obj_id}","x":"{"x" * 1000}"}}')
+        transport.end_write()
+        save_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        transport.get_objects(ids[-COUNT // 4 :])
+        get_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        transport.evict()
+        evict_seconds = time.perf_counter() - start
+        stats = transport.stats()
+        transport.close()
+
+    print(
+        f"max size {max_size_mb} MB: save {save_seconds:.2f}s,"
+        f" get {get_seconds:.2f}s, evicted after another {evict_seconds:.2f}s,"
+        f" {stats['objects']} objects of {stats['bytes'] / 1e6:.0f} MB kept"
+    )
+
+
+if __name__ == "__main__":
+    run(None)
+    run(COUNT * 1e-3 / 2)
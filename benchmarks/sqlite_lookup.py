@@ -0,0 +1,44 @@
+"""
+Time to check, and to get, 10k, 100k and 1M ids in a SQLite transport holding
+half of them, as when receiving a version whose closure is partly cached.
+
+Run from the repository root with `python -m benchmarks.sqlite_lookup`.
+"""
+
+import hashlib
+import random
+import tempfile
+import time
+from typing import List
+
+from specklepy.transports.sqlite import SQLiteTransport
+
+
+def object_ids(count: int) -> List[str]:
+    return [hashlib.md5(str(i).encode()).hexdigest() for i in range(count)]
+
+
+if __name__ == "__main__":
+    for count in (10_000, 100_000, 1_000_000):
+        ids = object_ids(count)
+        with tempfile.TemporaryDirectory() as base_path:
+            transport = SQLiteTransport(base_path=base_path)
+            transport.begin_write()
+            for obj_id in ids[::2]:
+                transport.save_object(obj_id, f'{{"id":"{obj_id}"}}')
+            transport.end_write()
+            random.Random(0).shuffle(ids)
+
+            start = time.perf_counter()
+            found = transport.has_objects(ids)
+            has_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            objects = transport.get_objects(ids)
+            get_seconds = time.perf_counter() - start
+            transport.close()
+
+        assert sum(found.values()) == len(objects) == count // 2
+        print(
+            f"{count} ids: has_objects {has_seconds:.2f}s,"
+            f" get_objects {get_seconds:.2f}s"
+        )
@@ -0,0 +1,86 @@
+"""
+Objects read per second by 1 to 8 threads from one SQLite cache file, through a
+transport shared by all of them and through a transport per thread, with and
+without another thread writing to the cache at the same time.
+
+Run from the repository root with `python -m benchmarks.sqlite_threads`.
+"""
+
+import hashlib
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from specklepy.transports.sqlite import SQLiteTransport
+
+COUNT = 100_000
+READS_PER_THREAD = 50
+BATCH = 1000
+
+
+def object_ids(start: int, count: int) -> List[str]:
+    return [hashlib.md5(str(i).encode()).hexdigest() for i in range(start, count)]
+
+
+def save(transport: SQLiteTransport, ids: List[str]) -> None:
+    transport.begin_write()
+    for obj_id in ids:
+        transport.save_object(obj_id, f'{{"id":"{obj_id}","x":"{"x" * 1000}"}}')
+    transport.end_write()
+
+
+def run(base_path: str, threads: int, shared: bool, writing: bool) -> float:
+    ids = object_ids(0, COUNT)
+    transport = SQLiteTransport(base_path=base_path)
+    stop = threading.Event()
+
+    def write() -> None:
+        # keeps writing new objects until the readers are done
+        start = COUNT
+        while not stop.is_set():
+            save(transport, object_ids(start, start + BATCH))
+            start += BATCH
+
+    def read(seed: int) -> int:
+        reader = transport if shared else SQLiteTransport(base_path=base_path)
+        rng = random.Random(seed)
+        found = 0
+        for _ in range(READS_PER_THREAD):
+            found += len(reader.get_objects(rng.sample(ids, BATCH)))
+        if not shared:
+            reader.close()
+        return found
+
+    writer = threading.Thread(target=write) if writing else None
+    if writer:
+        writer.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        found = sum(pool.map(read, range(threads)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    if writer:
+        writer.join()
+    transport.close()
+    assert found == threads * READS_PER_THREAD * BATCH
+    return found / elapsed
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as base_path:
+        transport = SQLiteTransport(base_path=base_path)
+        save(transport, object_ids(0, COUNT))
+        transport.close()
+        for writing in (False, True):
+            for threads in (1, 2, 4, 8):
+                shared = run(base_path, threads, True, writing)
+                own = run(base_path, threads, False, writing)
+                print(
+                    f"{threads} reader{'s' if threads > 1 else ''}"
+                    f"{' and a writer' if writing else ''}:"
+                    f" {shared:.0f} obj/s shared, {own:.0f} obj/s with a transport"
+                    " per thread"
+                )
@@ -0,0 +1,6 @@
+"""
+A benchmark suite for the serializer, run on synthetic models of the shapes AEC
+models come in: wide and flat, deeply nested, mesh heavy and Brep heavy.
+
+Run from the repository root with `python -m benchmarks.suite --help`.
+"""
@@ -0,0 +1,102 @@
+"""
+Times serializing, deserializing, sending and receiving the synthetic models
+against a memory and a SQLite transport, and reports objects per second, MB per
+second and the peak resident memory of each operation.
+
+Every operation runs in a fresh process, so its peak memory is its own. The results
+can be written to a JSON file with `--output` and compared with the results of
+another commit with `--compare`:
+
+    python -m benchmarks.suite --output before.json
+    git checkout my-branch
+    python -m benchmarks.suite --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.suite.cases import CASES, run_case
+from benchmarks.suite.models import MODELS
+
+
+def commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: List[dict], baseline: Dict[Tuple[str, ...], dict]) -> None:
+    for result in results:
+        key = (result["model"], result["transport"], result["operation"])
+        line = (
+            f"{'/'.join(key):<26} {result['seconds']:>8.3f}s "
+            f"{result['objects_per_sec']:>10.0f} obj/s "
+            f"{result['mb_per_sec']:>8.2f} MB/s "
+            f"peak {result['peak_rss_mib']} MiB"
+        )
+        if key in baseline:
+            before = baseline[key]["seconds"]
+            line += f"  (was {before:.3f}s, x{before / result['seconds']:.2f})"
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    parser.add_argument(
+        "--models", nargs="+", choices=list(MODELS), default=list(MODELS)
+    )
+    parser.add_argument(
+        "--transports", nargs="+", choices=list(CASES), default=list(CASES)
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiplies the size of the models"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="the best of this many runs is kept"
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="a JSON file written by an earlier run")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as file:
+            previous = json.load(file)
+        print(f"compared with {previous['commit']} from {previous['date']}")
+        baseline = {
+            (r["model"], r["transport"], r["operation"]): r for r in previous["results"]
+        }
+
+    results = []
+    for model_name in args.models:
+        for transport in args.transports:
+            case = run_case(model_name, transport, args.scale, args.repeat)
+            print_results(case, baseline)
+            results.extend(case)
+
+    report = {
+        "commit": commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
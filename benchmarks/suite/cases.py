@@ -0,0 +1,211 @@
+"""
+The timed operations of one case of the suite, a model against a transport.
+
+Every operation runs in a process of its own, and its inputs are made in another
+one beforehand, so the peak memory it reports is its own, besides the inputs it
+needs, eg: the model, or the objects to receive.
+"""
+
+import multiprocessing
+import sys
+import tempfile
+import time
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.suite.models import MODELS
+from specklepy.core.api import operations
+from specklepy.transports.memory import MemoryTransport
+from specklepy.transports.sqlite import SQLiteTransport
+
+try:
+    import resource
+except ImportError:  # windows
+    resource = None
+
+
+def peak_rss_mib() -> Optional[float]:
+    # on linux, the ru_maxrss of a spawned process starts from the memory of the
+    # process it was forked from, unlike the peak of its own memory map
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 2**10
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kibibytes, macos bytes
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def timed(repeat: int, run: Callable[[], Any]) -> Tuple[float, Optional[float]]:
+    """The best time of `repeat` runs, and the peak memory of the process"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best, peak_rss_mib()
+
+
+# makes the input of an operation from the model name, the scale and the directory
+# of the case
+Setup = Callable[[str, float, str], Any]
+# gets the run to time from the model name, the scale, the directory of the case
+# and the input made by the setup
+Operation = Callable[[str, float, str, Any], Callable[[], Any]]
+
+
+def serialized(model_name: str, scale: float, base_path: str) -> str:
+    return operations.serialize(MODELS[model_name](scale))
+
+
+def sent_to_memory(
+    model_name: str, scale: float, base_path: str
+) -> Tuple[str, Dict[str, str]]:
+    transport = MemoryTransport()
+    obj_id = operations.send(MODELS[model_name](scale), [transport], False)
+    return obj_id, transport.objects
+
+
+def sent_to_sqlite(model_name: str, scale: float, base_path: str) -> str:
+    transport = SQLiteTransport(base_path=base_path, scope="receive")
+    obj_id = operations.send(MODELS[model_name](scale), [transport], False)
+    transport.close()
+    return obj_id
+
+
+def serialize(
+    model_name: str, scale: float, base_path: str, _: None
+) -> Callable[[], str]:
+    model = MODELS[model_name](scale)
+    return lambda: operations.serialize(model)
+
+
+def deserialize(
+    model_name: str, scale: float, base_path: str, serialized: str
+) -> Callable[[], Any]:
+    return lambda: operations.deserialize(serialized)
+
+
+def memory_send(
+    model_name: str, scale: float, base_path: str, _: None
+) -> Callable[[], str]:
+    model = MODELS[model_name](scale)
+    return lambda: operations.send(model, [MemoryTransport()], False)
+
+
+def memory_receive(
+    model_name: str, scale: float, base_path: str, sent: Tuple[str, Dict[str, str]]
+) -> Callable[[], Any]:
+    obj_id, objects = sent
+    transport = MemoryTransport()
+    transport.objects = objects
+    return lambda: operations.receive(obj_id, local_transport=transport)
+
+
+def sqlite_send(
+    model_name: str, scale: float, base_path: str, _: None
+) -> Callable[[], str]:
+    model = MODELS[model_name](scale)
+    scopes = count()
+
+    def send() -> str:
+        # a new database each time, so no run finds the objects already there
+        transport = SQLiteTransport(base_path=base_path, scope=f"send_{next(scopes)}")
+        return operations.send(model, [transport], False)
+
+    return send
+
+
+def sqlite_receive(
+    model_name: str, scale: float, base_path: str, obj_id: str
+) -> Callable[[], Any]:
+    transport = SQLiteTransport(base_path=base_path, scope="receive")
+    return lambda: operations.receive(obj_id, local_transport=transport)
+
+
+CASES: Dict[str, Dict[str, Tuple[Optional[Setup], Operation]]] = {
+    "memory": {
+        "serialize": (None, serialize),
+        "deserialize": (serialized, deserialize),
+        "send": (None, memory_send),
+        "receive": (sent_to_memory, memory_receive),
+    },
+    "sqlite": {
+        "send": (None, sqlite_send),
+        "receive": (sent_to_sqlite, sqlite_receive),
+    },
+}
+
+
+def measure(model_name: str, scale: float) -> Tuple[int, float]:
+    """The number of objects of the model, and their size in MB"""
+    objects, size = 0, 0
+    for _, serialized_obj in operations.serialize_iter(MODELS[model_name](scale)):
+        objects += 1
+        size += len(serialized_obj)
+    return objects, size / 1e6
+
+
+def prepare(
+    model_name: str, transport: str, operation: str, scale: float, base_path: str
+) -> Any:
+    setup = CASES[transport][operation][0]
+    return None if setup is None else setup(model_name, scale, base_path)
+
+
+def run_operation(
+    model_name: str,
+    transport: str,
+    operation: str,
+    scale: float,
+    repeat: int,
+    base_path: str,
+    prepared: Any,
+) -> Tuple[float, Optional[float]]:
+    run = CASES[transport][operation][1](model_name, scale, base_path, prepared)
+    return timed(repeat, run)
+
+
+def in_process(function: Callable[..., Any], *args: Any) -> Any:
+    """Calls the function in a fresh process"""
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(function, args)
+
+
+def run_case(model_name: str, transport: str, scale: float, repeat: int) -> List[dict]:
+    objects, megabytes = in_process(measure, model_name, scale)
+    results = []
+    with tempfile.TemporaryDirectory() as base_path:
+        for operation in CASES[transport]:
+            prepared = in_process(
+                prepare, model_name, transport, operation, scale, base_path
+            )
+            seconds, rss = in_process(
+                run_operation,
+                model_name,
+                transport,
+                operation,
+                scale,
+                repeat,
+                base_path,
+                prepared,
+            )
+            results.append(
+                {
+                    "model": model_name,
+                    "transport": transport,
+                    "operation": operation,
+                    "objects": objects,
+                    "megabytes": round(megabytes, 3),
+                    "seconds": round(seconds, 4),
+                    "objects_per_sec": round(objects / seconds, 1),
+                    "mb_per_sec": round(megabytes / seconds, 2),
+                    "peak_rss_mib": None if rss is None else round(rss, 1),
+                }
+            )
+    return results
@@ -0,0 +1,189 @@
+"""
+Synthetic models of the shapes AEC models come in, sized by a scale factor.
+
+Every generator is deterministic, so the same scale always makes the same objects.
+"""
+
+import random
+import string
+from typing import Callable, Dict, List
+
+from specklepy.objects import Base
+from specklepy.objects.fakemesh import FakeDirection, FakeMesh
+from specklepy.objects.geometry import (
+    Box,
+    Brep,
+    BrepEdge,
+    BrepFace,
+    BrepLoop,
+    BrepLoopType,
+    BrepTrim,
+    BrepTrimType,
+    Circle,
+    Curve,
+    Interval,
+    Mesh,
+    Plane,
+    Point,
+    Polyline,
+    Surface,
+    Vector,
+)
+from specklepy.objects.other import Collection
+
+
+class Sub(Base):
+    bar: List[str]
+
+
+def wide_model(scale: float) -> Base:
+    """A flat object with many small detached children, like `many_children.py`"""
+    rng = random.Random(0)
+    root = Base()
+    for i in range(int(10000 * scale)):
+        stuff = "".join(rng.choice(string.ascii_lowercase) for _ in range(10))
+        root[f"@child_{i}"] = Sub(bar=["asdf", "bar", i, stuff])
+    return root
+
+
+def deep_model(scale: float) -> Collection:
+    """Collections nested 8 levels deep, three to a level, with points at the leaves"""
+    points_per_leaf = max(1, round(4 * scale))
+
+    def collection(depth: int, path: str) -> Collection:
+        if depth == 8:
+            elements = [
+                Point(x=i, y=depth, z=len(path), units="m")
+                for i in range(points_per_leaf)
+            ]
+        else:
+            elements = [collection(depth + 1, f"{path}.{i}") for i in range(3)]
+        return Collection(name=path, collectionType="layer", elements=elements)
+
+    return collection(0, "0")
+
+
+def mesh_model(scale: float) -> Collection:
+    """Large meshes, made with `Mesh.create`, and fake meshes with extra members"""
+    elements = []
+    for i in range(int(100 * scale)):
+        vertices = [float(i + j % 97) * 0.5 for j in range(3000)]
+        faces = []
+        for j in range(997):
+            faces.extend((3, j, j + 1, j + 2))
+        mesh = Mesh.create(vertices=vertices, faces=faces)
+        mesh.units = "m"
+        fake = FakeMesh(
+            vertices=vertices, faces=faces[:2000], cardinal_dir=FakeDirection.NORTH
+        )
+        fake.detach_this = Base(name=f"detached {i}")
+        fake.origin = Point(x=i, y=0, z=0)
+        element = Base(name=f"element {i}")
+        element["@displayValue"] = [mesh, fake]
+        elements.append(element)
+    return Collection(name="meshes", collectionType="model", elements=elements)
+
+
+def brep(i: int) -> Brep:
+    interval = Interval(start=0, end=5 + i)
+    point = Point(x=i, y=10, z=0)
+    vector = Vector(x=1, y=32, z=i)
+    plane = Plane(origin=point, normal=vector, xdir=vector, ydir=vector, units="m")
+    box = Box(basePlane=plane, xSize=interval, ySize=interval, zSize=interval)
+    surface = Surface(
+        degreeU=3,
+        degreeV=3,
+        rational=True,
+        pointData=[float(i + j) for j in range(400)],
+        countU=10,
+        countV=10,
+        closedU=False,
+        closedV=False,
+        domainU=interval,
+        domainV=interval,
+        knotsU=[float(j) for j in range(14)],
+        knotsV=[float(j) for j in range(14)],
+        units="m",
+    )
+    curve = Curve(
+        degree=3,
+        periodic=False,
+        rational=False,
+        closed=False,
+        domain=interval,
+        points=[float(i + j) for j in range(30)],
+        weights=[1.0] * 10,
+        knots=[float(j) for j in range(14)],
+        units="m",
+    )
+    polyline = Polyline(
+        value=[float(i + j) for j in range(30)], closed=False, domain=interval
+    )
+    circle = Circle(radius=i + 1, plane=plane, domain=interval, units="m")
+    return Brep(
+        provenance="benchmark",
+        bbox=box,
+        area=32 + i,
+        volume=54,
+        displayValue=[
+            Mesh.create(vertices=[float(i + j) for j in range(300)], faces=[3, 0, 1, 2])
+        ],
+        Surfaces=[surface] * 6,
+        Curve3D=[curve, polyline] * 6,
+        Curve2D=[circle] * 12,
+        Vertices=[point] * 8,
+        Edges=[
+            BrepEdge(
+                Curve3dIndex=j,
+                TrimIndices=[j],
+                StartIndex=j,
+                EndIndex=j + 1,
+                ProxyCurveIsReversed=False,
+                Domain=interval,
+            )
+            for j in range(12)
+        ],
+        Loops=[
+            BrepLoop(FaceIndex=j, TrimIndices=[j, j + 1], Type=BrepLoopType.Outer)
+            for j in range(6)
+        ],
+        Trims=[
+            BrepTrim(
+                EdgeIndex=j,
+                StartIndex=j,
+                EndIndex=j + 1,
+                FaceIndex=j // 2,
+                LoopIndex=j // 2,
+                CurveIndex=j,
+                IsoStatus=0,
+                TrimType=BrepTrimType.Mated,
+                IsReversed=False,
+            )
+            for j in range(12)
+        ],
+        Faces=[
+            BrepFace(
+                SurfaceIndex=j,
+                LoopIndices=[j],
+                OuterLoopIndex=j,
+                OrientationReversed=False,
+            )
+            for j in range(6)
+        ],
+        IsClosed=True,
+        Orientation=1,
+    )
+
+
+def brep_model(scale: float) -> Collection:
+    """Breps with their surfaces, curves and topology, and a display mesh each"""
+    elements = [brep(i) for i in range(int(200 * scale))]
+    return Collection(name="breps", collectionType="model", elements=elements)
+
+
+MODELS: Dict[str, Callable[[float], Base]] = {
+    "wide": wide_model,
+    "deep": deep_model,
+    "mesh": mesh_model,
+    "brep": brep_model,
+}
@@ -0,0 +1,51 @@
+"""
+Time of receiving the same version again and again, as a dashboard does on every
+rerun, from a remote with some latency, through a SQLite cache and through a
+memory tier in front of it. In full, and with `include`.
+
+Run from the repository root with `python -m benchmarks.tiered_receive`.
+"""
+
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.projection_receive import team_model
+from specklepy.core.api import operations
+from specklepy.transports.memory import MemoryTransport
+from specklepy.transports.sqlite import SQLiteTransport
+from specklepy.transports.tiered import TieredTransport
+
+
+class SlowRemote(MemoryTransport):
+    """A memory transport with the latency and the bandwidth of a server"""
+
+    def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        objects = super().get_objects(id_list)
+        time.sleep(0.05 + sum(len(obj) for obj in objects.values()) / 50e6)
+        return objects
+
+
+if __name__ == "__main__":
+    remote = SlowRemote()
+    obj_id = operations.send(team_model(5000, 300), [remote], False)
+    # a tiered transport gets everything in bulk, so it can copy from the remote
+    server = TieredTransport([remote])
+    includes = {"full": None, "names": ["ListOfUnitFunctions", "elements.level"]}
+
+    for name, include in includes.items():
+        for tiered in (False, True):
+            with tempfile.TemporaryDirectory() as base_path:
+                local = SQLiteTransport(base_path=base_path)
+                if tiered:
+                    local = TieredTransport([MemoryTransport(max_size_mb=500), local])
+                timings = []
+                for _ in range(3):
+                    start = time.perf_counter()
+                    operations.receive(obj_id, server, local, include=include)
+                    timings.append(time.perf_counter() - start)
+                local.close()
+            print(
+                f"{name}, {'memory and SQLite' if tiered else 'SQLite'}:"
+                f" {', '.join(f'{t:.2f}s' for t in timings)}"
+            )
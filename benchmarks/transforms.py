@@ -0,0 +1,48 @@
+"""
+Time to flatten instanced geometry, by placing the mesh of a block definition with
+the transforms of a thousand instances, with numpy and without it.
+
+Run from the repository root with `python -m benchmarks.transforms`.
+"""
+
+import math
+import time
+from typing import List
+
+from specklepy.objects import other
+from specklepy.objects.geometry import Mesh
+from specklepy.objects.other import BlockDefinition, BlockInstance, Transform
+
+
+def instances(count: int, vertex_count: int) -> List[BlockInstance]:
+    vertices = [(i % 101) * 0.25 for i in range(vertex_count * 3)]
+    mesh = Mesh.create(vertices=vertices, faces=[3, 0, 1, 2])
+    definition = BlockDefinition(name="chair", geometry=[mesh])
+    blocks = []
+    for i in range(count):
+        angle = i * 0.01
+        cos, sin = math.cos(angle), math.sin(angle)
+        transform = Transform.from_list(
+            [cos, -sin, 0, i, sin, cos, 0, i * 2, 0, 0, 1, 0, 0, 0, 0, 1]
+        )
+        blocks.append(BlockInstance(transform=transform, definition=definition))
+    return blocks
+
+
+def flatten(blocks: List[BlockInstance]) -> List[Mesh]:
+    return [
+        block.transform_mesh(mesh)
+        for block in blocks
+        for mesh in block.definition.geometry
+    ]
+
+
+if __name__ == "__main__":
+    blocks = instances(1000, 1000)
+    numpy = other.np
+    for name, np in (("numpy", numpy), ("pure python", None)):
+        other.np = np
+        start = time.perf_counter()
+        flatten(blocks)
+        print(f"{name}: {time.perf_counter() - start:.2f}s")
+    other.np = numpy
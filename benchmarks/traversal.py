@@ -0,0 +1,62 @@
+"""
+Throughput of `BaseObjectSerializer` traversal on synthetic object trees.
+
+Run from the repository root with `python -m benchmarks.traversal`.
+"""
+
+import time
+from typing import Callable, List
+
+from specklepy.objects import Base
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.memory import MemoryTransport
+
+
+class Sub(Base):
+    bar: List[str]
+
+
+def wide_tree(child_count: int) -> Base:
+    """The shape used by `example/many_children.py`: one root, many detached kids"""
+    root = Base()
+    for i in range(child_count):
+        root[f"@child_{i}"] = Sub(bar=["asdf", "bar", i, "stuff"])
+    return root
+
+
+def deep_chain(depth: int) -> Base:
+    """
+    A chain of `depth` objects, each detaching the next one.
+
+    NOTE: every object's `__closure` lists all of its descendants, so the serialized
+    size of a chain grows quadratically with its depth.
+    """
+    root = Base(name="level 0")
+    current = root
+    for i in range(1, depth):
+        child = Base(name=f"level {i}")
+        current["@child"] = child
+        current = child
+    return root
+
+
+def objects_per_second(build: Callable[[int], Base], size: int, passes: int = 3):
+    base = build(size)
+    best = float("inf")
+    for _ in range(passes):
+        serializer = BaseObjectSerializer(write_transports=[MemoryTransport()])
+        start = time.perf_counter()
+        serializer.write_json(base)
+        best = min(best, time.perf_counter() - start)
+    return size / best
+
+
+if __name__ == "__main__":
+    for name, build, sizes in [
+        ("wide", wide_tree, [1000, 10000, 100000]),
+        ("deep", deep_chain, [100, 1000, 2500]),
+    ]:
+        print(name.upper())
+        for size in sizes:
+            rate = objects_per_second(build, size)
+            print(f"\t{size} objects: {rate:,.0f} objects/sec")
@@ -0,0 +1,81 @@
+"""
+Time to receive a Revit like model, with many parameters and typed geometry per
+element, with and without type checking the received attributes.
+
+Run from the repository root with `python -m benchmarks.trusted_receive`.
+"""
+
+import cProfile
+import pstats
+import tempfile
+import time
+
+from specklepy.core.api import operations
+from specklepy.objects import Base
+from specklepy.objects.geometry import Line, Mesh, Point
+from specklepy.objects.other import Collection, MaterialQuantity, RevitMaterial
+from specklepy.transports.sqlite import SQLiteTransport
+
+
+def revit_model(element_count: int, parameter_count: int) -> Collection:
+    material = RevitMaterial(name="Concrete", materialCategory="Structure")
+    elements = []
+    for i in range(element_count):
+        parameters = Base()
+        for j in range(parameter_count):
+            parameters[f"PARAM_{j}"] = Base.of_type(
+                "Objects.BuiltElements.Revit.Parameter",
+                name=f"Parameter {j}",
+                value=i * 0.5 + j,
+                units="m",
+                isShared=j % 2 == 0,
+                isReadOnly=False,
+                applicationInternalName=f"PARAM_{j}",
+            )
+        wall = Base.of_type(
+            "Objects.BuiltElements.Revit.RevitWall",
+            family="Basic Wall",
+            type=f"Generic - {i % 20}mm",
+            height=3.0,
+            parameters=parameters,
+            elementId=str(100000 + i),
+            units="m",
+        )
+        wall.baseLine = Line(start=Point(x=i, y=0, z=0), end=Point(x=i, y=5, z=0))
+        wall.materialQuantities = [
+            MaterialQuantity(material=material, volume=1.5, area=15.0, units="m")
+        ]
+        wall["@displayValue"] = [
+            Mesh(
+                vertices=[float(i), 0.0, 0.0, float(i), 5.0, 0.0, float(i), 5.0, 3.0],
+                faces=[3, 0, 1, 2],
+                units="m",
+            )
+        ]
+        elements.append(wall)
+    return Collection(name="Revit model", collectionType="model", elements=elements)
+
+
+def time_receive(obj_id: str, transport: SQLiteTransport, strict: bool) -> float:
+    start = time.perf_counter()
+    operations.receive(obj_id, local_transport=transport, strict=strict)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    model = revit_model(2000, 40)
+    with tempfile.TemporaryDirectory() as base_path:
+        transport = SQLiteTransport(base_path=base_path)
+        obj_id = operations.send(model, [transport], False)
+        del model
+        for strict in (True, False):
+            timing = min(time_receive(obj_id, transport, strict) for _ in range(3))
+            print(f"{'strict' if strict else 'trusted'}: {timing:.2f}s")
+
+            profile = cProfile.Profile()
+            profile.runcall(
+                operations.receive, obj_id, local_transport=transport, strict=strict
+            )
+            stats = pstats.Stats(profile).sort_stats("tottime")
+            stats.print_stats(5)
+        transport.close()
@@ -0,0 +1,42 @@
+"""
+Time to construct a million type checked points, and to deserialize a model of a
+hundred thousand elements with and without type checking the received values.
+
+Run from the repository root with `python -m benchmarks.type_check`.
+"""
+
+import time
+
+from specklepy.core.api import operations
+from specklepy.objects import Base
+from specklepy.objects.geometry import Line, Point
+from specklepy.objects.other import Collection
+
+
+def points(count: int) -> None:
+    for i in range(count):
+        Point(x=i, y=2.5, z=0, units="m")
+
+
+def line_model(count: int) -> Collection:
+    elements = []
+    for i in range(count):
+        element = Base(name=f"element {i}", level=i % 10)
+        element.line = Line(start=Point(x=i, y=0, z=0), end=Point(x=i, y=1, z=0))
+        elements.append(element)
+    return Collection(name="lines", collectionType="model", elements=elements)
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    points(1_000_000)
+    print(f"1M points: {time.perf_counter() - start:.2f}s")
+
+    serialized = operations.serialize(line_model(100_000))
+    for strict in (True, False):
+        start = time.perf_counter()
+        operations.deserialize(serialized, strict=strict)
+        print(
+            f"deserialize 100k elements (strict={strict}):"
+            f" {time.perf_counter() - start:.2f}s"
+        )
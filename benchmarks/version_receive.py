@@ -0,0 +1,51 @@
+"""
+Time to receive five consecutive versions of a model, which share 95% of their
+objects, with and without the process wide object cache.
+
+Run from the repository root with `python -m benchmarks.version_receive`.
+"""
+
+import tempfile
+import time
+from typing import List
+
+from benchmarks.projection_receive import team_model
+from specklepy.core.api import operations
+from specklepy.objects import Base
+from specklepy.serialization.object_cache import RECEIVED_OBJECTS
+from specklepy.transports.sqlite import SQLiteTransport
+
+
+def versions(count: int, element_count: int, changed: float) -> List[Base]:
+    model = team_model(element_count, 300)
+    elements = list(model.elements)
+    changes = int(element_count * changed)
+    models = []
+    for v in range(count):
+        for i in range(v * changes, (v + 1) * changes):
+            elements[i % element_count] = Base(name=f"element {i} v{v}", level=v)
+        version = Base(name=f"version {v}")
+        version["@elements"] = list(elements)
+        models.append(version)
+    return models
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as base_path:
+        transport = SQLiteTransport(base_path=base_path)
+        ids = [
+            operations.send(model, [transport], False)
+            for model in versions(5, 2000, 0.05)
+        ]
+        for cache_objects in (False, True):
+            RECEIVED_OBJECTS.clear()
+            timings = []
+            for obj_id in ids:
+                start = time.perf_counter()
+                operations.receive(
+                    obj_id, local_transport=transport, cache_objects=cache_objects
+                )
+                timings.append(f"{time.perf_counter() - start:.2f}s")
+            print(f"cache_objects={cache_objects}: {', '.join(timings)}")
+        print(RECEIVED_OBJECTS.stats())
+        transport.close()
@@ -1,5 +1,8 @@
 # This file is used to extract data from a specific model
 
+import inspect
+import json
+
 import streamlit as st
 
 from specklepy.objects.base import Base
@@ -16,13 +19,38 @@ import attribute_extraction
 
 from dashboards.dashboard import setup_speckle_connection
 
-def get_geometry_data(selected_version, client, project, verbose=True):
+# receive only takes include in the specklepy of this repository, not in the one from PyPI
+RECEIVE_SUPPORTS_INCLUDE = 'include' in inspect.signature(operations.receive).parameters
+
+
+# The paths to every member of the @Data object of a model, which holds all the data extract looks at.
+# None when the whole model needs receiving
+def get_data_include(transport, objHash):
+    if not RECEIVE_SUPPORTS_INCLUDE:
+        return None
+    root = transport.get_objects([objHash]).get(objHash)
+    data = json.loads(root).get('@Data') if root else None
+    if isinstance(data, dict) and 'referencedId' in data:
+        data = transport.get_objects([data['referencedId']]).get(data['referencedId'])
+        data = json.loads(data) if data else None
+    # members with a dot in their name can't be given as a path
+    if not isinstance(data, dict) or any('.' in name for name in data):
+        return None
+    return ['@Data.' + name for name in data]
+
+
+# data_only limits the received data to the @Data object of the model, when specklepy supports it
+def get_geometry_data(selected_version, client, project, verbose=True, data_only=False):
     objHash = selected_version.referencedObject
     # if verbose:
         # print(f'objHash: {objHash}')
         # print(f'Starting to receive data...\n')
     transport = ServerTransport(client=client, stream_id=project.id)
-    base = operations.receive(objHash, transport)
+    include = get_data_include(transport, objHash) if data_only else None
+    if include is None:
+        base = operations.receive(objHash, transport)
+    else:
+        base = operations.receive(objHash, transport, include=include)
     # if verbose:
         # print(f'Data received.\n')
     return base
@@ -154,9 +182,10 @@ def extract(data, model_name, verbose=True, attribute_display=True, container=No
         # f'latest_version, createdAt: {latest_version.createdAt.strftime("%Y-%m-%d %H:%M:%S")}')
         # # print(f'latest_version, authorUser: {latest_version.authorUser.name}')
 
+        # Only receive the @Data object the attributes are searched in, not the whole model
         with st.spinner(f'Receiving data from {model_name}'):
             base_data = get_geometry_data(
-                latest_version, client, project, verbose=verbose)
+                latest_version, client, project, verbose=verbose, data_only=True)
 
         nested_index = 0
         while '@Data' in dir(base_data):
@@ -4,6 +4,7 @@ import streamlit as st
 #specklepy libraries
 from specklepy.api.client import SpeckleClient
 from specklepy.api.credentials import get_account_from_token
+from specklepy.api import operations
 import numpy as np
 from dashboards.dashboard import *
 
@@ -57,6 +58,23 @@ def run_slack_process():
 
 # run_slack_process() # Commented out to avoid running the process at startup
 
+@st.cache_resource
+def setup_object_cache():
+    # Keep recently received objects in memory, in front of the local SQLite cache,
+    # for every receive of this process (eg: data_extractor.get_geometry_data)
+    try:
+        # Only in the specklepy of this repository, not in the one from PyPI
+        from specklepy.transports.memory import MemoryTransport
+        from specklepy.transports.sqlite import SQLiteTransport
+        from specklepy.transports.tiered import TieredTransport
+    except ImportError:
+        return None
+    cache = TieredTransport([MemoryTransport(max_size_mb=512), SQLiteTransport()])
+    operations.set_default_cache(cache)
+    return cache
+
+setup_object_cache()
+
 def display_federated_speckle_viewer(project_id, height):
     # Function to create a federated Speckle viewer
     # With multiple models
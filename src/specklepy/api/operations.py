@@ -1,9 +1,12 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from specklepy.core.api.operations import deserialize as core_deserialize
+from specklepy.core.api.operations import get_default_cache as core_get_default_cache
 from specklepy.core.api.operations import receive as _untracked_receive
 from specklepy.core.api.operations import send as core_send
 from specklepy.core.api.operations import serialize as core_serialize
+from specklepy.core.api.operations import serialize_iter as core_serialize_iter
+from specklepy.core.api.operations import set_default_cache as core_set_default_cache
 from specklepy.logging import metrics
 from specklepy.objects.base import Base
 from specklepy.transports.abstract_transport import AbstractTransport
@@ -13,14 +16,23 @@ def send(
     base: Base,
     transports: Optional[List[AbstractTransport]] = None,
     use_default_cache: bool = True,
+    cache_subtrees: bool = False,
+    workers: int = 1,
 ):
     """Sends an object via the provided transports. Defaults to the local cache.
 
     Arguments:
         obj {Base} -- the object you want to send
         transports {list} -- where you want to send them
-        use_default_cache {bool} -- toggle for the default cache.
+        use_default_cache {bool} -- toggle for the default cache, see
+        `set_default_cache`.
         If set to false, it will only send to the provided transports
+        cache_subtrees {bool} -- if True, objects that haven't been modified since
+        they were last sent to these transports aren't serialized and sent again.
+        Lists and dicts mutated in place aren't tracked, see `Base.mark_dirty`
+        workers {int} -- if more than 1, the detached children of the object
+        (eg: the `@elements` of a model) are serialized in parallel by this many
+        worker processes. The ids are the same as when serializing on one process
 
     Returns:
         str -- the object id of the sent object
@@ -30,13 +42,17 @@ def send(
     else:
         metrics.track(metrics.SEND, getattr(transports[0], "account", None))
 
-    return core_send(base, transports, use_default_cache)
+    return core_send(base, transports, use_default_cache, cache_subtrees, workers)
 
 
 def receive(
     obj_id: str,
     remote_transport: Optional[AbstractTransport] = None,
     local_transport: Optional[AbstractTransport] = None,
+    lazy: bool = False,
+    include: Optional[List[str]] = None,
+    strict: bool = False,
+    cache_objects: bool = False,
 ) -> Base:
     """Receives an object from a transport.
 
@@ -44,13 +60,38 @@ def receive(
         obj_id {str} -- the id of the object to receive
         remote_transport {Transport} -- the transport to receive from
         local_transport {Transport} -- the local cache to check for existing objects
-                                       (defaults to `SQLiteTransport`)
+                                       (defaults to `get_default_cache()`)
+        lazy {bool} -- if True, referenced child objects are only recomposed once
+                       any of their attributes are accessed. Until then, `type()`
+                       gives a proxy class for them, so use `isinstance` instead
+        include {List[str]} -- optional: only receive these members, given as
+                       dotted paths from the object (eg: `@Data.Area`) or as
+                       names found at any depth. Children which can't lead to
+                       them aren't read. The children read from the remote
+                       transport are kept in the local one, but not the object
+                       itself, as the local transport doesn't get all of them
+        strict {bool} -- if True, the attributes of received objects are type
+                       checked as they are set. Otherwise the received data is
+                       trusted
+        cache_objects {bool} -- if True, received objects are kept in a process
+                       wide cache (`object_cache.RECEIVED_OBJECTS`), and the
+                       objects already in it aren't read or recomposed again.
+                       The objects are shared between receives, so they must not
+                       be modified. Not used with `lazy` or `include`
 
     Returns:
         Base -- the base object
     """
     metrics.track(metrics.RECEIVE, getattr(remote_transport, "account", None))
-    return _untracked_receive(obj_id, remote_transport, local_transport)
+    return _untracked_receive(
+        obj_id,
+        remote_transport,
+        local_transport,
+        lazy,
+        include,
+        strict,
+        cache_objects,
+    )
 
 
 def serialize(base: Base, write_transports: List[AbstractTransport] = []) -> str:
@@ -71,8 +112,33 @@ def serialize(base: Base, write_transports: List[AbstractTransport] = []) -> str
     return core_serialize(base, write_transports)
 
 
+def serialize_iter(
+    base: Base, write_transports: Optional[List[AbstractTransport]] = None
+) -> Iterator[Tuple[str, str]]:
+    """
+    Serialize a base object one detached object at a time. Each object is handed
+    out as soon as it is complete, so they don't all need to be held in memory.
+    Only their ids are kept until the end, for the closure of the base object.
+    Children come before the objects referencing them, and the base object itself
+    comes last. Equal objects, like equal chunks of data, can turn up more than once.
+
+    Arguments:
+        base {Base} -- the object to serialize
+        write_transports {List[AbstractTransport]}
+        -- optional: transports to also write the objects to
+
+    Yields:
+        (str, str) -- the id and the serialized string of each object
+    """
+    metrics.track(metrics.SDK, custom_props={"name": "Serialize"})
+    return core_serialize_iter(base, write_transports)
+
+
 def deserialize(
-    obj_string: str, read_transport: Optional[AbstractTransport] = None
+    obj_string: str,
+    read_transport: Optional[AbstractTransport] = None,
+    lazy: bool = False,
+    strict: bool = False,
 ) -> Base:
     """
     Deserialize a string object into a Base object.
@@ -85,13 +151,46 @@ def deserialize(
         obj_string {str} -- the string object to deserialize
         read_transport {AbstractTransport}
             -- the transport to fetch children objects from
-                (defaults to SQLiteTransport)
+                (defaults to `get_default_cache()`)
+        lazy {bool} -- if True, referenced child objects are only recomposed once
+                       any of their attributes are accessed. Until then, `type()`
+                       gives a proxy class for them, so use `isinstance` instead
+        strict {bool} -- if True, the attributes of received objects are type
+                       checked as they are set. Otherwise the received data is
+                       trusted
 
     Returns:
         Base -- the deserialized object
     """
     metrics.track(metrics.SDK, custom_props={"name": "Deserialize"})
-    return core_deserialize(obj_string, read_transport)
+    return core_deserialize(obj_string, read_transport, lazy, strict)
+
+
+def set_default_cache(transport: Optional[AbstractTransport]) -> None:
+    """
+    Sets the local cache which send, receive and deserialize use when they aren't
+    given one, eg: a `TieredTransport` keeping recently received objects in memory
+    for a long running process. The same transport is used by every call, from
+    every thread.
+
+    Arguments:
+        transport {AbstractTransport} -- the cache, or None to go back to a new
+        `SQLiteTransport` for every call
+    """
+    core_set_default_cache(transport)
+
+
+def get_default_cache() -> AbstractTransport:
+    """Gets the local cache set with `set_default_cache`, or a new SQLiteTransport"""
+    return core_get_default_cache()
 
 
-__all__ = ["receive", "send", "serialize", "deserialize"]
+__all__ = [
+    "receive",
+    "send",
+    "serialize",
+    "serialize_iter",
+    "deserialize",
+    "get_default_cache",
+    "set_default_cache",
+]
@@ -1,25 +1,62 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 # from specklepy.logging import metrics
 from specklepy.logging.exceptions import SpeckleException
 from specklepy.objects.base import Base
-from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.serialization.base_object_serializer import (
+    BaseObjectSerializer,
+    safe_json_loads,
+)
+from specklepy.serialization.object_cache import RECEIVED_OBJECTS
 from specklepy.transports.abstract_transport import AbstractTransport
 from specklepy.transports.sqlite import SQLiteTransport
+from specklepy.transports.tiered import TieredTransport
+
+# the local cache used when none is given, or None for a new SQLiteTransport each time
+_default_cache: Optional[AbstractTransport] = None
+
+
+def set_default_cache(transport: Optional[AbstractTransport]) -> None:
+    """
+    Sets the local cache which send, receive and deserialize use when they aren't
+    given one, eg: a `TieredTransport` keeping recently received objects in memory
+    for a long running process. The same transport is used by every call, from
+    every thread.
+
+    Arguments:
+        transport {AbstractTransport} -- the cache, or None to go back to a new
+        `SQLiteTransport` for every call
+    """
+    global _default_cache
+    _default_cache = transport
+
+
+def get_default_cache() -> AbstractTransport:
+    """Gets the local cache set with `set_default_cache`, or a new SQLiteTransport"""
+    return _default_cache if _default_cache is not None else SQLiteTransport()
 
 
 def send(
     base: Base,
     transports: Optional[List[AbstractTransport]] = None,
     use_default_cache: bool = True,
+    cache_subtrees: bool = False,
+    workers: int = 1,
 ):
     """Sends an object via the provided transports. Defaults to the local cache.
 
     Arguments:
         obj {Base} -- the object you want to send
         transports {list} -- where you want to send them
-        use_default_cache {bool} -- toggle for the default cache.
+        use_default_cache {bool} -- toggle for the default cache, see
+        `set_default_cache`.
         If set to false, it will only send to the provided transports
+        cache_subtrees {bool} -- if True, objects that haven't been modified since
+        they were last sent to these transports aren't serialized and sent again.
+        Lists and dicts mutated in place aren't tracked, see `Base.mark_dirty`
+        workers {int} -- if more than 1, the detached children of the object
+        (eg: the `@elements` of a model) are serialized in parallel by this many
+        worker processes. The ids are the same as when serializing on one process
 
     Returns:
         str -- the object id of the sent object
@@ -40,9 +77,11 @@ def send(
         transports = []
 
     if use_default_cache:
-        transports.insert(0, SQLiteTransport())
+        transports.insert(0, get_default_cache())
 
-    serializer = BaseObjectSerializer(write_transports=transports)
+    serializer = BaseObjectSerializer(
+        write_transports=transports, cache_subtrees=cache_subtrees, workers=workers
+    )
 
     obj_hash, _ = serializer.write_json(base=base)
 
@@ -53,6 +92,10 @@ def receive(
     obj_id: str,
     remote_transport: Optional[AbstractTransport] = None,
     local_transport: Optional[AbstractTransport] = None,
+    lazy: bool = False,
+    include: Optional[List[str]] = None,
+    strict: bool = False,
+    cache_objects: bool = False,
 ) -> Base:
     """Receives an object from a transport.
 
@@ -60,22 +103,63 @@ def receive(
         obj_id {str} -- the id of the object to receive
         remote_transport {Transport} -- the transport to receive from
         local_transport {Transport} -- the local cache to check for existing objects
-                                       (defaults to `SQLiteTransport`)
+                                       (defaults to `get_default_cache()`)
+        lazy {bool} -- if True, referenced child objects are only recomposed once
+                       any of their attributes are accessed. Until then, `type()`
+                       gives a proxy class for them, so use `isinstance` instead
+        include {List[str]} -- optional: only receive these members, given as
+                       dotted paths from the object (eg: `@Data.Area`) or as
+                       names found at any depth. Children which can't lead to
+                       them aren't read. The children read from the remote
+                       transport are kept in the local one, but not the object
+                       itself, as the local transport doesn't get all of them
+        strict {bool} -- if True, the attributes of received objects are type
+                       checked as they are set. Otherwise the received data is
+                       trusted
+        cache_objects {bool} -- if True, received objects are kept in a process
+                       wide cache (`object_cache.RECEIVED_OBJECTS`), and the
+                       objects already in it aren't read or recomposed again.
+                       The objects are shared between receives, so they must not
+                       be modified. Not used with `lazy` or `include`
 
     Returns:
         Base -- the base object
     """
+    object_cache = RECEIVED_OBJECTS if cache_objects else None
+    if (
+        object_cache is not None
+        and not lazy
+        and include is None
+        and obj_id in object_cache
+    ):
+        cached = object_cache.get(obj_id)
+        if cached is not None:
+            return cached
+
     if not local_transport:
-        local_transport = SQLiteTransport()
+        local_transport = get_default_cache()
 
-    serializer = BaseObjectSerializer(read_transport=local_transport)
+    serializer = BaseObjectSerializer(
+        read_transport=local_transport,
+        lazy=lazy,
+        strict=strict,
+        object_cache=object_cache,
+    )
 
     # try local transport first. if the parent is there, we assume all the children are there and continue with deserialization using the local transport
     obj_string = local_transport.get_object(obj_id)
-    if obj_string:
-        return serializer.read_json(obj_string=obj_string)
+    if obj_string and _has_children(obj_string, local_transport):
+        return serializer.read_json(obj_string=obj_string, include=include)
 
     if not remote_transport:
+        if obj_string:
+            raise SpeckleException(
+                message=(
+                    "Some children of the specified object were evicted from the local"
+                    " transport, and you didn't provide a fallback remote from which to"
+                    " pull them."
+                )
+            )
         raise SpeckleException(
             message=(
                 "Could not find the specified object using the local transport, and you"
@@ -83,6 +167,19 @@ def receive(
             )
         )
 
+    if include is not None:
+        # read only the needed children in bulk, through the local transport
+        serializer = BaseObjectSerializer(
+            read_transport=TieredTransport([local_transport, remote_transport]),
+            strict=strict,
+        )
+        obj_string = remote_transport.get_objects([obj_id]).get(obj_id)
+        if not obj_string:
+            raise SpeckleException(
+                message=f"Could not find the object {obj_id} using the remote transport"
+            )
+        return serializer.read_json(obj_string=obj_string, include=include)
+
     obj_string = remote_transport.copy_object_and_children(
         id=obj_id, target_transport=local_transport
     )
@@ -90,6 +187,15 @@ def receive(
     return serializer.read_json(obj_string=obj_string)
 
 
+def _has_children(obj_string: str, transport: AbstractTransport) -> bool:
+    """Checks that the children of an object found in a transport are there too,
+    which only needs checking when the transport can evict objects"""
+    if not transport.evicts:
+        return True
+    children = list(safe_json_loads(obj_string).get("__closure", {}))
+    return not children or all(transport.has_objects(children).values())
+
+
 def serialize(base: Base, write_transports: List[AbstractTransport] = []) -> str:
     """
     Serialize a base object. If no write transports are provided,
@@ -109,8 +215,34 @@ def serialize(base: Base, write_transports: List[AbstractTransport] = []) -> str
     return serializer.write_json(base)[1]
 
 
+def serialize_iter(
+    base: Base, write_transports: Optional[List[AbstractTransport]] = None
+) -> Iterator[Tuple[str, str]]:
+    """
+    Serialize a base object one detached object at a time. Each object is handed
+    out as soon as it is complete, so they don't all need to be held in memory.
+    Only their ids are kept until the end, for the closure of the base object.
+    Children come before the objects referencing them, and the base object itself
+    comes last. Equal objects, like equal chunks of data, can turn up more than once.
+
+    Arguments:
+        base {Base} -- the object to serialize
+        write_transports {List[AbstractTransport]}
+        -- optional: transports to also write the objects to
+
+    Yields:
+        (str, str) -- the id and the serialized string of each object
+    """
+    serializer = BaseObjectSerializer(write_transports=write_transports)
+
+    yield from serializer.iter_json(base)
+
+
 def deserialize(
-    obj_string: str, read_transport: Optional[AbstractTransport] = None
+    obj_string: str,
+    read_transport: Optional[AbstractTransport] = None,
+    lazy: bool = False,
+    strict: bool = False,
 ) -> Base:
     """
     Deserialize a string object into a Base object.
@@ -123,17 +255,33 @@ def deserialize(
         obj_string {str} -- the string object to deserialize
         read_transport {AbstractTransport}
             -- the transport to fetch children objects from
-                (defaults to SQLiteTransport)
+                (defaults to `get_default_cache()`)
+        lazy {bool} -- if True, referenced child objects are only recomposed once
+                       any of their attributes are accessed. Until then, `type()`
+                       gives a proxy class for them, so use `isinstance` instead
+        strict {bool} -- if True, the attributes of received objects are type
+                       checked as they are set. Otherwise the received data is
+                       trusted
 
     Returns:
         Base -- the deserialized object
     """
     if not read_transport:
-        read_transport = SQLiteTransport()
+        read_transport = get_default_cache()
 
-    serializer = BaseObjectSerializer(read_transport=read_transport)
+    serializer = BaseObjectSerializer(
+        read_transport=read_transport, lazy=lazy, strict=strict
+    )
 
     return serializer.read_json(obj_string=obj_string)
 
 
-__all__ = ["receive", "send", "serialize", "deserialize"]
+__all__ = [
+    "receive",
+    "send",
+    "serialize",
+    "serialize_iter",
+    "deserialize",
+    "get_default_cache",
+    "set_default_cache",
+]
@@ -3,7 +3,7 @@ from typing import Any, List, Optional
 
 class SpeckleException(Exception):
     def __init__(self, message: str, exception: Exception = None) -> None:
-        super().__init__()
+        super().__init__(message, exception)
         self.message = message
         self.exception = exception
 
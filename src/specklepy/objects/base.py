@@ -1,11 +1,14 @@
 import contextlib
 from enum import Enum
-from inspect import isclass
+from inspect import getattr_static, isclass
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Dict,
     ForwardRef,
+    FrozenSet,
+    Iterable,
     List,
     Optional,
     Set,
@@ -15,6 +18,7 @@ from typing import (
     get_type_hints,
 )
 from warnings import warn
+from weakref import WeakKeyDictionary, WeakSet
 
 from stringcase import pascalcase
 
@@ -59,10 +63,8 @@ REMOVE_FROM_DIR = {
     "__weakref__",
     "_chunk_size_default",
     "_chunkable",
-    "_count_descendants",
     "_attr_types",
     "_detachable",
-    "_handle_object_count",
     "_type_check",
     "_type_registry",
     "_units",
@@ -74,6 +76,8 @@ REMOVE_FROM_DIR = {
     "get_member_names",
     "get_registered_type",
     "get_typed_member_names",
+    "mark_dirty",
+    "stats",
     "to_dict",
     "update_forward_refs",
     "validate_prop_name",
@@ -82,6 +86,65 @@ REMOVE_FROM_DIR = {
 }
 
 
+def _class_members(cls: type) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """
+    The member names a class gives all its instances, for `Base.get_member_names`.
+
+    Returns the names of the plain class attributes, and the names of the
+    descriptors (eg: properties) whose values can only be checked on an instance.
+    """
+    members = set()
+    descriptors = []
+    for name in dir(cls):
+        if name.startswith("_") or name in REMOVE_FROM_DIR:
+            continue
+        attr = getattr(cls, name, None)
+        if callable(attr):
+            continue
+        if hasattr(type(getattr_static(cls, name)), "__get__"):
+            descriptors.append(name)
+        else:
+            members.add(name)
+    return frozenset(members), tuple(descriptors)
+
+
+# the exact types of the items of lists which are sized in bulk
+_FLAT_TYPES = frozenset((int, float, str))
+
+
+def _primitive_size(value: Any) -> Optional[int]:
+    """The length of a serialized primitive value, or None for other values"""
+    if value is None or isinstance(value, bool):
+        return 5
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, (str, int, float)):
+        return len(repr(value))
+    return None
+
+
+class _SerializationCacheEntry:
+    """
+    The cached serialization results of an unmodified base object.
+
+    The results are managed by the `BaseObjectSerializer`. The entry also tracks the
+    objects which embed or reference the cached object, so that mutating it
+    invalidates everything its id contributes to.
+    """
+
+    __slots__ = ("results", "dependents")
+
+    def __init__(self) -> None:
+        self.results: Dict[Any, Any] = {}
+        self.dependents: "WeakSet[Base]" = WeakSet()
+
+
+# only populated when serializing with `cache_subtrees` enabled
+_SERIALIZATION_CACHE: "WeakKeyDictionary[Base, _SerializationCacheEntry]" = (
+    WeakKeyDictionary()
+)
+
+
 class _RegisteringBase:
     """
     Private Base model for Speckle types.
@@ -103,6 +166,8 @@ class _RegisteringBase:
     _chunk_size_default: int = 1000
     _detachable: Set[str] = set()  # list of defined detachable props
     _serialize_ignore: Set[str] = set()
+    _class_members: ClassVar[Tuple[FrozenSet[str], Tuple[str, ...]]]
+    _validators: ClassVar[Dict[str, "Validator"]] = {}
 
     @classmethod
     def get_registered_type(cls, speckle_type: str) -> Optional[Type["Base"]]:
@@ -181,6 +246,9 @@ class _RegisteringBase:
             cls._attr_types = get_type_hints(cls)
         except Exception:
             cls._attr_types = getattr(cls, "__annotations__", {})
+        cls._validators = {
+            name: _compile_validator(t) for name, t in cls._attr_types.items()
+        }
         if chunkable:
             chunkable = {k: v for k, v in chunkable.items() if isinstance(v, int)}
             cls._chunkable = dict(cls._chunkable, **chunkable)
@@ -188,6 +256,7 @@ class _RegisteringBase:
             cls._detachable = cls._detachable.union(detachable)
         if serialize_ignore:
             cls._serialize_ignore = cls._serialize_ignore.union(serialize_ignore)
+        cls._class_members = _class_members(cls)
         # we know, that the super here is object, that takes no args on init subclass
         return super().__init_subclass__()
 
@@ -319,6 +388,209 @@ def _validate_type(t: Optional[type], value: Any) -> Tuple[bool, Any]:
     return False, value
 
 
+Validator = Callable[[Any], Tuple[bool, Any]]
+
+
+def _valid(value: Any) -> Tuple[bool, Any]:
+    return True, value
+
+
+def _is_point_array(value: Any) -> bool:
+    """Whether the value is a `PointArray`, which stands in for a list of points"""
+    # imported here, as the geometry module depends on this one
+    from specklepy.objects.geometry import PointArray
+
+    return isinstance(value, PointArray)
+
+
+def _compile_validator(t: Optional[type]) -> Validator:
+    """
+    Compiles the checks `_validate_type` makes for the given type into a function of
+    the value alone, so the type only gets inspected once.
+
+    Types without a compiled equivalent are checked with `_validate_type`.
+    """
+    if t is None or t is Any or isinstance(t, ForwardRef):
+        return _valid
+
+    is_typing = getattr(t, "__module__", None) == "typing"
+    if isclass(t) and not is_typing and getattr(t, "__origin__", None) is None:
+        if issubclass(t, Enum):
+            members = t._value2member_map_
+
+            def validate_enum(value: Any) -> Tuple[bool, Any]:
+                if value is None or isinstance(value, t):
+                    return True, value
+                if value in members:
+                    return True, t(value)
+                return False, value
+
+            return validate_enum
+
+        if t is float:
+
+            def validate_float(value: Any) -> Tuple[bool, Any]:
+                if value is None or isinstance(value, float):
+                    return True, value
+                try:
+                    return True, float(value)
+                except (ValueError, TypeError):
+                    return False, value
+
+            return validate_float
+
+        if t is str:
+
+            def validate_str(value: Any) -> Tuple[bool, Any]:
+                if value is None or isinstance(value, str):
+                    return True, value
+                if not value or isinstance(value, list):
+                    return False, value
+                try:
+                    return True, str(value)
+                except (ValueError, TypeError):
+                    return False, value
+
+            return validate_str
+
+        def validate_instance(value: Any) -> Tuple[bool, Any]:
+            return value is None or isinstance(value, t), value
+
+        return validate_instance
+
+    if is_typing:
+        origin = getattr(t, "__origin__", None)
+        args = getattr(t, "__args__", None)
+
+        if origin is Union:
+            validators = tuple(_compile_validator(arg) for arg in args)
+
+            def validate_union(value: Any) -> Tuple[bool, Any]:
+                if value is None:
+                    return True, value
+                for validate in validators:
+                    valid, checked_value = validate(value)
+                    if valid:
+                        return True, checked_value
+                return False, value
+
+            return validate_union
+
+        if origin is list:
+            validate_item = None
+            if args is not None and getattr(args[0], "__name__", None) != "T":
+                validate_item = _compile_validator(args[0])
+
+            def validate_list(value: Any) -> Tuple[bool, Any]:
+                if value is None:
+                    return True, value
+                if not isinstance(value, list) and not _is_point_array(value):
+                    return False, value
+                if not value or validate_item is None:
+                    return True, value
+                return validate_item(value[0])[0], value
+
+            return validate_list
+
+        if origin is dict:
+            validate_key = validate_value = None
+            if args and tuple(getattr(arg, "__name__", None) for arg in args) != (
+                "KT",
+                "VT",
+            ):
+                validate_key, validate_value = map(_compile_validator, args)
+
+            def validate_dict(value: Any) -> Tuple[bool, Any]:
+                if value is None:
+                    return True, value
+                if not isinstance(value, dict):
+                    return False, value
+                if not value or validate_key is None:
+                    return True, value
+                # only the first item is checked
+                dict_key, dict_value = next(iter(value.items()))
+                valid = validate_key(dict_key)[0] and validate_value(dict_value)[0]
+                return valid, value
+
+            return validate_dict
+
+    return lambda value: _validate_type(t, value)
+
+
+def _coerce_float(value: Any) -> Any:
+    if value is None or isinstance(value, float):
+        return value
+    with contextlib.suppress(ValueError, TypeError):
+        return float(value)
+    return value
+
+
+def _coerce_str(value: Any) -> Any:
+    if not value or isinstance(value, (str, list)):
+        return value
+    with contextlib.suppress(ValueError, TypeError):
+        return str(value)
+    return value
+
+
+def _enum_coercer(t: Type[Enum]) -> Callable[[Any], Any]:
+    def coerce(value: Any) -> Any:
+        if isinstance(value, t) or value not in t._value2member_map_:
+            return value
+        return t(value)
+
+    return coerce
+
+
+def _trusted_coercer(t: Optional[type]) -> Optional[Callable[[Any], Any]]:
+    """
+    The conversion `_validate_type` applies to valid values of the given type, or
+    None if valid values are kept as they are.
+    """
+    if t is None or t is Any or isinstance(t, ForwardRef):
+        return None
+    if isclass(t) and issubclass(t, Enum):
+        return _enum_coercer(t)
+    if getattr(t, "__module__", None) == "typing":
+        origin = getattr(t, "__origin__", None)
+        if origin in (list, dict, set, ClassVar):
+            return None
+        if origin is Union:
+            args = [arg for arg in t.__args__ if arg is not type(None)]
+            coercers = [_trusted_coercer(arg) for arg in args]
+            if len(args) == 1 or not any(coercers):
+                return coercers[0]
+        validate = _compile_validator(t)
+        return lambda value: validate(value)[1]
+    if t is float:
+        return _coerce_float
+    if t is str:
+        return _coerce_str
+    return None
+
+
+_TrustedPlan = Tuple[Dict[str, Callable[[Any], Any]], Dict[str, property]]
+_TRUSTED_PLANS: Dict[type, _TrustedPlan] = {}
+
+
+def _trusted_plan(cls: type) -> _TrustedPlan:
+    """The value coercers and the properties of a class, for `Base._set_trusted`"""
+    plan = _TRUSTED_PLANS.get(cls)
+    if plan is None:
+        coercers = {}
+        for name, t in getattr(cls, "_attr_types", {}).items():
+            coerce = _trusted_coercer(t)
+            if coerce:
+                coercers[name] = coerce
+        properties = {}
+        for name in dir(cls):
+            attr = getattr(cls, name, None)
+            if isinstance(attr, property):
+                properties[name] = attr
+        plan = _TRUSTED_PLANS[cls] = (coercers, properties)
+    return plan
+
+
 class Base(_RegisteringBase):
     id: Union[str, None] = None
     totalChildrenCount: Union[int, None] = None
@@ -360,6 +632,8 @@ class Base(_RegisteringBase):
     def __setitem__(self, name: str, value: Any) -> None:
         self.validate_prop_name(name)
         self.__dict__[name] = value
+        if _SERIALIZATION_CACHE:
+            self.mark_dirty()
 
     def __getitem__(self, name: str) -> Any:
         return self.__dict__[name]
@@ -387,6 +661,13 @@ class Base(_RegisteringBase):
             except AttributeError:
                 return  # the prop probably doesn't have a setter
         super().__setattr__(name, value)
+        if _SERIALIZATION_CACHE:
+            self.mark_dirty()
+
+    def __delattr__(self, name: str) -> None:
+        super().__delattr__(name)
+        if _SERIALIZATION_CACHE:
+            self.mark_dirty()
 
     @classmethod
     def update_forward_refs(cls) -> None:
@@ -404,6 +685,10 @@ class Base(_RegisteringBase):
             cls._attr_types = get_type_hints(cls)
         except Exception as e:
             warn(f"Could not update forward refs for class {cls.__name__}: {e}")
+        cls._validators = {
+            name: _compile_validator(t) for name, t in cls._attr_types.items()
+        }
+        _TRUSTED_PLANS.pop(cls, None)
 
     @classmethod
     def validate_prop_name(cls, name: str) -> None:
@@ -428,20 +713,40 @@ class Base(_RegisteringBase):
         Eg if you have a type Dict[str, float],
         we will only check if the value you're trying to set is a dict.
         """
-        types = getattr(self, "_attr_types", {})
-        t = types.get(name, None)
+        validate = self._validators.get(name)
+        if validate is None:
+            return value
 
-        valid, checked_value = _validate_type(t, value)
+        valid, checked_value = validate(value)
 
         if valid:
             return checked_value
 
         raise SpeckleException(
             f"Cannot set '{self.__class__.__name__}.{name}':"
-            f"it expects type '{str(t)}',"
+            f"it expects type '{str(self._attr_types.get(name))}',"
             f"but received type '{type(value).__name__}'"
         )
 
+    def _set_trusted(self, name: str, value: Any) -> None:
+        """
+        Sets an attribute from trusted data, like deserialized objects, without
+        type checking it. Values get the same conversions as when type checked, and
+        property setters still run.
+        """
+        if name == "speckle_type":
+            return
+        coercers, properties = _trusted_plan(self.__class__)
+        coerce = coercers.get(name)
+        if coerce:
+            value = coerce(value)
+        prop = properties.get(name)
+        if prop is None:
+            self.__dict__[name] = value
+            return
+        with contextlib.suppress(AttributeError):
+            prop.__set__(self, value)
+
     def add_chunkable_attrs(self, **kwargs: int) -> None:
         """
         Mark defined attributes as chunkable for serialisation
@@ -478,18 +783,42 @@ class Base(_RegisteringBase):
                 f"Unknown type {type(value)} received for units"
             )
 
+    def mark_dirty(self) -> None:
+        """
+        Drop the cached serialization of this object and of all objects containing it.
+
+        Setting, or deleting, attributes marks an object as dirty automatically.
+        This only needs to be called after mutating a list or a dict member in place,
+        when serializing with `cache_subtrees` enabled.
+        """
+        stack = [self]
+        while stack:
+            entry = _SERIALIZATION_CACHE.pop(stack.pop(), None)
+            if entry is not None:
+                stack.extend(entry.dependents)
+
     def get_member_names(self) -> List[str]:
         """Get all of the property names on this object, dynamic or not"""
-        attr_dir = list(set(dir(self)) - REMOVE_FROM_DIR)
-        return [
-            name
-            for name in attr_dir
-            if not name.startswith("_") and not callable(getattr(self, name))
-        ]
+        members, descriptors = self._class_members
+        names = set(members)
+        for name, value in self.__dict__.items():
+            if name.startswith("_") or name in REMOVE_FROM_DIR or name in descriptors:
+                continue
+            if callable(value):
+                names.discard(name)
+            else:
+                names.add(name)
+        for name in descriptors:
+            if not callable(getattr(self, name)):
+                names.add(name)
+        return sorted(names)
 
     def get_serializable_attributes(self) -> List[str]:
         """Get the attributes that should be serialized"""
-        return sorted(list(set(self.get_member_names()) - self._serialize_ignore))
+        ignore = self._serialize_ignore
+        if not ignore:
+            return self.get_member_names()
+        return [name for name in self.get_member_names() if name not in ignore]
 
     def get_typed_member_names(self) -> List[str]:
         """Get all of the names of the defined (typed) properties of this object"""
@@ -501,10 +830,79 @@ class Base(_RegisteringBase):
 
     def get_children_count(self) -> int:
         """Get the total count of children Base objects"""
-        parsed = []
-        return 1 + self._count_descendants(self, parsed)
+        return 1 + self.stats()["descendants"]
 
-    def get_id(self, decompose: bool = False) -> str:
+    def stats(self) -> Dict[str, Any]:
+        """
+        Gets statistics of the tree of objects under this object, in one pass and
+        without serializing it. Objects referenced more than once are counted once,
+        but distinct objects which are equal are counted each, while sending
+        stores them once.
+
+        Returns:
+            dict -- `descendants`: the number of Base objects under this one,
+            `speckle_types`: the number of objects of each speckle_type, this one
+            included, `max_depth`: how deeply the objects are nested, 0 without any
+            children, and `estimated_size`: roughly how many bytes the objects
+            take once serialized
+        """
+        seen = {id(self)}
+        speckle_types: Dict[str, int] = {}
+        max_depth = 0
+        size = 0
+        stack: List[Tuple[Any, int, bool]] = [(self, 0, False)]
+        while stack:
+            value, depth, detached = stack.pop()
+            if isinstance(value, Base):
+                max_depth = max(max_depth, depth)
+                speckle_type = value.speckle_type
+                speckle_types[speckle_type] = speckle_types.get(speckle_type, 0) + 1
+                # the id, and for detached objects their reference and their
+                # entries in the closure tables of the objects above them
+                size += 40
+                if detached:
+                    size += 60 + 37 * depth
+                detachable = value._detachable.union(value._chunkable)
+                items = (
+                    (name, getattr(value, name, None))
+                    for name in value.get_serializable_attributes()
+                    if not name.startswith("_") and name != "id"
+                )
+                depth += 1
+            elif isinstance(value, dict):
+                items = value.items()
+            elif isinstance(value, (list, tuple)) and _FLAT_TYPES.issuperset(
+                map(type, value)
+            ):
+                size += 2 + len(value) + sum(map(len, map(repr, value)))
+                continue
+            else:
+                items = ((None, item) for item in value)
+            size += 2
+            for name, item in items:
+                if name is not None:
+                    size += len(str(name)) + 4
+                    if isinstance(value, Base):
+                        detached = name.startswith("@") or name in detachable
+                else:
+                    size += 1
+                item_size = _primitive_size(item)
+                if item_size is not None:
+                    size += item_size
+                elif isinstance(item, Base):
+                    if id(item) not in seen:
+                        seen.add(id(item))
+                        stack.append((item, depth, detached))
+                elif isinstance(item, (dict, Iterable)):
+                    stack.append((item, depth, detached))
+        return {
+            "descendants": len(seen) - 1,
+            "speckle_types": speckle_types,
+            "max_depth": max_depth,
+            "estimated_size": size,
+        }
+
+    def get_id(self, decompose: bool = False, cache_subtrees: bool = False) -> str:
         """
         Gets the id (a unique hash) of this object.
         ⚠️ This method fully serializes the object which,
@@ -517,53 +915,19 @@ class Base(_RegisteringBase):
         Arguments:
             decompose {bool} -- if True, will decompose the object in
             the process of hashing it
+            cache_subtrees {bool} -- if True, reuses the ids of objects that haven't
+            been modified since they were last serialized (see `mark_dirty`)
 
         Returns:
             str -- the hash (id) of the fully serialized object
         """
         from specklepy.serialization.base_object_serializer import BaseObjectSerializer
 
-        serializer = BaseObjectSerializer()
+        serializer = BaseObjectSerializer(cache_subtrees=cache_subtrees)
         if decompose:
             serializer.write_transports = [MemoryTransport()]
         return serializer.traverse_base(self)[0]
 
-    def _count_descendants(self, base: "Base", parsed: List) -> int:
-        if base in parsed:
-            return 0
-        parsed.append(base)
-
-        return sum(
-            self._handle_object_count(value, parsed)
-            for name, value in base.get_member_names()
-            if not name.startswith("@")
-        )
-
-    def _handle_object_count(self, obj: Any, parsed: List) -> int:
-        # pylint: disable=isinstance-second-argument-not-valid-type
-        count = 0
-        if obj is None:
-            return count
-        if isinstance(obj, "Base"):
-            count += 1
-            count += self._count_descendants(obj, parsed)
-            return count
-        elif isinstance(obj, list):
-            for item in obj:
-                if isinstance(item, "Base"):
-                    count += 1
-                    count += self._count_descendants(item, parsed)
-                else:
-                    count += self._handle_object_count(item, parsed)
-        elif isinstance(obj, dict):
-            for _, value in obj.items():
-                if isinstance(value, "Base"):
-                    count += 1
-                    count += self._count_descendants(value, parsed)
-                else:
-                    count += self._handle_object_count(value, parsed)
-        return count
-
 
 Base.update_forward_refs()
 
@@ -1,11 +1,18 @@
-from typing import Any, List, Optional
+from copy import copy
+from typing import Any, List, Optional, Sequence
 
 from deprecated import deprecated
 
-from specklepy.objects.geometry import Plane, Point, Polyline, Vector
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.objects.geometry import Mesh, Plane, Point, Polyline, Vector
 
 from .base import Base
 
+try:
+    import numpy as np
+except ImportError:  # optional: points are transformed one by one without it
+    np = None
+
 OTHER = "Objects.Other."
 OTHER_REVIT = OTHER + "Revit."
 
@@ -185,7 +192,13 @@ class Transform(
         Returns:
             List[Point] -- a new list of transformed points
         """
-        return [self.apply_to_point(point) for point in points]
+        coords = self.apply_to_points_values(
+            [coord for point in points for coord in (point.x, point.y, point.z)]
+        )
+        return [
+            Point(x=coords[i], y=coords[i + 1], z=coords[i + 2], units=point.units)
+            for i, point in zip(range(0, len(coords), 3), points)
+        ]
 
     def apply_to_points_values(self, points_value: List[float]) -> List[float]:
         """Transform a list of speckle Points
@@ -202,12 +215,62 @@ class Transform(
                 "Cannot apply transform as the points list is malformed: expected"
                 " length to be multiple of 3"
             )
+        if np is not None:
+            return self.apply_to_points_array(points_value).ravel().tolist()
         transformed = []
         for i in range(0, len(points_value), 3):
             transformed.extend(self.apply_to_point_value(points_value[i : i + 3]))
 
         return transformed
 
+    def apply_to_points_array(self, points: Sequence[float]) -> "np.ndarray":
+        """Transform all the points of an array at once, with numpy
+
+        The results are the same as those of `apply_to_point_value` for each point.
+
+        Arguments:
+            points {np.ndarray} -- an (N, 3) array of points, or a flat array or
+            list of their coordinates
+
+        Returns:
+            np.ndarray -- a new (N, 3) array of the transformed points
+        """
+        if np is None:
+            raise SpeckleException(
+                "Transforming point arrays needs the `numpy` package to be installed"
+            )
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        x, y, z = points.T
+        m = self._value
+        # the same operations in the same order as for a single point
+        transformed = [
+            x * m[i] + y * m[i + 1] + z * m[i + 2] + m[i + 3] for i in range(0, 15, 4)
+        ]
+        if not transformed[3].all():
+            raise ZeroDivisionError("float division by zero")
+        return np.stack([transformed[i] / transformed[3] for i in range(3)], axis=1)
+
+    def apply_to_mesh(self, mesh: Mesh) -> Mesh:
+        """Transform all the vertices of a speckle Mesh
+
+        Arguments:
+            mesh {Mesh} -- the speckle Mesh to transform
+
+        Returns:
+            Mesh -- a copy of the mesh with its vertices transformed. Its faces,
+            colors and texture coordinates are copied too, while any other member
+            (eg: a render material) is shared with the mesh. Its bbox, area and
+            volume are cleared, as they may not hold after the transform
+        """
+        transformed = copy(mesh)
+        transformed.vertices = self.apply_to_points_values(mesh.vertices or [])
+        for name in ("faces", "colors", "textureCoordinates"):
+            values = getattr(mesh, name, None)
+            if values is not None:
+                setattr(transformed, name, list(values))
+        transformed.id = transformed.bbox = transformed.area = transformed.volume = None
+        return transformed
+
     def apply_to_vector(self, vector: Vector) -> Vector:
         """Transform a single speckle Vector
 
@@ -265,6 +328,21 @@ class Instance(Base, speckle_type=OTHER + "Instance", detachable={"definition"})
     transform: Optional[Transform] = None
     definition: Optional[Base] = None
 
+    def transform_mesh(self, mesh: Mesh) -> Mesh:
+        """
+        Places a mesh of the definition of this instance, by applying the transform
+        of the instance to all its vertices at once
+
+        Arguments:
+            mesh {Mesh} -- the speckle Mesh to place
+
+        Returns:
+            Mesh -- a copy of the mesh with its vertices transformed
+        """
+        if self.transform is None:
+            return Transform.from_list().apply_to_mesh(mesh)
+        return self.transform.apply_to_mesh(mesh)
+
 
 class BlockInstance(
     Instance, speckle_type=OTHER + "BlockInstance", serialize_ignore={"blockDefinition"}
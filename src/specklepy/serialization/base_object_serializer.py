@@ -1,46 +1,336 @@
 import hashlib
 import re
 import warnings
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
-from uuid import uuid4
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from warnings import warn
 
 import ujson
 
 # import for serialization
 from specklepy.logging.exceptions import SpeckleException, SpeckleWarning
-from specklepy.objects.base import Base, DataChunk
+from specklepy.objects.base import (
+    _SERIALIZATION_CACHE,
+    Base,
+    DataChunk,
+    _SerializationCacheEntry,
+)
+from specklepy.objects.geometry import PointArray
+from specklepy.serialization.codecs import JSON, Codec, get_codec
+from specklepy.serialization.object_cache import ObjectCache
 from specklepy.transports.abstract_transport import AbstractTransport
+from specklepy.transports.memory import MemoryTransport
 
 PRIMITIVES = (int, float, str, bool)
+# the exact types of the items of flat lists, which are serialized and recomposed as
+# they are. Subclasses (eg: enums, numpy floats) aren't included
+FLAT_TYPES = frozenset((int, float, str, bool, type(None)))
+# how many of the children listed in a closure are read from the transport at once
+PREFETCH_BATCH_SIZE = 10000
+# how many inlined objects met only once are remembered after the detached object
+# they're in is done, in case they turn up again in the next ones
+SEEN_WINDOW = 1000
 
 
 def hash_obj(obj: Any) -> str:
-    return hashlib.sha256(ujson.dumps(obj).encode()).hexdigest()[:32]
+    return _hash_serialized_obj(ujson.dumps(obj))
+
+
+def _hash_serialized_obj(serialized_obj: str) -> str:
+    return hashlib.sha256(serialized_obj.encode()).hexdigest()[:32]
+
+
+def _complete_serialized_obj(
+    serialized_obj: str, obj_id: str, closure: Dict[str, int]
+) -> str:
+    """
+    Turns the encoded object that was hashed into the encoded object that gets
+    written out, without encoding the whole object a second time.
+
+    The hashed object leads with an empty `"id":""` member which gets filled in, and
+    the closure (if any) is appended as the last member.
+    """
+    serialized_obj = f"{serialized_obj[:7]}{obj_id}{serialized_obj[7:]}"
+    if closure:
+        serialized_obj = f'{serialized_obj[:-1]},"__closure":{ujson.dumps(closure)}}}'
+    return serialized_obj
+
+
+def _chunk_slices(value: Any, chunk_size: int) -> List[list]:
+    """
+    Splits the value of a chunkable prop into lists of at most `chunk_size` items.
+
+    Sequences are sliced in bulk, and `array.array`s and numpy arrays are converted
+    into lists of python numbers one slice at a time. An empty value still makes
+    one empty chunk.
+    """
+    if hasattr(value, "tolist"):
+        slice_list = value.__class__.tolist
+    elif isinstance(value, list):
+        slice_list = None
+    elif isinstance(value, tuple):
+        slice_list = list
+    else:
+        value = list(value)
+        slice_list = None
+    slices = [value[i : i + chunk_size] for i in range(0, len(value), chunk_size)]
+    if slice_list:
+        slices = [slice_list(s) for s in slices]
+    return slices or [[]]
 
 
 def safe_json_loads(obj: str, obj_id=None) -> Any:
-    try:
-        return ujson.loads(obj)
-    except ValueError as err:
-        import json
-
-        warn(
-            f"Failed to deserialise object (id: {obj_id}). This is likely a ujson big"
-            f" int error - falling back to json. \nError: {err}",
-            SpeckleWarning,
+    return JSON.loads(obj, obj_id)
+
+
+def _serialize_subtrees(
+    bases: List[Base],
+) -> List[Tuple[str, Dict[str, int], str, List[Tuple[str, str]]]]:
+    """
+    Serializes detached subtrees in a worker process of a parallel write.
+
+    Returns the id, closure and serialized string of each subtree's root object,
+    along with every object of the subtree that needs writing, in the order the
+    serial traversal writes them.
+    """
+    results = []
+    for base in bases:
+        transport = MemoryTransport()
+        serializer = BaseObjectSerializer(write_transports=[transport])
+        obj_id, serialized_obj = serializer.write_json(base)
+        closure = serializer.closure_table.get(obj_id, {})
+        results.append(
+            (obj_id, closure, serialized_obj, list(transport.objects.items()))
         )
-        return json.loads(obj)
+    return results
+
+
+class _ObjectStream(AbstractTransport):
+    """Queues up the objects written during a streamed write, to be handed out"""
+
+    def __init__(self) -> None:
+        self.objects: Deque[Tuple[str, str]] = deque()
+
+    @property
+    def name(self) -> str:
+        return "Stream"
+
+    def begin_write(self) -> None:
+        pass
+
+    def end_write(self) -> None:
+        pass
+
+    def save_object(self, id: str, serialized_object: str) -> None:
+        self.objects.append((id, serialized_object))
+
+    def save_object_from_transport(
+        self, id: str, source_transport: AbstractTransport
+    ) -> None:
+        raise NotImplementedError
+
+    def get_object(self, id: str) -> Optional[str]:
+        return None
+
+    def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
+        return {id: False for id in id_list}
+
+    def copy_object_and_children(
+        self, id: str, target_transport: AbstractTransport
+    ) -> str:
+        raise NotImplementedError
+
+
+class _CachedResult:
+    """The serialization result of an object, kept while the object is unmodified"""
+
+    __slots__ = ("obj_id", "closure", "obj", "serialized_obj", "store_ids")
+
+    def __init__(
+        self,
+        obj_id: str,
+        closure: Dict[str, int],
+        obj: Optional[Dict[str, Any]],
+        serialized_obj: Optional[str],
+        store_ids: FrozenSet[str],
+    ) -> None:
+        self.obj_id = obj_id
+        self.closure = closure
+        # only inlined objects keep their dict and only detached ones their string
+        self.obj = obj
+        self.serialized_obj = serialized_obj
+        # the stores which confirmed writing the object and all of its children
+        self.store_ids = store_ids
+
+
+class _LazyReference(Base):
+    """
+    Stands in for a referenced child object until any of its attributes are accessed.
+
+    The first access reads and recomposes the child, and the proxy then turns into
+    it, so it can be used just like the child. Only its `id` is known beforehand.
+    Until then `type()` gives this class rather than the child's, while `isinstance`
+    and `__class__` load the child and give its class.
+    """
+
+    def __init__(
+        self,
+        ref_id: str,
+        serializer: "BaseObjectSerializer",
+        ref_obj: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        state = object.__getattribute__(self, "__dict__")
+        state["_lazy_id"] = ref_id
+        state["_lazy_serializer"] = serializer
+        state["_lazy_obj"] = ref_obj
+
+    def __getattribute__(self, name: str) -> Any:
+        state = object.__getattribute__(self, "__dict__")
+        if name == "id":
+            return state["_lazy_id"]
+        if name == "__class__":
+            # `isinstance` checks of the child's own class fall back to this, which
+            # only works as long as the proxy hasn't turned into the child yet
+            return type(_recompose_reference(state))
+        _load_reference(self)
+        return object.__getattribute__(self, name)
+
+    def __delattr__(self, name: str) -> None:
+        _load_reference(self)
+        delattr(self, name)
+
+
+# the proxy isn't a type of object, so received objects never get recomposed into it
+Base._type_registry.pop(_LazyReference._full_name(), None)
+
+
+def _recompose_reference(state: Dict[str, Any]) -> Base:
+    if "_lazy_base" in state:
+        return state["_lazy_base"]
+
+    ref_id = state["_lazy_id"]
+    serializer = state["_lazy_serializer"]
+    # the proxy is registered under the child's id, which would short circuit it
+    proxy = serializer.deserialized.pop(ref_id, None)
+    ref_obj = state["_lazy_obj"] or serializer.get_child(
+        obj={"referencedId": ref_id, "speckle_type": "reference"}
+    )
+    if ref_obj.get("speckle_type") == "reference":
+        # missing from the read transport, like the eager recompose leaves it
+        base = Base.of_type(speckle_type="reference", referencedId=ref_id)
+    else:
+        base = serializer.recompose_base(obj=ref_obj)
+    if proxy is not None:
+        serializer.deserialized[ref_id] = proxy
+
+    state["_lazy_base"] = base
+    return base
+
+
+def _load_reference(proxy: _LazyReference) -> None:
+    state = object.__getattribute__(proxy, "__dict__")
+    base = _recompose_reference(state)
+    object.__setattr__(proxy, "__class__", type(base))
+    state.clear()
+    state.update(base.__dict__)
+
+
+class _SeenInstance:
+    """
+    The serialization result of an object already traversed during the current
+    write, for any other place it turns up in
+    """
+
+    __slots__ = ("base", "obj_id", "closure", "obj", "written", "count")
+
+    def __init__(
+        self,
+        base: Base,
+        obj_id: str,
+        closure: Optional[Dict[str, int]],
+        obj: Optional[Dict[str, Any]],
+        written: bool,
+    ) -> None:
+        # holding on to the object keeps its `id()` from being reused
+        self.base = base
+        self.obj_id = obj_id
+        # only kept for detached objects once they've turned up again
+        self.closure = closure
+        # only kept once the object has been inlined
+        self.obj = obj
+        # whether the object has been detached and written
+        self.written = written
+        # how many places the object has been found in so far
+        self.count = 1
+
+
+# marks values of a projection that contain none of the included members
+_EXCLUDED = object()
+
+
+class _PendingReference:
+    """A referenced child of a projection, which gets projected once it's been read"""
+
+    __slots__ = ("ref_id", "paths", "value")
+
+    def __init__(self, ref_id: str, paths: FrozenSet[Tuple[str, ...]]) -> None:
+        self.ref_id = ref_id
+        self.paths = paths
+        self.value: Any = _EXCLUDED
+
+
+class _ProjectedObject:
+    """
+    The included members of an object, and the members which might lead to some
+    """
+
+    __slots__ = ("included", "candidates")
+
+    def __init__(self, included: Dict[str, Any], candidates: Dict[str, Any]) -> None:
+        self.included = included
+        self.candidates = candidates
 
 
 class BaseObjectSerializer:
     read_transport: AbstractTransport
     write_transports: List[AbstractTransport]
     detach_lineage: List[bool]  # tracks depth and whether or not to detach
-    lineage: List[str]  # keeps track of hash chain through the object tree
-    family_tree: Dict[str, Dict[str, int]]
+    _closures: List[Dict[str, int]]  # detached descendants of each traversed object
     closure_table: Dict[str, Dict[str, int]]
+    _active: Set[int]  # ids of the base objects currently being traversed
+    cache_subtrees: bool
+    _children: List[List[Base]]  # base objects directly contained by each lineage
+    _unconfirmed: List[_CachedResult]  # results cached during the current write
+    _seen: Dict[int, _SeenInstance]  # objects traversed during the current write
+    _seen_scopes: List[List[int]]  # objects inlined in each detached object
+    _seen_once: Deque[int]  # inlined objects met once, oldest first
+    _stream: Optional[_ObjectStream]  # where the objects of a streamed write go
+    workers: int
+    lazy: bool
+    strict: bool
+    codec: Codec  # decodes the objects read from transports
+    _subtrees: Dict[int, Tuple[Future, int]]  # subtrees serialized by the workers
+    _prefetched: Dict[str, str]  # read children which haven't been recomposed yet
+    object_cache: Optional[ObjectCache]
+    _caching: bool  # whether the current receive uses the object cache
+    _read_sizes: Dict[str, int]  # the sizes of the objects read for the object cache
+    _subtree_sizes: Dict[str, int]  # the sizes of recomposed objects and their children
+    _recomposed: List[Tuple[str, Base, int]]  # objects to add to the object cache
+    _incomplete: bool  # whether any referenced child couldn't be found
     deserialized: Dict[
         str, Base
     ]  # holds deserialized objects so objects with same id return the same instance
@@ -49,13 +339,69 @@ class BaseObjectSerializer:
         self,
         write_transports: Optional[List[AbstractTransport]] = None,
         read_transport: Optional[AbstractTransport] = None,
+        cache_subtrees: bool = False,
+        workers: int = 1,
+        lazy: bool = False,
+        codec: Union[str, Codec, None] = None,
+        strict: bool = False,
+        object_cache: Optional[ObjectCache] = None,
     ) -> None:
+        """
+        Arguments:
+            write_transports {List[AbstractTransport]} -- where to write the
+            detached objects to
+            read_transport {AbstractTransport} -- where to read referenced child
+            objects from
+            cache_subtrees {bool} -- if True, the results of serialized objects are
+            cached until the objects are modified, and unmodified objects that
+            the write transports already stored aren't traversed or written again.
+            NOTE: mutating lists or dicts in place isn't tracked, see
+            `Base.mark_dirty`
+            workers {int} -- if more than 1, the detached children of the root
+            object are serialized in parallel by this many worker processes
+            lazy {bool} -- if True, referenced child objects are only read and
+            recomposed once any of their attributes are accessed. Until then,
+            `type()` gives a proxy class for them, so use `isinstance` instead
+            codec {str | Codec} -- the json codec to decode objects with. Object ids
+            are always computed from the canonical json encoding
+            strict {bool} -- if True, the attributes of received objects are type
+            checked as they are set, like when setting them by hand. Otherwise the
+            received data is trusted
+            object_cache {ObjectCache} -- optional: a cache of recomposed objects
+            shared with other deserializers, see `object_cache.RECEIVED_OBJECTS`.
+            Cached objects are handed out as they are, so they must not be modified.
+            It isn't used by lazy deserializers, nor when only including members
+        """
         self.write_transports = write_transports or []
         self.read_transport = read_transport
+        self.cache_subtrees = cache_subtrees
         self.detach_lineage = []
-        self.lineage = []
-        self.family_tree = {}
+        self._closures = []
         self.closure_table = {}
+        self._active = set()
+        self._children = []
+        self._unconfirmed = []
+        self._seen = {}
+        self._seen_scopes = []
+        self._seen_once = deque()
+        self._stream = None
+        self.workers = workers
+        self.lazy = lazy
+        self.strict = strict
+        self.codec = get_codec(codec)
+        if self.codec.binary:
+            raise SpeckleException(
+                f"Cannot deserialize objects with the binary {self.codec.name} codec,"
+                " as transports hand out objects encoded as json"
+            )
+        self._subtrees = {}
+        self._prefetched = {}
+        self.object_cache = object_cache
+        self._caching = False
+        self._read_sizes = {}
+        self._subtree_sizes = {}
+        self._recomposed = []
+        self._incomplete = False
         self.deserialized = {}
 
     def write_json(self, base: Base):
@@ -68,9 +414,31 @@ class BaseObjectSerializer:
             the serialized object string
         """
 
-        obj_id, obj = self.traverse_base(base)
+        obj_id, _, serialized_obj = self._traverse_root(base)
 
-        return obj_id, ujson.dumps(obj)
+        return obj_id, serialized_obj
+
+    def iter_json(self, base: Base) -> Iterator[Tuple[str, str]]:
+        """
+        Serializes a given base object, handing out each detached object as soon as
+        it is complete. Only their ids are kept until the end, for the closure of
+        the base object. Children come before the objects referencing them, and the
+        base object itself comes last. Equal objects which aren't the same instance
+        are handed out each time. Objects are also written to any write transports.
+
+        Arguments:
+            base {Base} -- the base object to be decomposed and serialized
+
+        Yields:
+            (str, str) -- the object id and the serialized object
+        """
+        self._stream = _ObjectStream()
+        self.write_transports = [*self.write_transports, self._stream]
+        try:
+            yield from self._write_root(base)
+        finally:
+            self.write_transports.remove(self._stream)
+            self._stream = None
 
     def traverse_base(self, base: Base) -> Tuple[str, Dict[str, Any]]:
         """Decomposes the given base object and builds a serializable dictionary
@@ -82,32 +450,228 @@ class BaseObjectSerializer:
             (str, dict) -- a tuple containing the object id of the base object and
             the constructed serializable dictionary
         """
+        obj_id, obj, serialized_obj = self._traverse_root(base)
+        if obj is None:
+            # the root was unmodified and only its serialized string was cached
+            obj = self.codec.loads(serialized_obj, obj_id)
+
+        return obj_id, obj
+
+    def _traverse_root(self, base: Base) -> Tuple[str, Optional[Dict[str, Any]], str]:
+        writer = self._write_root(base)
+        while True:
+            try:
+                next(writer)
+            except StopIteration as done:
+                return done.value
+
+    def _write_root(
+        self, base: Base
+    ) -> Generator[Tuple[str, str], None, Tuple[str, Optional[Dict[str, Any]], str]]:
+        """
+        Traverses the root object, yielding the objects of a streamed write as they
+        get written. Returns the result of the root's frame
+        """
         self.__reset_writer()
 
         if self.write_transports:
             for wt in self.write_transports:
                 wt.begin_write()
 
-        obj_id, obj = self._traverse_base(base)
+        if self.workers > 1 and self.write_transports:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                self._submit_subtrees(executor, base)
+                try:
+                    result = yield from self._run_writer(self._base_frame(base))
+                finally:
+                    self._subtrees = {}
+        else:
+            result = yield from self._run_writer(self._base_frame(base))
 
         if self.write_transports:
             for wt in self.write_transports:
                 wt.end_write()
+        self._seen = {}
+        self._seen_scopes = []
+        self._seen_once = deque()
 
-        return obj_id, obj
+        # every transport has now stored the objects cached during this write
+        store_ids = frozenset(wt.store_id for wt in self.write_transports)
+        for cached in self._unconfirmed:
+            cached.store_ids = cached.store_ids.union(store_ids)
+        self._unconfirmed = []
+
+        return result
+
+    def _submit_subtrees(self, executor: Executor, base: Base) -> None:
+        """
+        Hands the detached children of the root object out to the worker processes,
+        so they get serialized while the root object is being traversed
+        """
+        if self.cache_subtrees and self._get_cached_result(base, True):
+            return
+
+        subtrees = {}
+        for prop in base.get_serializable_attributes():
+            if prop.startswith(("__", "_", "@(")) or prop in base._chunkable:
+                continue
+            if not (prop.startswith("@") or prop in base._detachable):
+                continue
+            value = getattr(base, prop, None)
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            for child in values:
+                if not isinstance(child, Base) or isinstance(child, DataChunk):
+                    continue
+                if self.cache_subtrees and self._get_cached_result(child, True):
+                    continue
+                subtrees[id(child)] = child
+        if not subtrees:
+            return
+
+        bases = list(subtrees.values())
+        # a few batches per worker keeps them busy without a round trip per child
+        batch_size = -(-len(bases) // (self.workers * 4))
+        for start in range(0, len(bases), batch_size):
+            batch = bases[start : start + batch_size]
+            future = executor.submit(_serialize_subtrees, batch)
+            for index, child in enumerate(batch):
+                self._subtrees[id(child)] = (future, index)
 
     def _traverse_base(self, base: Base) -> Tuple[str, Dict]:
+        obj_id, obj, _ = self._run(self._base_frame(base))
+        return obj_id, obj
+
+    def traverse_value(self, obj: Any, detach: bool = False) -> Any:
+        """Decomposes a given object and constructs a serializable object or dictionary
+
+        Arguments:
+            obj {Any} -- the value to decompose
+
+        Returns:
+            Any -- a serializable version of the given object
+        """
+        try:
+            return self._run(self._value_frame(obj, detach))
+        finally:
+            self._seen = {}
+            self._seen_scopes = []
+            self._seen_once = deque()
+
+    def _run_writer(self, frame: Generator) -> Generator[Tuple[str, str], None, Any]:
+        """
+        Drives a traversal frame like `_run`, and for a streamed write yields the
+        objects written after each step
+        """
+        if self._stream is None:
+            return self._run(frame)
+        objects = self._stream.objects
+        stack = [frame]
+        result = None
+        while True:
+            try:
+                child = stack[-1].send(result)
+            except StopIteration as done:
+                stack.pop()
+                result = done.value
+            else:
+                stack.append(child)
+                result = None
+            while objects:
+                yield objects.popleft()
+            if not stack:
+                return result
+
+    @staticmethod
+    def _run(frame: Generator) -> Any:
+        """Drives a traversal frame, and every frame it spawns, to completion.
+
+        Frames are generators which `yield` the frame of a nested value and are sent
+        back its result. Keeping the suspended frames on an explicit stack means the
+        depth of the object tree isn't bound by the interpreter's recursion limit.
+        """
+        stack = [frame]
+        result = None
+        while True:
+            try:
+                child = stack[-1].send(result)
+            except StopIteration as done:
+                stack.pop()
+                if not stack:
+                    return done.value
+                result = done.value
+            else:
+                stack.append(child)
+                result = None
+
+    def _base_frame(
+        self, base: Base
+    ) -> Generator[Generator, Any, Tuple[str, Dict, Optional[str]]]:
+        """
+        Decomposes a base object into its serializable dictionary.
+
+        Returns the object id, the dictionary, and for objects that get detached
+        (and the root) the serialized object string.
+        NOTE: with `cache_subtrees`, the dictionary of a detached object can be None.
+        Objects already written during this write are returned without their string
+        when detached again
+        """
         if not self.detach_lineage:
             self.detach_lineage = [True]
 
-        self.lineage.append(uuid4().hex)
+        subtree = self._subtrees.get(id(base)) if self.detach_lineage[-1] else None
+        if subtree:
+            future, index = subtree
+            obj_id, closure, serialized_obj, objects = future.result()[index]
+            self.detach_lineage.pop()
+            self._merge_closure(closure)
+            for t in self.write_transports:
+                for ref_id, ref_obj in objects:
+                    t.save_object(id=ref_id, serialized_object=ref_obj)
+            if self._children:
+                self._children[-1].append(base)
+            return obj_id, None, serialized_obj
+
+        # instances turning up again are only traversed and written once
+        seen = self._seen.get(id(base))
+        if seen and (
+            seen.written and seen.closure is not None
+            if self.detach_lineage[-1]
+            else seen.obj
+        ):
+            seen.count += 1
+            self.detach_lineage.pop()
+            self._merge_closure(seen.closure)
+            if self._children:
+                self._children[-1].append(base)
+            return seen.obj_id, seen.obj, None
+
+        if self.cache_subtrees:
+            cached = self._get_cached_result(base, self.detach_lineage[-1])
+            if cached:
+                self.detach_lineage.pop()
+                self._merge_closure(cached.closure)
+                if self._children:
+                    self._children[-1].append(base)
+                return cached.obj_id, cached.obj, cached.serialized_obj
+            self._children.append([])
+
+        if id(base) in self._active:
+            raise SpeckleException(
+                message=(
+                    f"Cannot serialize {base}: it contains a circular reference back"
+                    " to itself"
+                )
+            )
+        self._active.add(id(base))
+        if self.detach_lineage[-1]:
+            self._seen_scopes.append([])
+
+        self._closures.append({})
         object_builder = {"id": "", "speckle_type": "Base", "totalChildrenCount": 0}
         object_builder.update(speckle_type=base.speckle_type)
-        obj, props = base, base.get_serializable_attributes()
 
-        while props:
-            prop = props.pop(0)
-            value = getattr(obj, prop, None)
+        for prop in base.get_serializable_attributes():
+            value = getattr(base, prop, None)
             chunkable = False
             detach = False
 
@@ -121,16 +685,17 @@ class BaseObjectSerializer:
 
             # only bother with chunking and detaching if there is a write transport
             if self.write_transports:
+                chunk_size = base._chunkable.get(prop)
                 dynamic_chunk_match = prop.startswith("@") and re.match(
                     r"^@\((\d*)\)", prop
                 )
                 if dynamic_chunk_match:
                     chunk_size = dynamic_chunk_match.groups()[0]
-                    base._chunkable[prop] = (
+                    chunk_size = (
                         int(chunk_size) if chunk_size else base._chunk_size_default
                     )
 
-                chunkable = prop in base._chunkable
+                chunkable = chunk_size is not None
                 detach = bool(
                     prop.startswith("@") or prop in base._detachable or chunkable
                 )
@@ -147,72 +712,84 @@ class BaseObjectSerializer:
 
             # 2. handle Base objects
             elif isinstance(value, Base):
-                child_obj = self.traverse_value(value, detach=detach)
+                self.detach_lineage.append(detach)
+                ref_id, child_obj, _ = yield self._base_frame(value)
                 if detach and self.write_transports:
-                    ref_id = child_obj["id"]
                     object_builder[prop] = self.detach_helper(ref_id=ref_id)
                 else:
                     object_builder[prop] = child_obj
 
             # 3. handle chunkable props
             elif chunkable and self.write_transports:
-                chunks = []
-                max_size = base._chunkable[prop]
-                chunk = DataChunk()
-                for count, item in enumerate(value):
-                    if count and count % max_size == 0:
-                        chunks.append(chunk)
-                        chunk = DataChunk()
-                    chunk.data.append(item)
-                chunks.append(chunk)
-
                 chunk_refs = []
-                for c in chunks:
+                for data in _chunk_slices(value, chunk_size):
+                    chunk = DataChunk()
+                    chunk.data = data
                     self.detach_lineage.append(detach)
-                    ref_id, _ = self._traverse_base(c)
+                    ref_id, _, _ = yield self._base_frame(chunk)
                     ref_obj = self.detach_helper(ref_id=ref_id)
                     chunk_refs.append(ref_obj)
                 object_builder[prop] = chunk_refs
 
             # 4. handle all other cases
             else:
-                child_obj = self.traverse_value(value, detach)
+                child_obj = yield self._value_frame(value, detach)
                 object_builder[prop] = child_obj
 
-        closure = {}
         # add closures & children count to the object
         detached = self.detach_lineage.pop()
-        if self.lineage[-1] in self.family_tree:
-            closure = {
-                ref: depth - len(self.detach_lineage)
-                for ref, depth in self.family_tree[self.lineage[-1]].items()
-            }
+        closure = self._closures.pop()
+        self._merge_closure(closure)
         object_builder["totalChildrenCount"] = len(closure)
 
-        obj_id = hash_obj(object_builder)
+        # the encoded object is hashed and then reused for the detached payload
+        serialized_obj = ujson.dumps(object_builder)
+        obj_id = _hash_serialized_obj(serialized_obj)
 
         object_builder["id"] = obj_id
         if closure:
-            object_builder["__closure"] = self.closure_table[obj_id] = closure
-
-        # write detached or root objects to transports
-        if detached and self.write_transports:
+            object_builder["__closure"] = closure
+            # streamed writes only keep the closure of the root
+            if self._stream is None or not self.detach_lineage:
+                self.closure_table[obj_id] = closure
+
+        if detached:
+            serialized_obj = _complete_serialized_obj(serialized_obj, obj_id, closure)
+            # write detached or root objects to transports
             for t in self.write_transports:
-                t.save_object(id=obj_id, serialized_object=ujson.dumps(object_builder))
-
-        del self.lineage[-1]
-
-        return obj_id, object_builder
+                t.save_object(id=obj_id, serialized_object=serialized_obj)
+        else:
+            serialized_obj = None
+
+        self._active.discard(id(base))
+
+        # chunks are created on the fly, so their `id()`s are never seen again
+        if not isinstance(base, DataChunk):
+            self._remember(base, seen, obj_id, closure, object_builder, detached)
+
+        if self.cache_subtrees:
+            children = self._children.pop()
+            # chunks are created on the fly, so there is no point in caching them
+            if not isinstance(base, DataChunk):
+                self._cache_result(
+                    base,
+                    children,
+                    _CachedResult(
+                        obj_id,
+                        closure,
+                        None if detached else object_builder,
+                        serialized_obj,
+                        frozenset(),
+                    ),
+                )
+                if self._children:
+                    self._children[-1].append(base)
 
-    def traverse_value(self, obj: Any, detach: bool = False) -> Any:
-        """Decomposes a given object and constructs a serializable object or dictionary
+        return obj_id, object_builder, serialized_obj
 
-        Arguments:
-            obj {Any} -- the value to decompose
-
-        Returns:
-            Any -- a serializable version of the given object
-        """
+    def _value_frame(
+        self, obj: Any, detach: bool = False
+    ) -> Generator[Generator, Any, Any]:
         if obj is None:
             return None
         if isinstance(obj, PRIMITIVES):
@@ -222,31 +799,37 @@ class BaseObjectSerializer:
         if isinstance(obj, Enum):
             return obj.value
 
-        elif isinstance(obj, (list, tuple, set)):
-            if not detach:
-                return [self.traverse_value(o) for o in obj]
+        # compact point arrays are serialized as the list of their points
+        if isinstance(obj, PointArray):
+            obj = list(obj)
 
-            detached_list = []
+        if isinstance(obj, (list, tuple, set)):
+            if FLAT_TYPES.issuperset(map(type, obj)):
+                return list(obj)
+            serialized_list = []
             for o in obj:
-                if isinstance(o, Base):
+                if o is None or isinstance(o, PRIMITIVES):
+                    serialized_list.append(o)
+                elif detach and isinstance(o, Base):
                     self.detach_lineage.append(detach)
-                    ref_id, _ = self._traverse_base(o)
-                    detached_list.append(self.detach_helper(ref_id=ref_id))
+                    ref_id, _, _ = yield self._base_frame(o)
+                    serialized_list.append(self.detach_helper(ref_id=ref_id))
                 else:
-                    detached_list.append(self.traverse_value(o, detach))
-            return detached_list
+                    serialized_list.append((yield self._value_frame(o, detach)))
+            return serialized_list
 
         elif isinstance(obj, dict):
+            serialized_dict = {}
             for k, v in obj.items():
                 if isinstance(v, PRIMITIVES) or v is None:
-                    continue
+                    serialized_dict[k] = v
                 else:
-                    obj[k] = self.traverse_value(v)
-            return obj
+                    serialized_dict[k] = yield self._value_frame(v)
+            return serialized_dict
 
         elif isinstance(obj, Base):
             self.detach_lineage.append(detach)
-            _, base_obj = self._traverse_base(obj)
+            _, base_obj, _ = yield self._base_frame(obj)
             return base_obj
 
         else:
@@ -263,7 +846,7 @@ class BaseObjectSerializer:
 
     def detach_helper(self, ref_id: str) -> Dict[str, str]:
         """
-        Helper to keep track of detached objects and their depth in the family tree
+        Helper to add detached objects to the closure of the object holding them
         and create reference objects to place in the parent object
 
         Arguments:
@@ -272,35 +855,148 @@ class BaseObjectSerializer:
         Returns:
             dict -- a reference object to be inserted into the given object's parent
         """
-
-        for parent in self.lineage:
-            if parent not in self.family_tree:
-                self.family_tree[parent] = {}
-            if ref_id not in self.family_tree[parent] or self.family_tree[parent][
-                ref_id
-            ] > len(self.detach_lineage):
-                self.family_tree[parent][ref_id] = len(self.detach_lineage)
+        # closure depths are relative to the object, so its own references are at 1
+        self._closures[-1][ref_id] = 1
 
         return {
             "referencedId": ref_id,
             "speckle_type": "reference",
         }
 
+    def _merge_closure(self, closure: Dict[str, int]) -> None:
+        """
+        Merges the closure of a finished child object into the closure of the object
+        containing it, one level deeper, keeping the shallowest depth of each
+        reference
+        """
+        if not self._closures:
+            return
+        parent_closure = self._closures[-1]
+        for ref_id, depth in closure.items():
+            depth += 1
+            if parent_closure.get(ref_id, depth) >= depth:
+                parent_closure[ref_id] = depth
+
+    def _remember(
+        self,
+        base: Base,
+        seen: Optional[_SeenInstance],
+        obj_id: str,
+        closure: Dict[str, int],
+        obj: Dict[str, Any],
+        detached: bool,
+    ) -> None:
+        """
+        Keeps the result of a traversed object for any other place it turns up in.
+        Inlined objects only found in one place are let go once the `SEEN_WINDOW`
+        inlined objects after them are done, and the closure of a detached object
+        is only kept once it turns up again, so a streamed write doesn't hold on to
+        every object it traversed
+        """
+        if not detached:
+            if seen is None:
+                self._seen[id(base)] = _SeenInstance(base, obj_id, closure, obj, False)
+            else:
+                seen.count += 1
+                seen.obj = obj
+                seen.closure = closure
+            if self._seen_scopes:
+                self._seen_scopes[-1].append(id(base))
+            return
+
+        seen_once = self._seen_once
+        for key in self._seen_scopes.pop():
+            inlined = self._seen.get(key)
+            if inlined is not None and inlined.count == 1:
+                seen_once.append(key)
+        while len(seen_once) > SEEN_WINDOW:
+            key = seen_once.popleft()
+            inlined = self._seen.get(key)
+            # found in another place since, so likely to turn up again
+            if inlined is None or inlined.count > 1:
+                continue
+            if inlined.written:
+                inlined.obj = None
+            else:
+                del self._seen[key]
+        if seen is None:
+            # an empty closure takes no more memory than a marker
+            self._seen[id(base)] = _SeenInstance(
+                base, obj_id, None if closure else closure, None, True
+            )
+        else:
+            seen.count += 1
+            seen.written = True
+            seen.closure = closure
+
+    def _get_cached_result(self, base: Base, detached: bool) -> Optional[_CachedResult]:
+        entry = _SERIALIZATION_CACHE.get(base)
+        if entry is None:
+            return None
+        cached = entry.results.get(bool(self.write_transports))
+        if cached is None:
+            return None
+        if (detached and cached.serialized_obj is None) or (
+            not detached and cached.obj is None
+        ):
+            return None
+        # the object, or its detached children, need writing to any new stores
+        if (detached or cached.closure) and any(
+            wt.store_id not in cached.store_ids for wt in self.write_transports
+        ):
+            return None
+        # stores which evict may have dropped them since they confirmed the write
+        ids = [cached.obj_id, *cached.closure] if detached else list(cached.closure)
+        for wt in self.write_transports:
+            if ids and wt.evicts and not all(wt.has_objects(ids).values()):
+                return None
+        return cached
+
+    def _cache_result(
+        self, base: Base, children: List[Base], cached: _CachedResult
+    ) -> None:
+        child_entries = [_SERIALIZATION_CACHE.get(child) for child in children]
+        if None in child_entries:
+            # a child got modified while serializing, so this result can't be trusted
+            return
+        if self._subtrees and any(id(child) in self._subtrees for child in children):
+            # the children serialized by the workers aren't tracked for modifications
+            return
+        entry = _SERIALIZATION_CACHE.get(base)
+        if entry is None:
+            entry = _SERIALIZATION_CACHE[base] = _SerializationCacheEntry()
+        previous = entry.results.get(bool(self.write_transports))
+        if previous and previous.obj_id == cached.obj_id:
+            cached.store_ids = previous.store_ids
+        entry.results[bool(self.write_transports)] = cached
+        for child_entry in child_entries:
+            child_entry.dependents.add(base)
+        self._unconfirmed.append(cached)
+
     def __reset_writer(self) -> None:
         """
         Reinitializes the lineage, and other variables that get used during the json
         writing process
         """
         self.detach_lineage = [True]
-        self.lineage = []
-        self.family_tree = {}
+        self._closures = []
         self.closure_table = {}
-
-    def read_json(self, obj_string: str) -> Base:
+        self._active = set()
+        self._children = []
+        self._unconfirmed = []
+        self._seen = {}
+        self._seen_scopes = []
+        self._seen_once = deque()
+
+    def read_json(self, obj_string: str, include: Optional[List[str]] = None) -> Base:
         """Recomposes a Base object from the string representation of the object
 
         Arguments:
             obj_string {str} -- the string representation of the object
+            include {List[str]} -- optional: only recompose these members. Dotted
+            paths (eg: `@Data.Area`) are followed from the given object, while plain
+            names are found at any depth. Members that lead to none of them are
+            left out, and so are the ids of the objects that get left incomplete
 
         Returns:
             Base -- the base object with all it's children attached
@@ -309,8 +1005,174 @@ class BaseObjectSerializer:
             return None
 
         self.deserialized = {}
-        obj = safe_json_loads(obj_string)
-        return self.recompose_base(obj=obj)
+        obj = self.codec.loads(obj_string)
+        caching = self._caching = (
+            self.object_cache is not None and not self.lazy and include is None
+        )
+        try:
+            if caching and "id" in obj:
+                cached = self._recomposed_child(obj["id"])
+                if cached is not None:
+                    return cached
+                self._read_sizes[obj["id"]] = len(obj_string)
+            if include is not None:
+                obj = self._project(obj, include)
+            elif self.read_transport and not self.lazy and "__closure" in obj:
+                self._prefetch_closure(obj["__closure"])
+            base = self.recompose_base(obj=obj)
+            # objects missing children aren't kept, as the children may turn up later
+            if caching and not self._incomplete:
+                for obj_id, recomposed, size in self._recomposed:
+                    self.object_cache.put(obj_id, recomposed, size)
+            return base
+        finally:
+            self._prefetched = {}
+            self._caching = False
+            self._read_sizes = {}
+            self._subtree_sizes = {}
+            self._recomposed = []
+            self._incomplete = False
+
+    def _prefetch_closure(self, closure: Dict[str, int]) -> None:
+        """
+        Reads all the children listed in the closure of the root object in large
+        batches, shallowest first, instead of reading them one by one while
+        recomposing
+        """
+        ids = sorted(closure, key=closure.__getitem__)
+        if self._caching:
+            ids = [obj_id for obj_id in ids if obj_id not in self.object_cache]
+        for start in range(0, len(ids), PREFETCH_BATCH_SIZE):
+            batch = ids[start : start + PREFETCH_BATCH_SIZE]
+            self._prefetched.update(self.read_transport.get_objects(batch))
+
+    def _project(self, obj: Dict[str, Any], include: List[str]) -> Dict[str, Any]:
+        """
+        Walks the raw objects from the given root, and only reads the referenced
+        children which can lead to the included members. The children are read a
+        level at a time, so each level takes a single `get_objects` call.
+        """
+        names = frozenset(path for path in include if "." not in path)
+        paths = frozenset(tuple(path.split(".")) for path in include if "." in path)
+
+        pending: List[_PendingReference] = []
+        projection = self._project_object(obj, paths, names, pending)
+        read: Dict[str, Any] = {}
+        while pending:
+            ref_ids = list({ref.ref_id for ref in pending if ref.ref_id not in read})
+            for ref_id, ref_obj_str in self.read_transport.get_objects(ref_ids).items():
+                read[ref_id] = self.codec.loads(ref_obj_str, ref_id)
+            current, pending = pending, []
+            for ref in current:
+                if ref.ref_id not in read:
+                    warnings.warn(
+                        f"Could not find the referenced child object of id"
+                        f" `{ref.ref_id}` in the given read transport:"
+                        f" {self.read_transport.name}",
+                        SpeckleWarning,
+                    )
+                    continue
+                ref.value = self._project_object(
+                    read[ref.ref_id], ref.paths, names, pending
+                )
+
+        projected = self._resolve_projection(projection)
+        if projected is _EXCLUDED:
+            projected = dict(projection.included)
+        if not self.lazy:
+            self._prefetch_references(projected)
+        return projected
+
+    def _project_object(
+        self,
+        obj: Dict[str, Any],
+        paths: FrozenSet[Tuple[str, ...]],
+        names: FrozenSet[str],
+        pending: List[_PendingReference],
+    ) -> _ProjectedObject:
+        speckle_type = obj.get("speckle_type", "")
+        object_type = Base.get_registered_type(speckle_type) if speckle_type else None
+        chunkable = object_type._chunkable if object_type else {}
+
+        included = {"speckle_type": speckle_type} if speckle_type else {}
+        candidates = {}
+        for prop, value in obj.items():
+            if prop in names or (prop,) in paths:
+                included[prop] = value
+                continue
+            # chunks only ever hold data, so there is nothing to find in them
+            if prop in chunkable or prop.startswith("@(") or prop == "__closure":
+                continue
+            child_paths = frozenset(
+                path[1:] for path in paths if len(path) > 1 and path[0] == prop
+            )
+            if child_paths or names:
+                candidates[prop] = self._project_value(
+                    value, child_paths, names, pending
+                )
+        return _ProjectedObject(included, candidates)
+
+    def _project_value(
+        self,
+        value: Any,
+        paths: FrozenSet[Tuple[str, ...]],
+        names: FrozenSet[str],
+        pending: List[_PendingReference],
+    ) -> Any:
+        if isinstance(value, list):
+            return [self._project_value(v, paths, names, pending) for v in value]
+        if not isinstance(value, dict):
+            return _EXCLUDED
+        if "referencedId" in value:
+            ref = _PendingReference(value["referencedId"], paths)
+            pending.append(ref)
+            return ref
+        # inlined objects and plain dictionaries are searched alike
+        return self._project_object(value, paths, names, pending)
+
+    def _resolve_projection(self, value: Any) -> Any:
+        """Builds the projected objects, leaving out any which include nothing"""
+        if isinstance(value, _PendingReference):
+            return self._resolve_projection(value.value)
+        if isinstance(value, list):
+            items = [self._resolve_projection(v) for v in value]
+            items = [item for item in items if item is not _EXCLUDED]
+            return items or _EXCLUDED
+        if not isinstance(value, _ProjectedObject):
+            return _EXCLUDED
+
+        obj = dict(value.included)
+        matched = any(prop != "speckle_type" for prop in obj)
+        for prop, candidate in value.candidates.items():
+            candidate = self._resolve_projection(candidate)
+            if candidate is not _EXCLUDED:
+                obj[prop] = candidate
+                matched = True
+        return obj if matched else _EXCLUDED
+
+    def _prefetch_references(self, value: Any) -> None:
+        """Reads every child the included members reference, and their closures"""
+        ref_ids = []
+        values = [value]
+        while values:
+            value = values.pop()
+            if isinstance(value, list):
+                values.extend(value)
+            elif isinstance(value, dict):
+                if "referencedId" in value:
+                    ref_ids.append(value["referencedId"])
+                else:
+                    values.extend(value.values())
+        if not ref_ids:
+            return
+
+        self._prefetched.update(self.read_transport.get_objects(ref_ids))
+        closure = {}
+        for ref_id in ref_ids:
+            if ref_id in self._prefetched:
+                ref_obj = self.codec.loads(self._prefetched[ref_id], ref_id)
+                closure.update(ref_obj.get("__closure", {}))
+        self._prefetch_closure(closure)
 
     def recompose_base(self, obj: dict) -> Base:
         """Steps through a base object dictionary and recomposes the base object
@@ -325,12 +1187,17 @@ class BaseObjectSerializer:
         if not obj:
             return
         if isinstance(obj, str):
-            obj = safe_json_loads(obj)
+            obj = self.codec.loads(obj)
 
         if "id" in obj and obj["id"] in self.deserialized:
             return self.deserialized[obj["id"]]
 
         if "speckle_type" in obj and obj["speckle_type"] == "reference":
+            if self.lazy:
+                return self._lazy_child(obj["referencedId"])
+            child = self._recomposed_child(obj["referencedId"])
+            if child is not None:
+                return child
             obj = self.get_child(obj=obj)
 
         speckle_type = obj.get("speckle_type")
@@ -343,42 +1210,65 @@ class BaseObjectSerializer:
 
         # initialise the base object using `speckle_type` fall back to base if needed
         base = object_type() if object_type else Base.of_type(speckle_type=speckle_type)
+        # received data is only type checked when strict
+        set_attr = base.__setattr__ if self.strict else base._set_trusted
         # get total children count
+        closure = {}
         if "__closure" in obj:
             if not self.read_transport:
                 raise SpeckleException(
                     message="Cannot resolve reference - no read transport is defined"
                 )
             closure = obj.pop("__closure")
-            base.totalChildrenCount = len(closure)
+            set_attr("totalChildrenCount", len(closure))
 
         for prop, value in obj.items():
             # 1. handle primitives (ints, floats, strings, and bools) or None
             if isinstance(value, PRIMITIVES) or value is None:
-                base.__setattr__(prop, value)
+                set_attr(prop, value)
                 continue
 
             # 2. handle referenced child objects
             elif "referencedId" in value:
                 ref_id = value["referencedId"]
-                ref_obj_str = self.read_transport.get_object(id=ref_id)
+                if self.lazy:
+                    set_attr(prop, self._lazy_child(ref_id))
+                    continue
+                child = self._recomposed_child(ref_id)
+                if child is not None:
+                    set_attr(prop, child)
+                    continue
+                ref_obj_str = self._read_object(ref_id)
                 if ref_obj_str:
-                    ref_obj = safe_json_loads(ref_obj_str, ref_id)
-                    base.__setattr__(prop, self.recompose_base(obj=ref_obj))
+                    ref_obj = self.codec.loads(ref_obj_str, ref_id)
+                    set_attr(prop, self.recompose_base(obj=ref_obj))
                 else:
                     warnings.warn(
                         f"Could not find the referenced child object of id `{ref_id}`"
                         f" in the given read transport: {self.read_transport.name}",
                         SpeckleWarning,
                     )
-                    base.__setattr__(prop, self.handle_value(value))
+                    self._incomplete = True
+                    set_attr(prop, self.handle_value(value))
 
             # 3. handle all other cases (base objects, lists, and dicts)
             else:
-                base.__setattr__(prop, self.handle_value(value))
+                set_attr(prop, self.handle_value(value))
 
         if "id" in obj:
             self.deserialized[obj["id"]] = base
+            size = self._read_sizes.pop(obj["id"], None)
+            if size is not None:
+                # the object keeps its detached children, and theirs, alive
+                size += sum(
+                    self._subtree_sizes.get(child_id, 0)
+                    for child_id, depth in closure.items()
+                    if depth == 1
+                )
+                self._subtree_sizes[obj["id"]] = size
+            # only detached objects are cached, as they are the ones looked up
+            if size is not None and not isinstance(base, DataChunk):
+                self._recomposed.append((obj["id"], base, size))
 
         return base
 
@@ -400,16 +1290,21 @@ class BaseObjectSerializer:
 
         # lists (regular and chunked)
         if isinstance(obj, list):
+            # flat lists, like the data of chunks, don't need recomposing
+            if FLAT_TYPES.issuperset(map(type, obj)):
+                return obj
+            if self.lazy and isinstance(obj[0], dict) and "referencedId" in obj[0]:
+                # only the first object needs reading to tell if the list was chunked
+                first = self.get_child(obj=obj[0])
+                self._lazy_child(obj[0]["referencedId"], first)
+                if "DataChunk" not in first.get("speckle_type", ""):
+                    return [self.handle_value(o) for o in obj]
             obj_list = [self.handle_value(o) for o in obj]
             if (
                 hasattr(obj_list[0], "speckle_type")
                 and "DataChunk" in obj_list[0].speckle_type
             ):
-                # handle chunked lists
-                data = []
-                for o in obj_list:
-                    data.extend(o.data)
-                return data
+                return self._join_chunks(obj_list)
             return obj_list
 
         # bases
@@ -425,15 +1320,58 @@ class BaseObjectSerializer:
                     obj[k] = self.handle_value(v)
             return obj
 
+    @staticmethod
+    def _join_chunks(chunks: List[DataChunk]) -> list:
+        """Joins the data of chunks back into one list, allocated up front"""
+        data = [None] * sum(len(chunk.data) for chunk in chunks)
+        start = 0
+        for chunk in chunks:
+            end = start + len(chunk.data)
+            data[start:end] = chunk.data
+            start = end
+        return data
+
+    def _lazy_child(
+        self, ref_id: str, ref_obj: Optional[Dict[str, Any]] = None
+    ) -> Base:
+        child = self.deserialized.get(ref_id)
+        if child is None:
+            child = _LazyReference(ref_id, self, ref_obj)
+            self.deserialized[ref_id] = child
+        return child
+
+    def _read_object(self, id: str) -> Optional[str]:
+        # each prefetched child is only needed once, as it's kept in `deserialized`
+        obj_string = self._prefetched.pop(id, None)
+        if obj_string is None:
+            obj_string = self.read_transport.get_object(id=id)
+        if obj_string and self._caching:
+            self._read_sizes[id] = len(obj_string)
+        return obj_string
+
+    def _recomposed_child(self, ref_id: str) -> Optional[Base]:
+        """
+        A child already recomposed during this receive, or during an earlier one when
+        there is an object cache
+        """
+        child = self.deserialized.get(ref_id)
+        if child is None and self._caching:
+            child = self.object_cache.get(ref_id)
+            if child is not None:
+                self.deserialized[ref_id] = child
+                self._subtree_sizes[ref_id] = self.object_cache.size(ref_id) or 0
+        return child
+
     def get_child(self, obj: Dict):
         ref_id = obj["referencedId"]
-        ref_obj_str = self.read_transport.get_object(id=ref_id)
+        ref_obj_str = self._read_object(ref_id)
         if not ref_obj_str:
             warnings.warn(
                 f"Could not find the referenced child object of id `{ref_id}` in the"
                 f" given read transport: {self.read_transport.name}",
                 SpeckleWarning,
             )
+            self._incomplete = True
             return obj
 
-        return safe_json_loads(ref_obj_str, ref_id)
+        return self.codec.loads(ref_obj_str, ref_id)
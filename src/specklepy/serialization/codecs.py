@@ -0,0 +1,342 @@
+"""
+Codecs for encoding and decoding serialized objects.
+
+Object ids are always hashed from the canonical `ujson` encoding of an object, so a
+codec only changes how objects are decoded by the serializer, and how transports
+store them. Binary codecs (eg: msgpack) don't produce json, so they are only fit for
+local storage which is never sent on to a server.
+
+Local storage can also be compressed. Every stored object is kept with the flags of
+its codec and of its compressor, so any transport can read it back whatever it
+encodes and compresses with.
+"""
+
+import json
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple, Type, Union
+from warnings import warn
+
+import ujson
+
+from specklepy.logging.exceptions import SpeckleException, SpeckleWarning
+
+
+class Codec(ABC):
+    name: str
+    binary: bool = False
+    # stored alongside each object a transport encodes, 0 being json. Binary codecs
+    # need a flag of their own
+    flag: int = 0
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> Union[str, bytes]:
+        """Encodes the given object"""
+        pass
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes], obj_id: Optional[str] = None) -> Any:
+        """Decodes the given data
+
+        Arguments:
+            data {str | bytes} -- the encoded object
+            obj_id {str} -- optional: the id of the object, to report failures
+        """
+        pass
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+def _json_fallback(
+    data: Union[str, bytes], obj_id: Optional[str], codec: Codec, err: Exception
+) -> Any:
+    warn(
+        f"Failed to deserialise object (id: {obj_id}). This is likely a {codec.name}"
+        f" big int error - falling back to json. \nError: {err}",
+        SpeckleWarning,
+    )
+    return json.loads(data)
+
+
+class JsonCodec(Codec):
+    """The canonical json encoding, which object ids are computed from"""
+
+    name = "ujson"
+
+    def dumps(self, obj: Any) -> str:
+        return ujson.dumps(obj)
+
+    def loads(self, data: Union[str, bytes], obj_id: Optional[str] = None) -> Any:
+        try:
+            return ujson.loads(data)
+        except ValueError as err:
+            return _json_fallback(data, obj_id, self, err)
+
+
+# orjson decodes integers beyond 64 bits as floats, so any data with a number of 19
+# or more digits is left to ujson. Numbers follow a colon, a comma or a bracket, give
+# or take whitespace and a minus sign, unlike the digits of ids. Translating those
+# and searching for a long number is much quicker than a regular expression
+_NUMBER_DIGITS = bytes(
+    ord("0") if c in b"0123456789" else ord(":") if c in b":,[" else ord(" ")
+    for c in range(256)
+)
+_NUMBER_GAPS = b" \t\n\r-"
+_LONG_NUMBER = b":" + b"0" * 19
+
+
+class OrjsonCodec(Codec):
+    """A faster json codec, backed by the optional `orjson` package"""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as ex:
+            raise SpeckleException(
+                "The orjson codec needs the `orjson` package to be installed", ex
+            )
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return self._orjson.dumps(obj).decode()
+        except TypeError:
+            # integers beyond 64 bits
+            return JSON.dumps(obj)
+
+    def loads(self, data: Union[str, bytes], obj_id: Optional[str] = None) -> Any:
+        encoded = data.encode() if isinstance(data, str) else data
+        if _LONG_NUMBER in encoded.translate(_NUMBER_DIGITS, _NUMBER_GAPS):
+            return JSON.loads(data, obj_id)
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError as err:
+            return _json_fallback(data, obj_id, self, err)
+
+
+class MsgpackCodec(Codec):
+    """
+    A compact binary codec for local storage, backed by the optional `msgpack`
+    package. Integers beyond 64 bits can't be encoded.
+    """
+
+    name = "msgpack"
+    binary = True
+    flag = 1
+
+    def __init__(self) -> None:
+        try:
+            import msgpack
+        except ImportError as ex:
+            raise SpeckleException(
+                "The msgpack codec needs the `msgpack` package to be installed", ex
+            )
+        self._msgpack = msgpack
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._msgpack.packb(obj, use_bin_type=True)
+
+    def loads(self, data: Union[str, bytes], obj_id: Optional[str] = None) -> Any:
+        return self._msgpack.unpackb(data, raw=False)
+
+
+CODECS: Dict[str, Type[Codec]] = {
+    codec.name: codec for codec in (JsonCodec, OrjsonCodec, MsgpackCodec)
+}
+
+JSON = JsonCodec()
+
+
+def get_codec(codec: Union[str, Codec, None] = None) -> Codec:
+    """Gets a codec by its name, defaulting to the canonical json codec
+
+    Arguments:
+        codec {str | Codec} -- the name of the codec (`ujson`, `orjson`, or
+        `msgpack`), or the codec itself
+
+    Returns:
+        Codec -- the codec
+    """
+    if codec is None:
+        return JSON
+    if isinstance(codec, Codec):
+        return codec
+    if codec not in CODECS:
+        raise SpeckleException(
+            f"Unknown codec `{codec}`, choose one of: {', '.join(CODECS)}"
+        )
+    return JSON if codec == JSON.name else CODECS[codec]()
+
+
+# the codecs objects are read back with, by their flag
+_STORAGE_CODECS: Dict[int, Codec] = {}
+
+
+def get_storage_codec(flag: int) -> Codec:
+    """Gets the codec to read back objects stored with the given codec flag
+
+    Arguments:
+        flag {int} -- the flag of the codec, or 0 for objects stored as json
+
+    Returns:
+        Codec -- the codec
+    """
+    if not flag:
+        return JSON
+    codec = _STORAGE_CODECS.get(flag)
+    if codec is None:
+        by_flag = {codec.flag: codec for codec in CODECS.values() if codec.flag}
+        if flag not in by_flag:
+            raise SpeckleException(f"Unknown codec flag {flag}")
+        codec = _STORAGE_CODECS[flag] = by_flag[flag]()
+    return codec
+
+
+def encode_for_storage(codec: Codec, serialized_object: str) -> Union[str, bytes]:
+    """
+    Re-encodes a json serialized object for a transport storing it with the given
+    codec. Objects are kept as they are for json codecs.
+    """
+    if not codec.binary:
+        return serialized_object
+    return codec.dumps(JSON.loads(serialized_object))
+
+
+def decode_from_storage(codec: Codec, stored_object: Union[str, bytes]) -> str:
+    """Turns an object stored with the given codec back into its json encoding"""
+    if not codec.binary:
+        return stored_object
+    return JSON.dumps(codec.loads(stored_object))
+
+
+class Compressor(ABC):
+    name: str
+    # stored alongside each compressed object, 0 being left uncompressed
+    flag: int
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        pass
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        pass
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class ZlibCompressor(Compressor):
+    """Compression with the standard library's zlib, at its fastest level"""
+
+    name = "zlib"
+    flag = 1
+
+    def __init__(self, level: int = 1) -> None:
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class ZstdCompressor(Compressor):
+    """
+    Quicker and tighter compression than zlib, backed by the optional `zstandard`
+    package
+    """
+
+    name = "zstd"
+    flag = 2
+
+    def __init__(self, level: int = 3) -> None:
+        try:
+            import zstandard
+        except ImportError as ex:
+            raise SpeckleException(
+                "The zstd compressor needs the `zstandard` package to be installed", ex
+            )
+        self.level = level
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+
+COMPRESSORS: Dict[str, Type[Compressor]] = {
+    compressor.name: compressor for compressor in (ZlibCompressor, ZstdCompressor)
+}
+
+# the compressors objects are read back with, by their flag
+_DECOMPRESSORS: Dict[int, Compressor] = {}
+
+
+def get_compressor(
+    compressor: Union[str, Compressor, None] = None
+) -> Optional[Compressor]:
+    """Gets a compressor by its name, or None to store objects uncompressed
+
+    Arguments:
+        compressor {str | Compressor} -- the name of the compressor (`zlib` or
+        `zstd`), or the compressor itself
+
+    Returns:
+        Compressor -- the compressor, or None
+    """
+    if compressor is None or isinstance(compressor, Compressor):
+        return compressor
+    if compressor not in COMPRESSORS:
+        raise SpeckleException(
+            f"Unknown compressor `{compressor}`, choose one of:"
+            f" {', '.join(COMPRESSORS)}"
+        )
+    return COMPRESSORS[compressor]()
+
+
+def compress_for_storage(
+    compressor: Optional[Compressor], stored_object: Union[str, bytes]
+) -> Tuple[Union[str, bytes], int]:
+    """
+    Compresses an object encoded for storage, returning it with the flag of its
+    compressor. Objects which don't get any smaller are kept as they are, with flag 0.
+    """
+    if compressor is None:
+        return stored_object, 0
+    data = stored_object.encode() if isinstance(stored_object, str) else stored_object
+    compressed = compressor.compress(data)
+    if len(compressed) >= len(data):
+        return stored_object, 0
+    return compressed, compressor.flag
+
+
+def decompress_from_storage(
+    flag: int, stored_object: Union[str, bytes], binary: bool
+) -> Union[str, bytes]:
+    """
+    Decompresses an object stored with the given compressor flag, back into its
+    encoding for storage
+
+    Arguments:
+        flag {int} -- the flag of the compressor, or 0 for uncompressed objects
+        stored_object {str | bytes} -- the stored object
+        binary {bool} -- whether the object is encoded with a binary codec
+    """
+    if not flag:
+        return stored_object
+    decompressor = _DECOMPRESSORS.get(flag)
+    if decompressor is None:
+        by_flag = {compressor.flag: compressor for compressor in COMPRESSORS.values()}
+        if flag not in by_flag:
+            raise SpeckleException(f"Unknown compressor flag {flag}")
+        decompressor = _DECOMPRESSORS[flag] = by_flag[flag]()
+    data = decompressor.decompress(stored_object)
+    return data if binary else data.decode()
@@ -0,0 +1,108 @@
+"""
+A process wide cache of received objects, so objects shared by the versions of a
+model are only recomposed once.
+
+Cached objects are handed out as they are to every receive that turns them up, so
+the cache is only fit for received objects which don't get modified.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from specklepy.objects.base import Base
+
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+
+class ObjectCache:
+    """
+    A least recently used cache of recomposed objects, by object id.
+
+    An object is charged for the length of its serialized string, which includes
+    its inlined children, and for the sizes of its detached children, which it
+    keeps alive. Objects cached along with their children are counted more than
+    once. Once the cache holds more than `max_bytes`, the least recently used
+    objects are dropped.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._objects: "OrderedDict[str, Tuple[Base, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+
+    def __contains__(self, obj_id: str) -> bool:
+        return obj_id in self._objects
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def get(self, obj_id: str) -> Optional[Base]:
+        """Gets a cached object, counting the hit or miss
+
+        Arguments:
+            obj_id {str} -- the id of the object
+
+        Returns:
+            Base -- the cached object, or None if it isn't cached
+        """
+        with self._lock:
+            cached = self._objects.get(obj_id)
+            if cached is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._objects.move_to_end(obj_id)
+            return cached[0]
+
+    def size(self, obj_id: str) -> Optional[int]:
+        """The size a cached object is charged for, or None if it isn't cached"""
+        cached = self._objects.get(obj_id)
+        return None if cached is None else cached[1]
+
+    def put(self, obj_id: str, base: Base, size: int) -> None:
+        """Caches a recomposed object, dropping the least recently used objects if
+        the cache grows past its size
+
+        Arguments:
+            obj_id {str} -- the id of the object
+            base {Base} -- the recomposed object
+            size {int} -- the length of the object's serialized string, along with
+            the sizes of its detached children
+        """
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._objects.pop(obj_id, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._objects[obj_id] = (base, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._objects.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self) -> None:
+        """Drops every cached object, and resets the counters"""
+        with self._lock:
+            self._objects.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """The hit and miss counts, and the number and size of the cached objects"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "objects": len(self._objects),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+# shared by the receives which opt into caching objects
+RECEIVED_OBJECTS = ObjectCache()
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
+from uuid import uuid4
 
 
 class AbstractTransport(ABC):
@@ -8,6 +9,30 @@ class AbstractTransport(ABC):
     def name(self):
         pass
 
+    @property
+    def store_id(self) -> str:
+        """
+        Identifies the object store behind this transport.
+
+        Transports writing to the same store share the same id, which lets the
+        serializer skip objects it knows were already written to that store.
+        Defaults to an id that is unique to this transport instance.
+        """
+        try:
+            return self._store_id
+        except AttributeError:
+            self._store_id = uuid4().hex
+            return self._store_id
+
+    @property
+    def evicts(self) -> bool:
+        """
+        Whether objects saved to this transport can later be dropped from it, eg: by
+        a max size. The children of an object found in such a transport can't be
+        assumed to be there too. Defaults to False.
+        """
+        return False
+
     @abstractmethod
     def begin_write(self) -> None:
         """Optional: signals to the transport that writes are about to begin."""
@@ -56,6 +81,26 @@ class AbstractTransport(ABC):
         """
         pass
 
+    def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        """Gets multiple objects. Objects that are not found are left out.
+
+        Transports which can read many objects at once should override this, as the
+        default gets them one by one.
+
+        Arguments:
+            id_list -- List of object ids to get
+
+        Returns:
+            Dict[str, str] -- keys: the ids of the found objects, values:
+                the full string representation of each object
+        """
+        objects = {}
+        for id in id_list:
+            obj = self.get_object(id)
+            if obj is not None:
+                objects[id] = obj
+        return objects
+
     @abstractmethod
     def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
         """Checks the presence of multiple objects.
@@ -1,34 +1,93 @@
-from typing import Dict, List
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, Optional, Union
 
+from specklepy.serialization.codecs import (
+    Codec,
+    decode_from_storage,
+    encode_for_storage,
+    get_codec,
+)
 from specklepy.transports.abstract_transport import AbstractTransport
 
 
 class MemoryTransport(AbstractTransport):
-    def __init__(self, name="Memory") -> None:
+    def __init__(
+        self,
+        name="Memory",
+        codec: Union[str, Codec, None] = None,
+        max_size_mb: Optional[float] = None,
+    ) -> None:
+        """
+        Arguments:
+            codec {str | Codec} -- optional: how to store the objects
+            max_size_mb {float} -- optional: how large the stored objects may grow.
+            Past it, the least recently used objects are dropped
+        """
         super().__init__()
         self._name = name
-        self.objects = {}
+        self._codec = get_codec(codec)
+        self.max_bytes = None if max_size_mb is None else int(max_size_mb * 1e6)
+        self.objects = {} if self.max_bytes is None else OrderedDict()
         self.saved_object_count = 0
+        self._bytes = 0
+        self._lock = Lock()
 
     @property
     def name(self) -> str:
         return self._name
 
+    @property
+    def evicts(self) -> bool:
+        return self.max_bytes is not None
+
     def __repr__(self) -> str:
         return f"MemoryTransport(objects: {len(self.objects)})"
 
     def save_object(self, id: str, serialized_object: str) -> None:
-        self.objects[id] = serialized_object
+        stored_object = encode_for_storage(self._codec, serialized_object)
+        if self.max_bytes is None:
+            self.objects[id] = stored_object
+        else:
+            self.__put(id, stored_object)
 
         self.saved_object_count += 1
 
+    def __put(self, id: str, stored_object: Union[str, bytes]) -> None:
+        size = len(stored_object)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self.objects.pop(id, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self.objects[id] = stored_object
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self.objects.popitem(last=False)
+                self._bytes -= len(evicted)
+
     def save_object_from_transport(
         self, id: str, source_transport: AbstractTransport
     ) -> None:
         raise NotImplementedError
 
     def get_object(self, id: str) -> str or None:
-        return self.objects[id] if id in self.objects else None
+        if self.max_bytes is not None:
+            return self.get_objects([id]).get(id)
+        if id not in self.objects:
+            return None
+        return decode_from_storage(self._codec, self.objects[id])
+
+    def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        if self.max_bytes is None:
+            found = {id: self.objects[id] for id in id_list if id in self.objects}
+        else:
+            with self._lock:
+                found = {id: self.objects[id] for id in id_list if id in self.objects}
+                for id in found:
+                    self.objects.move_to_end(id)
+        return {id: decode_from_storage(self._codec, obj) for id, obj in found.items()}
 
     def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
         return {id: (id in self.objects) for id in id_list}
@@ -101,6 +101,10 @@ class ServerTransport(AbstractTransport):
     def name(self) -> str:
         return self._name
 
+    @property
+    def store_id(self) -> str:
+        return f"{self.url}/streams/{self.stream_id}"
+
     def begin_write(self) -> None:
         self.saved_obj_count = 0
 
@@ -131,6 +135,26 @@ class ServerTransport(AbstractTransport):
             NotImplementedError(),
         )
 
+    def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        endpoint = f"{self.url}/api/getobjects/{self.stream_id}"
+        r = self.session.post(
+            endpoint, data={"objects": json.dumps(id_list)}, stream=True
+        )
+        r.encoding = "utf-8"
+
+        if r.status_code != 200:
+            raise SpeckleException(
+                f"Can't get objects from stream {self.stream_id}: HTTP error"
+                f" {r.status_code} ({r.text[:1000]})"
+            )
+
+        objects = {}
+        for line in r.iter_lines(decode_unicode=True):
+            if line:
+                hash, obj = line.split("\t")
+                objects[hash] = obj
+        return objects
+
     def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
         return {id: False for id in id_list}
 
@@ -1,14 +1,48 @@
 import os
 import sqlite3
+import threading
+import time
+import weakref
 from contextlib import closing
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from specklepy.core.helpers import speckle_path_provider
 from specklepy.logging.exceptions import SpeckleException
+from specklepy.serialization.codecs import (
+    Codec,
+    Compressor,
+    compress_for_storage,
+    decode_from_storage,
+    decompress_from_storage,
+    encode_for_storage,
+    get_codec,
+    get_compressor,
+    get_storage_codec,
+)
 from specklepy.transports.abstract_transport import AbstractTransport
 
+# the store ids of the dbs this process made an `access` table in, whose objects
+# can be evicted
+_EVICTED_DBS: Set[str] = set()
+
+
+class _Reader:
+    """Holds the connection of a reading thread, closed once the thread ends"""
+
+    __slots__ = ("connection", "__weakref__")
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+
 
 class SQLiteTransport(AbstractTransport):
+    # stays below the host parameter limit of older sqlite versions
+    QUERY_BATCH_SIZE = 900
+    # the number of object accesses recorded at once, with a max size
+    ACCESS_BATCH_SIZE = 10000
+    # past its max size, the db is evicted down to this share of it
+    EVICTION_TARGET = 0.9
+
     def __init__(
         self,
         base_path: Optional[str] = None,
@@ -16,16 +50,51 @@ class SQLiteTransport(AbstractTransport):
         scope: Optional[str] = None,
         max_batch_size_mb: float = 10.0,
         name: str = "SQLite",
+        codec: Union[str, Codec, None] = None,
+        max_size_mb: Optional[float] = None,
+        compression: Union[str, Compressor, None] = None,
     ) -> None:
+        """
+        Arguments:
+            codec {str | Codec} -- optional: how to store the objects. Binary codecs
+            (eg: `msgpack`) are more compact. Objects are read back by any transport
+            on this version, whatever it stores with, but not by older versions
+            max_size_mb {float} -- optional: how large the stored objects may grow.
+            Past it, the least recently used objects are evicted in the background
+            compression {str | Compressor} -- optional: how to compress the objects
+            (`zlib` or `zstd`). Compressed objects are read back by any transport on
+            this version, whatever it compresses with, but not by older versions
+        """
         super().__init__()
         self._name = name
+        self._codec = get_codec(codec)
+        self._compressor = get_compressor(compression)
         self.app_name = app_name or "Speckle"
         self.scope = scope or "Objects"
         self._base_path = base_path or self.get_base_path(self.app_name)
         self.max_size = int(max_batch_size_mb * 1000 * 1000)
         self.saved_obj_count = 0
-        self._current_batch: List[Tuple[str, str]] = []
+        # the id, the stored object, and the compression and codec flags
+        self._current_batch: List[Tuple[str, Union[str, bytes], int, int]] = []
         self._current_batch_size = 0
+        self.max_bytes = None if max_size_mb is None else int(max_size_mb * 1e6)
+        self.hits = 0
+        self.misses = 0
+        # the access times and the sizes of the objects accessed since the access
+        # times were last saved
+        self._accessed: Dict[str, Tuple[int, int]] = {}
+        # the size of the stored objects, give or take the objects saved again
+        self._tracked_bytes = 0
+        self._evictor: Optional[threading.Thread] = None
+        # every reading thread gets a connection of its own, and writes go through
+        # a single connection, which any thread can use while holding the write lock
+        self._readers = threading.local()
+        # close the connections of the readers, which is done when their thread
+        # ends and its locals are dropped
+        self._reader_finalizers: List[weakref.finalize] = []
+        self._write_lock = threading.RLock()
+        self._count_lock = threading.Lock()
+        self.__connection: Optional[sqlite3.Connection] = None
 
         try:
             os.makedirs(self._base_path, exist_ok=True)
@@ -49,6 +118,16 @@ class SQLiteTransport(AbstractTransport):
     def name(self) -> str:
         return self._name
 
+    @property
+    def store_id(self) -> str:
+        return f"sqlite:{os.path.abspath(self._root_path)}"
+
+    @property
+    def evicts(self) -> bool:
+        # objects saved here can be evicted by another transport with a max size,
+        # which is only known from this process once the db is initialised
+        return self._evicts or self.store_id in _EVICTED_DBS
+
     @staticmethod
     def get_base_path(app_name):
         return str(
@@ -78,26 +157,34 @@ class SQLiteTransport(AbstractTransport):
             id {str} -- the object id
             serialized_object {str} -- the full string representation of the object
         """
-        obj_size = len(serialized_object)
-        if (
-            not self._current_batch
-            or self._current_batch_size + obj_size < self.max_size
-        ):
-            self._current_batch.append((id, serialized_object))
-            self._current_batch_size += obj_size
-            return
+        stored_object, flag = compress_for_storage(
+            self._compressor, encode_for_storage(self._codec, serialized_object)
+        )
+        obj_size = len(stored_object)
+        with self._write_lock:
+            if self.max_bytes is not None:
+                self._tracked_bytes += obj_size
+                self.__record_access(id, obj_size)
+                self.__flush_full_access()
+            if (
+                not self._current_batch
+                or self._current_batch_size + obj_size < self.max_size
+            ):
+                self._current_batch.append((id, stored_object, flag, self._codec.flag))
+                self._current_batch_size += obj_size
+                return
 
-        self.save_current_batch()
-        self._current_batch = [(id, serialized_object)]
-        self._current_batch_size = obj_size
+            self.save_current_batch()
+            self._current_batch = [(id, stored_object, flag, self._codec.flag)]
+            self._current_batch_size = obj_size
 
     def save_current_batch(self) -> None:
         """Save the current batch of objects to the local db"""
-        self.__check_connection()
         try:
-            with closing(self.__connection.cursor()) as c:
+            with self._write_lock, closing(self.__writer().cursor()) as c:
                 c.executemany(
-                    "INSERT OR IGNORE INTO objects(hash, content) VALUES(?,?)",
+                    "INSERT OR IGNORE INTO objects(hash, content, compression, codec)"
+                    " VALUES(?,?,?,?)",
                     self._current_batch,
                 )
                 self.__connection.commit()
@@ -109,33 +196,209 @@ class SQLiteTransport(AbstractTransport):
             )
 
     def get_object(self, id: str) -> str or None:
-        self.__check_connection()
-        with closing(self.__connection.cursor()) as c:
+        with closing(self.__reader().cursor()) as c:
             row = c.execute(
-                "SELECT * FROM objects WHERE hash = ? LIMIT 1", (id,)
+                "SELECT content, compression, codec FROM objects"
+                " WHERE hash = ? LIMIT 1",
+                (id,),
             ).fetchone()
-        return row[1] if row else None
+        if not row:
+            self.__count(0, 1)
+            return None
+        self.__count(1, 0)
+        self.__record_access(id, len(row[0]))
+        self.__flush_full_access()
+        return self.__decode(*row)
+
+    def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        """Gets multiple objects, selecting them in batches of ids
+
+        Arguments:
+            id_list -- List of object ids to get
+
+        Returns:
+            Dict[str, str] -- keys: the ids of the found objects, values:
+                the full string representation of each object
+        """
+        objects = {}
+        rows = self.__select_batches("hash, content, compression, codec", id_list)
+        for id, content, compression, codec in rows:
+            self.__record_access(id, len(content))
+            objects[id] = self.__decode(content, compression, codec)
+        self.__flush_full_access()
+        self.__count(len(objects), len(id_list) - len(objects))
+        return objects
 
     def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
-        ret = {}
-        self.__check_connection()
-        with closing(self.__connection.cursor()) as c:
-            for id in id_list:
-                row = c.execute(
-                    "SELECT 1 FROM objects WHERE hash = ? LIMIT 1", (id,)
-                ).fetchone()
-                ret[id] = bool(row)
-        return ret
+        """Checks which of the given objects are in the db, in batches of ids
+
+        Arguments:
+            id_list -- List of object ids to check
+
+        Returns:
+            Dict[str, bool] -- keys: the given ids, values: whether each is found
+        """
+        found = {id for id, in self.__select_batches("hash", id_list)}
+        return {id: id in found for id in id_list}
+
+    def __count(self, hits: int, misses: int) -> None:
+        with self._count_lock:
+            self.hits += hits
+            self.misses += misses
+
+    def __decode(self, content: Union[str, bytes], compression: int, codec: int) -> str:
+        stored_codec = self.__storage_codec(codec)
+        content = decompress_from_storage(compression, content, stored_codec.binary)
+        return decode_from_storage(stored_codec, content)
+
+    def __storage_codec(self, flag: int) -> Codec:
+        """The codec objects were stored with, which is usually this transport's"""
+        return self._codec if flag == self._codec.flag else get_storage_codec(flag)
+
+    def __select_batches(self, columns: str, id_list: List[str]) -> Iterator[tuple]:
+        """Selects the rows of the given ids, with one statement per batch of ids"""
+        # sorted, the ids of a batch are looked up in neighbouring pages of the index
+        ids = sorted(set(id_list))
+        with closing(self.__reader().cursor()) as c:
+            for start in range(0, len(ids), self.QUERY_BATCH_SIZE):
+                batch = ids[start : start + self.QUERY_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                yield from c.execute(
+                    f"SELECT {columns} FROM objects WHERE hash IN ({placeholders})",
+                    batch,
+                )
 
     def begin_write(self):
         self._object_cache = []
         self.saved_obj_count = 0
 
     def end_write(self):
-        if self._current_batch:
-            self.save_current_batch()
-        self._current_batch = []
-        self._current_batch_size = 0
+        with self._write_lock:
+            if self._current_batch:
+                self.save_current_batch()
+            self._current_batch = []
+            self._current_batch_size = 0
+            if self.max_bytes is not None and self._tracked_bytes > self.max_bytes:
+                self.__evict_in_background()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Gets the number and the size of the stored objects, and the hits and misses
+        of the objects read through this transport. Checking which objects are
+        stored doesn't count.
+
+        NOTE: this reads through the whole db
+
+        Returns:
+            dict -- keys: `objects`, `bytes`, `max_bytes`, `hits`, `misses` and
+            `hit_rate`
+        """
+        with closing(self.__reader().cursor()) as c:
+            objects, size = c.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length(content)), 0) FROM objects"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "objects": objects,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def evict(self) -> int:
+        """
+        Evicts the least recently used objects until the stored objects take no more
+        than `EVICTION_TARGET` of the max size. This happens in the background when
+        writes take the db past its max size.
+
+        Returns:
+            int -- the number of evicted objects
+        """
+        if self.max_bytes is None:
+            return 0
+        if self._evictor is not None:
+            self._evictor.join()
+        self.__flush_access()
+        return self.__evict()
+
+    def __record_access(self, id: str, size: int) -> None:
+        if self.max_bytes is None:
+            return
+        self._accessed[id] = (time.time_ns(), size)
+
+    def __flush_full_access(self) -> None:
+        # flushing is put off while the db is being evicted, rather than waiting on
+        # its writes
+        if len(self._accessed) >= self.ACCESS_BATCH_SIZE and not (
+            self._evictor is not None and self._evictor.is_alive()
+        ):
+            self.__flush_access()
+
+    def __flush_access(self) -> None:
+        """Saves the access times of the objects accessed since the last flush"""
+        with self._write_lock:
+            if not self._accessed:
+                return
+            # reading threads may still record accesses in the swapped out dict,
+            # and those are lost, which only makes eviction a little less precise
+            accessed, self._accessed = self._accessed, {}
+            rows = [(id, used, size) for id, (used, size) in accessed.items()]
+            with closing(self.__writer().cursor()) as c:
+                c.executemany(
+                    "INSERT INTO access(hash, used, size) VALUES(?,?,?)"
+                    " ON CONFLICT(hash) DO UPDATE SET used = excluded.used",
+                    rows,
+                )
+                self.__connection.commit()
+
+    def __evict_in_background(self) -> None:
+        if self._evictor is not None and self._evictor.is_alive():
+            return
+        self.__flush_access()
+        self._evictor = threading.Thread(target=self.__evict, daemon=True)
+        self._evictor.start()
+
+    def __evict(self) -> int:
+        # the eviction runs alongside the writes, so it needs its own connection
+        with closing(self.__connect()) as connection:
+            # the db is a cache, so a power loss may undo the last evictions
+            connection.execute("PRAGMA synchronous=NORMAL;")
+            # objects saved by transports without a max size have no access time
+            connection.execute(
+                "INSERT OR IGNORE INTO access(hash, used, size)"
+                " SELECT hash, 0, length(content) FROM objects"
+                " WHERE hash NOT IN (SELECT hash FROM access)"
+            )
+            # the objects saved while evicting are tracked on top of the total
+            with self._write_lock:
+                tracked = self._tracked_bytes
+                total = connection.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM access"
+                ).fetchone()[0]
+            target = self.max_bytes * self.EVICTION_TARGET
+            evicted = 0
+            while total > target:
+                rows = connection.execute(
+                    "SELECT hash, size FROM access ORDER BY used LIMIT ?",
+                    (self.QUERY_BATCH_SIZE,),
+                ).fetchall()
+                if not rows:
+                    break
+                victims = []
+                for id, size in rows:
+                    if total <= target:
+                        break
+                    victims.append((id,))
+                    total -= size
+                connection.executemany("DELETE FROM objects WHERE hash = ?", victims)
+                connection.executemany("DELETE FROM access WHERE hash = ?", victims)
+                connection.commit()
+                evicted += len(victims)
+        with self._write_lock:
+            self._tracked_bytes += total - tracked
+        return evicted
 
     def copy_object_and_children(
         self, id: str, target_transport: AbstractTransport
@@ -144,37 +407,111 @@ class SQLiteTransport(AbstractTransport):
 
     def get_all_objects(self):
         """
-        Returns all the objects in the store.
+        Returns all the objects in the store, as they are stored but decompressed.
         NOTE: do not use for large collections!
         """
-        self.__check_connection()
-        with closing(self.__connection.cursor()) as c:
-            rows = c.execute("SELECT * FROM objects").fetchall()
-        return rows
+        with closing(self.__reader().cursor()) as c:
+            rows = c.execute("SELECT hash, content, compression, codec FROM objects")
+            return [
+                (
+                    id,
+                    decompress_from_storage(
+                        compression, content, self.__storage_codec(codec).binary
+                    ),
+                )
+                for id, content, compression, codec in rows
+            ]
 
     def close(self):
-        """Close the connection to the database"""
-        if self.__connection:
-            self.__connection.close()
-            self.__connection = None
+        """Close the connections to the database, once no thread is using them"""
+        if self._evictor is not None:
+            self._evictor.join()
+            self._evictor = None
+        with self._write_lock:
+            if self.__connection:
+                if self._accessed:
+                    self.__flush_access()
+                self.__connection.close()
+                self.__connection = None
+            for finalizer in self._reader_finalizers:
+                finalizer()
+            self._reader_finalizers = []
+            self._readers = threading.local()
+
+    def __connect(self) -> sqlite3.Connection:
+        # connections are closed by `close`, or by the finalizer of a reader, from
+        # whichever thread calls them
+        connection = sqlite3.connect(self._root_path, check_same_thread=False)
+        connection.execute("PRAGMA temp_store=MEMORY;")
+        return connection
+
+    def __reader(self) -> sqlite3.Connection:
+        """Gets the connection of the calling thread, opening it on its first read"""
+        reader = getattr(self._readers, "reader", None)
+        if reader is None:
+            reader = self._readers.reader = _Reader(self.__connect())
+            finalizer = weakref.finalize(reader, reader.connection.close)
+            with self._write_lock:
+                self._reader_finalizers = [
+                    f for f in self._reader_finalizers if f.alive
+                ] + [finalizer]
+        return reader.connection
+
+    def __writer(self) -> sqlite3.Connection:
+        """Gets the connection for writes, which are made holding the write lock"""
+        if not self.__connection:
+            self.__connection = self.__connect()
+        return self.__connection
 
     def __initialise(self) -> None:
-        self.__connection = sqlite3.connect(self._root_path)
-        with closing(self.__connection.cursor()) as c:
+        with closing(self.__writer().cursor()) as c:
             c.execute(
                 """ CREATE TABLE IF NOT EXISTS objects(
                       hash TEXT PRIMARY KEY,
-                      content TEXT
+                      content TEXT,
+                      compression INTEGER NOT NULL DEFAULT 0,
+                      codec INTEGER NOT NULL DEFAULT 0
                     ) WITHOUT ROWID;"""
             )
+            columns = {row[1] for row in c.execute("PRAGMA table_info(objects);")}
+            # dbs made by older versions only hold uncompressed json objects, while
+            # dbs made before the codec was stored only hold objects of one codec.
+            # Those are read as json, as binary codecs could not be read back before
+            for column in ("compression", "codec"):
+                if column in columns:
+                    continue
+                try:
+                    c.execute(
+                        f"ALTER TABLE objects"
+                        f" ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0;"
+                    )
+                except sqlite3.OperationalError as ex:
+                    # added by another transport in the meantime
+                    if "duplicate column" not in str(ex):
+                        raise
+            self._evicts = self.max_bytes is not None or bool(
+                c.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table'"
+                    " AND name = 'access'"
+                ).fetchone()
+            )
+            if self.max_bytes is not None:
+                _EVICTED_DBS.add(self.store_id)
+                # the last access time of each object, in nanoseconds
+                c.execute(
+                    """ CREATE TABLE IF NOT EXISTS access(
+                          hash TEXT PRIMARY KEY,
+                          used INTEGER NOT NULL,
+                          size INTEGER NOT NULL
+                        ) WITHOUT ROWID;"""
+                )
+                c.execute("CREATE INDEX IF NOT EXISTS access_used ON access(used);")
+                self._tracked_bytes = c.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM access"
+                ).fetchone()[0]
             c.execute("PRAGMA journal_mode='wal';")
             c.execute("PRAGMA count_changes=OFF;")
-            c.execute("PRAGMA temp_store=MEMORY;")
             self.__connection.commit()
 
-    def __check_connection(self):
-        if not self.__connection:
-            self.__connection = sqlite3.connect(self._root_path)
-
     def __del__(self):
         self.close()
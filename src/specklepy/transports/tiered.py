@@ -0,0 +1,216 @@
+from queue import Empty, Queue
+from threading import Lock, Thread
+from typing import Dict, List, Optional, Tuple
+
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.serialization.base_object_serializer import safe_json_loads
+from specklepy.transports.abstract_transport import AbstractTransport
+
+
+class TieredTransport(AbstractTransport):
+    """
+    Stacks transports from the fastest to the slowest, eg: a bounded
+    `MemoryTransport`, then a `SQLiteTransport`, then a `ServerTransport`.
+
+    Reads fall through the tiers in order, and the objects found in a slower tier
+    are saved to the faster ones. Writes are saved to the fastest tier straight
+    away, and to the slower tiers by a background thread. Call `flush` to wait for
+    them, eg: before creating a version from the sent objects.
+
+    ```py
+    cache = TieredTransport([MemoryTransport(max_size_mb=500), SQLiteTransport()])
+    # every receive without a local transport now goes through the cache
+    operations.set_default_cache(cache)
+    ```
+    """
+
+    # the most objects written to the slower tiers at once
+    FLUSH_BATCH_SIZE = 10000
+
+    def __init__(self, tiers: List[AbstractTransport], name: str = "Tiered") -> None:
+        super().__init__()
+        if not tiers:
+            raise SpeckleException("A TieredTransport needs at least one tier")
+        self._name = name
+        self.tiers = list(tiers)
+        # the objects to write to the slower tiers, with the index of the tier
+        # to stop before
+        self._queue: "Queue[Optional[Tuple[str, str, int]]]" = Queue()
+        # the queued objects, which can be read back until they are written
+        self._pending: Dict[str, str] = {}
+        self._lock = Lock()
+        self._error: Optional[Exception] = None
+        self._flusher: Optional[Thread] = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def evicts(self) -> bool:
+        # objects are only saved to the tiers faster than the one they're found in
+        return any(tier.evicts for tier in self.tiers)
+
+    def __repr__(self) -> str:
+        return f"TieredTransport(tiers: {self.tiers})"
+
+    def begin_write(self) -> None:
+        self.tiers[0].begin_write()
+
+    def end_write(self) -> None:
+        self.tiers[0].end_write()
+
+    def save_object(self, id: str, serialized_object: str) -> None:
+        self.tiers[0].save_object(id, serialized_object)
+        self.__queue(id, serialized_object, len(self.tiers))
+
+    def save_object_from_transport(
+        self, id: str, source_transport: AbstractTransport
+    ) -> None:
+        self.save_object(id, source_transport.get_object(id))
+
+    def get_object(self, id: str) -> Optional[str]:
+        # server transports can only get objects in bulk
+        return self.get_objects([id]).get(id)
+
+    def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        objects = {}
+        missing = list(dict.fromkeys(id_list))
+        for index, tier in enumerate(self.tiers):
+            if index == 1:
+                found = self.__get_pending(missing)
+                if found:
+                    self.__populate(found, 1)
+                    objects.update(found)
+                    missing = [id for id in missing if id not in found]
+            if not missing:
+                break
+            found = tier.get_objects(missing)
+            if found:
+                if index:
+                    self.__populate(found, index)
+                objects.update(found)
+                missing = [id for id in missing if id not in found]
+        return objects
+
+    def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
+        found = dict.fromkeys(id_list, False)
+        missing = list(found)
+        for index, tier in enumerate(self.tiers):
+            if index == 1:
+                with self._lock:
+                    missing = [id for id in missing if id not in self._pending]
+            if not missing:
+                break
+            has = tier.has_objects(missing)
+            missing = [id for id in missing if not has.get(id)]
+        missing = set(missing)
+        return {id: id not in missing for id in found}
+
+    def copy_object_and_children(
+        self, id: str, target_transport: AbstractTransport
+    ) -> str:
+        root = self.get_object(id)
+        if root is None:
+            raise SpeckleException(f"Could not find the object {id} in any tier")
+        children = list(safe_json_loads(root, id).get("__closure", {}))
+        found = target_transport.has_objects(children)
+        objects = self.get_objects(
+            [child for child in children if not found.get(child)]
+        )
+
+        target_transport.begin_write()
+        for child_id, obj in objects.items():
+            target_transport.save_object(child_id, obj)
+        target_transport.save_object(id, root)
+        target_transport.end_write()
+
+        return root
+
+    def flush(self) -> None:
+        """Waits for the objects saved to the fastest tier to be written to the
+        slower ones, raising the first error met writing them"""
+        self._queue.join()
+        error, self._error = self._error, None
+        if error is not None:
+            raise SpeckleException(
+                f"Could not write objects to the slower tiers: {error}", error
+            )
+
+    def close(self) -> None:
+        """Flushes the writes and closes the tiers which can be closed"""
+        try:
+            self.flush()
+        finally:
+            if self._flusher is not None:
+                self._queue.put(None)
+                self._flusher.join()
+                self._flusher = None
+            for tier in self.tiers:
+                if hasattr(tier, "close"):
+                    tier.close()
+
+    def __get_pending(self, id_list: List[str]) -> Dict[str, str]:
+        with self._lock:
+            return {id: self._pending[id] for id in id_list if id in self._pending}
+
+    def __populate(self, objects: Dict[str, str], index: int) -> None:
+        """Saves the objects read from the tier at the given index to the faster
+        tiers"""
+        fastest = self.tiers[0]
+        fastest.begin_write()
+        for id, obj in objects.items():
+            fastest.save_object(id, obj)
+            self.__queue(id, obj, index)
+        fastest.end_write()
+
+    def __queue(self, id: str, serialized_object: str, stop: int) -> None:
+        if stop < 2:
+            return
+        with self._lock:
+            self._pending[id] = serialized_object
+            if self._flusher is None:
+                self._flusher = Thread(target=self.__flush_queued, daemon=True)
+                self._flusher.start()
+        self._queue.put((id, serialized_object, stop))
+
+    def __flush_queued(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            batch = [item]
+            while len(batch) < self.FLUSH_BATCH_SIZE:
+                try:
+                    item = self._queue.get_nowait()
+                except Empty:
+                    break
+                if item is None:
+                    # picked up again once this batch is written
+                    self._queue.task_done()
+                    self._queue.put(None)
+                    break
+                batch.append(item)
+            try:
+                self.__write_batch(batch)
+            except Exception as ex:
+                if self._error is None:
+                    self._error = ex
+            finally:
+                with self._lock:
+                    for id, _, _ in batch:
+                        self._pending.pop(id, None)
+                for _ in batch:
+                    self._queue.task_done()
+
+    def __write_batch(self, batch: List[Tuple[str, str, int]]) -> None:
+        for index in range(1, len(self.tiers)):
+            objects = [(id, obj) for id, obj, stop in batch if index < stop]
+            if not objects:
+                continue
+            tier = self.tiers[index]
+            tier.begin_write()
+            for id, obj in objects:
+                tier.save_object(id, obj)
+            tier.end_write()
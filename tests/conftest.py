@@ -1,8 +1,12 @@
 import random
+from typing import Dict, List
 
 import pytest
 
 from specklepy.objects.base import Base
+from specklepy.objects.geometry import Mesh, Point
+from specklepy.objects.other import Collection
+from specklepy.transports.memory import MemoryTransport
 
 
 @pytest.fixture(scope="session")
@@ -19,3 +23,40 @@ def base():
     base["@detach"] = Base(name="detached base")
     base["@revit_thing"] = Base.of_type("SpecialRevitFamily", name="secret tho")
     return base
+
+
+class CountingTransport(MemoryTransport):
+    """Records the ids of the objects read from it, and the calls reading them"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.read_ids: List[str] = []
+        self.get_object_calls = 0
+        self.get_objects_calls = 0
+
+    def get_object(self, id: str) -> str or None:
+        self.read_ids.append(id)
+        self.get_object_calls += 1
+        return super().get_object(id)
+
+    def get_objects(self, id_list: List[str]) -> Dict[str, str]:
+        self.read_ids.extend(id_list)
+        self.get_objects_calls += 1
+        return super().get_objects(id_list)
+
+
+@pytest.fixture()
+def model() -> Collection:
+    shared = Point(x=1, y=2, z=3)
+    elements = []
+    for i in range(10):
+        element = Base(name=f"element {i}")
+        element["@location"] = Point(x=i, y=i * 2)
+        element["@shared"] = shared
+        element["@Data"] = Base(ListOfUnitFunctions=["living", i], area=i * 2.5)
+        element["@displayValue"] = [
+            Mesh(vertices=[0.0, 1.0, float(i)] * 3, faces=[3, 0, 1, 2])
+        ]
+        element.tags = ["a", {"b": i}]
+        elements.append(element)
+    return Collection(name="model", collectionType="model", elements=elements)
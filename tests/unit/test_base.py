@@ -171,3 +171,69 @@ def test_cached_deserialization() -> None:
     deserialized = operations.deserialize(serialized)
 
     assert deserialized["a"]["@material"] is deserialized["b"]["@material"]
+
+
+class Door(Base, serialize_ignore={"handle"}):
+    width: Optional[float] = None
+    height: float = 2.1
+    handle: Optional[str] = None
+    _frame: Optional[str] = None
+
+    @property
+    def area(self) -> Optional[float]:
+        return None if self.width is None else self.width * self.height
+
+    @property
+    def opener(self):
+        return print
+
+    def open(self) -> None:
+        pass
+
+
+def test_member_names() -> None:
+    door = Door(width=0.9, handle="lever", _frame="steel")
+    door["@hinges"] = [Base(), Base()]
+    door.on_close = print
+
+    assert door.get_member_names() == [
+        "@hinges",
+        "applicationId",
+        "area",
+        "handle",
+        "height",
+        "id",
+        "speckle_type",
+        "totalChildrenCount",
+        "units",
+        "width",
+    ]
+    assert "handle" not in door.get_serializable_attributes()
+
+
+def test_stats() -> None:
+    material = Base(color="blue")
+    door = Door(width=0.9)
+    door["@material"] = material
+    wall = Base(name="wall", openings=[door, {"frame": Base(), "material": material}])
+    wall["@material"] = material
+    root = Base(name="root")
+    root["@elements"] = [wall, door]
+
+    stats = root.stats()
+    serialized_size = len(operations.serialize(root))
+
+    assert stats["descendants"] == 4
+    assert root.get_children_count() == 5
+    assert stats["speckle_types"] == {"Base": 4, door.speckle_type: 1}
+    assert stats["max_depth"] == 2
+    assert 0.5 < stats["estimated_size"] / serialized_size < 2
+
+
+def test_stats_of_nested_objects() -> None:
+    leaf = Base(name="leaf")
+    root = Base(child=Base(child=Base(children=[leaf])))
+
+    assert root.stats()["max_depth"] == 3
+    assert leaf.stats()["max_depth"] == 0
+    assert leaf.stats()["descendants"] == 0
@@ -0,0 +1,112 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+from typing import Dict
+
+from specklepy.core.api import operations
+from specklepy.objects.other import Collection
+from specklepy.transports.sqlite import SQLiteTransport
+from tests.conftest import CountingTransport
+
+
+def test_receive_reads_children_in_bulk(model: Collection):
+    transport = CountingTransport()
+    obj_id = operations.send(model, [transport], False)
+
+    received = operations.receive(obj_id, local_transport=transport)
+
+    assert received.get_id(decompose=True) == obj_id
+    # only the root object is read on its own
+    assert transport.get_object_calls == 1
+    assert transport.get_objects_calls == 1
+
+
+def test_receive_recomposes_shared_children_once(model: Collection):
+    transport = CountingTransport()
+    obj_id = operations.send(model, [transport], False)
+
+    received = operations.receive(obj_id, local_transport=transport)
+
+    assert received.elements[0]["@shared"] is received.elements[9]["@shared"]
+    assert received.elements[0]["@location"] is not received.elements[1]["@location"]
+
+
+def test_sqlite_get_objects(tmp_path):
+    transport = SQLiteTransport(base_path=str(tmp_path))
+    objects = {f"{i:032x}": f'{{"id":"{i:032x}"}}' for i in range(2000)}
+    transport.begin_write()
+    for id, obj in objects.items():
+        transport.save_object(id, obj)
+    transport.end_write()
+
+    ids = list(objects) + ["missing"]
+    found = transport.get_objects(ids)
+    transport.close()
+
+    assert found == objects
+
+
+def test_sqlite_has_objects(tmp_path):
+    transport = SQLiteTransport(base_path=str(tmp_path))
+    transport.begin_write()
+    for i in range(0, 2000, 2):
+        transport.save_object(f"{i:032x}", f'{{"id":"{i:032x}"}}')
+    transport.end_write()
+
+    ids = [f"{i:032x}" for i in reversed(range(2000))] + ["missing", f"{0:032x}"]
+    found = transport.has_objects(ids)
+    transport.close()
+
+    assert list(found) == ids[:-1]
+    assert [id for id, has in found.items() if has] == ids[1:2000:2]
+    assert not found["missing"]
+
+
+def test_sqlite_reads_from_many_threads(tmp_path):
+    transport = SQLiteTransport(base_path=str(tmp_path), max_batch_size_mb=0.01)
+    objects = {f"{i:032x}": f'{{"id":"{i:032x}"}}' for i in range(4000)}
+    ids = list(objects)
+    transport.begin_write()
+    for id in ids[:2000]:
+        transport.save_object(id, objects[id])
+    transport.end_write()
+
+    def write() -> None:
+        transport.begin_write()
+        for id in ids[2000:]:
+            transport.save_object(id, objects[id])
+        transport.end_write()
+
+    def read(start: int) -> Dict[str, str]:
+        found = transport.get_objects(ids[start : start + 500])
+        found.update((id, transport.get_object(id)) for id in ids[start : start + 50])
+        return found
+
+    with ThreadPoolExecutor(4) as pool:
+        writing = pool.submit(write)
+        reads = list(pool.map(read, range(0, 2000, 100)))
+        writing.result()
+
+    assert all(found == {id: objects[id] for id in found} for found in reads)
+    assert all(len(found) == 500 for found in reads)
+    assert transport.get_objects(ids) == objects
+    assert transport.stats()["hits"] == 20 * 550 + 4000
+    transport.close()
+    assert transport.get_object(ids[0]) == objects[ids[0]]
+    transport.close()
+
+
+def test_sqlite_closes_the_connections_of_ended_threads(tmp_path):
+    transport = SQLiteTransport(base_path=str(tmp_path))
+    transport.save_object("a", '{"id":"a"}')
+    transport.end_write()
+
+    for _ in range(50):
+        # a new thread for every read, like a streamlit rerun
+        thread = Thread(target=transport.get_object, args=("a",))
+        thread.start()
+        thread.join()
+
+    assert len(transport._reader_finalizers) == 1
+    assert not any(finalizer.alive for finalizer in transport._reader_finalizers)
+    assert transport.get_object("a") == '{"id":"a"}'
+    transport.close()
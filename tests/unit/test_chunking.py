@@ -0,0 +1,51 @@
+from array import array
+
+import pytest
+
+from specklepy.core.api import operations
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Mesh
+from specklepy.serialization.base_object_serializer import _chunk_slices
+from specklepy.transports.memory import MemoryTransport
+
+
+@pytest.mark.parametrize(
+    "value",
+    [list(range(7)), tuple(range(7)), array("q", range(7)), range(7)],
+    ids=["list", "tuple", "array", "iterable"],
+)
+def test_chunk_slices(value):
+    assert _chunk_slices(value, 3) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_chunk_slices_of_empty_value():
+    assert _chunk_slices([], 3) == [[]]
+
+
+def test_chunked_round_trip():
+    mesh = Mesh(vertices=[i / 3 for i in range(4500)], faces=list(range(2001)))
+    mesh["@(100)colours"] = [1] * 250
+    mesh["@(100)empty"] = []
+    transport = MemoryTransport()
+
+    obj_id = operations.send(mesh, [transport], False)
+    received = operations.receive(obj_id, local_transport=transport)
+
+    assert received.get_id(decompose=True) == obj_id
+    assert received.vertices == mesh.vertices
+    assert received.faces == mesh.faces
+    assert received["@(100)colours"] == [1] * 250
+    assert received["@(100)empty"] == []
+    assert "@(100)colours" not in Mesh._chunkable
+
+
+def test_arrays_are_chunked_like_lists():
+    np = pytest.importorskip("numpy")
+    values = [i * 0.25 for i in range(5000)]
+    ids = []
+    for chunked in (values, array("d", values), np.array(values)):
+        base = Base()
+        base["@(1000)values"] = chunked
+        ids.append(operations.send(base, [MemoryTransport()], False))
+
+    assert ids[0] == ids[1] == ids[2]
@@ -0,0 +1,218 @@
+import sqlite3
+import zlib
+from typing import Any, Optional, Union
+
+import pytest
+
+from specklepy.core.api import operations
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Mesh
+from specklepy.serialization import codecs
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.serialization.codecs import (
+    JSON,
+    Codec,
+    compress_for_storage,
+    get_codec,
+    get_compressor,
+    get_storage_codec,
+)
+from specklepy.transports.memory import MemoryTransport
+from specklepy.transports.sqlite import SQLiteTransport
+
+
+class ZlibCodec(Codec):
+    name = "zlib"
+    binary = True
+    flag = 100
+
+    def dumps(self, obj: Any) -> bytes:
+        return zlib.compress(JSON.dumps(obj).encode())
+
+    def loads(self, data: Union[str, bytes], obj_id: Optional[str] = None) -> Any:
+        return JSON.loads(zlib.decompress(data))
+
+
+@pytest.fixture()
+def model() -> Base:
+    model = Base(name="model", big=2**70)
+    model["@displayValue"] = [
+        Mesh(vertices=[0.1, 1.5, float(i)] * 10, faces=[3, 0, 1, 2]) for i in range(5)
+    ]
+    return model
+
+
+def test_get_codec():
+    assert get_codec() is JSON
+    assert get_codec("ujson") is JSON
+    with pytest.raises(SpeckleException):
+        get_codec("yaml")
+
+
+@pytest.mark.parametrize("codec", ["ujson", "orjson", "msgpack"])
+def test_codec_round_trip(codec: str):
+    pytest.importorskip(codec)
+    codec = get_codec(codec)
+    obj = {"id": "abc", "floats": [0.1, 1e-300, -2.5], "nested": {"ints": [1, -2]}}
+
+    assert codec.loads(codec.dumps(obj)) == obj
+
+
+@pytest.mark.parametrize("codec", ["ujson", "orjson"])
+def test_json_codecs_keep_big_ints(codec: str):
+    pytest.importorskip(codec)
+    codec = get_codec(codec)
+
+    assert codec.loads('{"big":18446744073709551616}') == {"big": 2**64}
+    assert codec.loads(codec.dumps({"big": -(2**70)})) == {"big": -(2**70)}
+
+
+def test_deserialize_with_orjson(model: Base):
+    pytest.importorskip("orjson")
+    transport = MemoryTransport()
+    obj_id = operations.send(model, [transport], False)
+
+    serializer = BaseObjectSerializer(read_transport=transport, codec="orjson")
+    received = serializer.read_json(transport.get_object(obj_id))
+
+    assert received.get_id(decompose=True) == obj_id
+    assert received.big == 2**70
+
+
+def test_orjson_only_falls_back_for_big_numbers(monkeypatch):
+    pytest.importorskip("orjson")
+    fallbacks = []
+
+    class SpyCodec(codecs.JsonCodec):
+        def loads(self, data: Union[str, bytes], obj_id: Optional[str] = None) -> Any:
+            fallbacks.append(data)
+            return super().loads(data, obj_id)
+
+    monkeypatch.setattr(codecs, "JSON", SpyCodec())
+    orjson = get_codec("orjson")
+    ids = {
+        "id": "1234567890123456789012345678901234567890",
+        "referencedId": "a1234567890123456789012345678901",
+        "__closure": {"98765432109876543210987654321098": 1},
+        "values": [1.5, -12345678, 123456789012345678],
+    }
+
+    assert orjson.loads(orjson.dumps(ids)) == ids
+    assert not fallbacks
+    for big in ('{"a":12345678901234567890}', '{"a": [1, -9223372036854775809]}'):
+        assert orjson.loads(big) == SpyCodec().loads(big)
+    assert len(fallbacks) == 4
+
+
+def test_serializer_rejects_binary_codecs():
+    with pytest.raises(SpeckleException):
+        BaseObjectSerializer(codec=ZlibCodec())
+
+
+def test_transports_store_with_binary_codecs(model: Base, tmp_path):
+    memory = MemoryTransport(codec=ZlibCodec())
+    sqlite = SQLiteTransport(base_path=str(tmp_path), codec=ZlibCodec())
+    plain = MemoryTransport()
+    obj_id = operations.send(model, [memory, sqlite, plain], False)
+
+    assert all(isinstance(obj, bytes) for obj in memory.objects.values())
+    assert memory.get_objects(list(plain.objects)) == plain.objects
+    assert sqlite.get_objects(list(plain.objects)) == plain.objects
+    received = operations.receive(obj_id, local_transport=sqlite)
+    sqlite.close()
+
+    assert received.get_id(decompose=True) == obj_id
+
+
+@pytest.mark.parametrize("compression", ["zlib", "zstd"])
+def test_sqlite_compression(model: Base, tmp_path, compression: str):
+    pytest.importorskip(compression if compression == "zlib" else "zstandard")
+    sqlite = SQLiteTransport(base_path=str(tmp_path), compression=compression)
+    plain = MemoryTransport()
+    obj_id = operations.send(model, [sqlite, plain], False)
+
+    assert sqlite.get_objects(list(plain.objects)) == plain.objects
+    assert all(sqlite.get_object(id) == obj for id, obj in plain.objects.items())
+    received = operations.receive(obj_id, local_transport=sqlite)
+    sqlite.close()
+
+    assert received.get_id(decompose=True) == obj_id
+    with sqlite3.connect(tmp_path / "Objects.db") as connection:
+        flags = dict(connection.execute("SELECT hash, compression FROM objects"))
+    assert flags[obj_id] == get_compressor(compression).flag
+
+
+def test_compression_keeps_incompressible_objects():
+    compressor = get_compressor("zlib")
+
+    assert compress_for_storage(compressor, '{"id":"a"}') == ('{"id":"a"}', 0)
+    assert compress_for_storage(None, "x" * 100) == ("x" * 100, 0)
+    compressed, flag = compress_for_storage(compressor, "x" * 100)
+    assert flag == 1 and zlib.decompress(compressed) == b"x" * 100
+    with pytest.raises(SpeckleException):
+        get_compressor("lzma")
+
+
+def test_sqlite_compression_reads_older_dbs(model: Base, tmp_path):
+    transport = MemoryTransport()
+    obj_id = operations.send(model, [transport], False)
+    with sqlite3.connect(tmp_path / "Objects.db") as connection:
+        connection.execute(
+            "CREATE TABLE objects(hash TEXT PRIMARY KEY, content TEXT) WITHOUT ROWID"
+        )
+        connection.execute(
+            "INSERT INTO objects VALUES(?,?)", (obj_id, transport.objects[obj_id])
+        )
+
+    compressed = SQLiteTransport(base_path=str(tmp_path), compression="zlib")
+    compressed.begin_write()
+    for id, obj in transport.objects.items():
+        compressed.save_object(id, obj)
+    compressed.end_write()
+    compressed.close()
+
+    # the object already stored stays uncompressed, and the others are read back
+    # by transports without compression
+    sqlite = SQLiteTransport(base_path=str(tmp_path))
+    assert sqlite.get_objects(list(transport.objects)) == transport.objects
+    assert dict(sqlite.get_all_objects()) == transport.objects
+    sqlite.close()
+    with sqlite3.connect(tmp_path / "Objects.db") as connection:
+        flags = dict(connection.execute("SELECT hash, compression FROM objects"))
+    assert flags[obj_id] == 0 and 1 in flags.values()
+
+
+@pytest.mark.parametrize("codec", ["zlib", "msgpack"])
+def test_sqlite_reads_objects_stored_with_other_codecs(
+    model: Base, tmp_path, monkeypatch, codec: str
+):
+    if codec == "zlib":
+        monkeypatch.setitem(codecs.CODECS, codec, ZlibCodec)
+    else:
+        pytest.importorskip(codec)
+    monkeypatch.setattr(codecs, "_STORAGE_CODECS", {})
+    transport = MemoryTransport()
+    operations.send(model, [transport], False)
+    ids = list(transport.objects)
+    stored = SQLiteTransport(base_path=str(tmp_path), codec=codec)
+    stored.begin_write()
+    for id in ids[: len(ids) // 2]:
+        stored.save_object(id, transport.objects[id])
+    stored.end_write()
+    stored.close()
+
+    # each object is read back with the codec it was stored with
+    plain = SQLiteTransport(base_path=str(tmp_path), compression="zlib")
+    plain.begin_write()
+    for id in ids:
+        plain.save_object(id, transport.objects[id])
+    plain.end_write()
+    assert plain.get_objects(ids) == transport.objects
+    assert all(plain.get_object(id) == transport.objects[id] for id in ids)
+    plain.close()
+    with sqlite3.connect(tmp_path / "Objects.db") as connection:
+        flags = dict(connection.execute("SELECT hash, codec FROM objects"))
+    assert set(flags.values()) == {0, get_codec(codec).flag}
+    with pytest.raises(SpeckleException):
+        get_storage_codec(101)
@@ -0,0 +1,92 @@
+import pytest
+
+from specklepy.core.api import operations
+from specklepy.logging.exceptions import SpeckleWarning
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Point
+from specklepy.objects.graph_traversal.traversal import GraphTraversal, TraversalRule
+from specklepy.objects.other import Collection
+from tests.conftest import CountingTransport
+
+
+@pytest.fixture()
+def transport(model: Collection) -> CountingTransport:
+    transport = CountingTransport()
+    operations.send(model, [transport], False)
+    transport.read_ids.clear()
+    return transport
+
+
+def test_lazy_receive_reads_children_on_access(
+    model: Collection, transport: CountingTransport
+):
+    root_id = model.get_id(decompose=True)
+    received = operations.receive(root_id, local_transport=transport, lazy=True)
+
+    # the first element is read to find out whether the list was chunked
+    assert received.name == "model"
+    assert len(transport.read_ids) == 2
+
+    element = received.elements[3]
+    assert isinstance(element, Base)
+    assert element.id == model.elements[3].get_id(decompose=True)
+    assert len(transport.read_ids) == 2
+
+    # and the first mesh of its display value
+    assert element.name == "element 3"
+    assert len(transport.read_ids) == 4
+    assert isinstance(element["@location"], Point)
+    assert element["@location"].x == 3
+    assert len(transport.read_ids) == 5
+
+
+def test_lazy_receive_matches_eager_receive(
+    model: Collection, transport: CountingTransport
+):
+    root_id = model.get_id(decompose=True)
+    eager = operations.receive(root_id, local_transport=transport)
+    lazy = operations.receive(root_id, local_transport=transport, lazy=True)
+
+    assert operations.serialize(lazy) == operations.serialize(eager)
+    assert lazy.get_id(decompose=True) == root_id
+    assert lazy.elements[0]["@shared"] is lazy.elements[9]["@shared"]
+
+
+def test_lazy_receive_graph_traversal(model: Collection, transport: CountingTransport):
+    root_id = model.get_id(decompose=True)
+    rule = TraversalRule([lambda _: True], lambda x: x.get_member_names())
+    eager = operations.receive(root_id, local_transport=transport)
+    lazy = operations.receive(root_id, local_transport=transport, lazy=True)
+
+    eager_types = [
+        c.current.speckle_type for c in GraphTraversal([rule]).traverse(eager)
+    ]
+    lazy_types = [c.current.speckle_type for c in GraphTraversal([rule]).traverse(lazy)]
+
+    assert lazy_types == eager_types
+    assert "Objects.Geometry.Mesh" in lazy_types
+
+
+def test_lazy_receive_missing_child(model: Collection, transport: CountingTransport):
+    root_id = model.get_id(decompose=True)
+    location_id = model.elements[0]["@location"].get_id()
+    del transport.objects[location_id]
+    received = operations.receive(root_id, local_transport=transport, lazy=True)
+    location = received.elements[0]["@location"]
+
+    with pytest.warns(SpeckleWarning):
+        assert location.referencedId == location_id
+
+
+def test_lazy_reference_is_not_a_registered_type(
+    model: Collection, transport: CountingTransport
+):
+    root_id = model.get_id(decompose=True)
+    received = operations.receive(root_id, local_transport=transport, lazy=True)
+    element = received.elements[3]
+    proxy_type = type(element)
+
+    assert proxy_type not in Base._type_registry.values()
+    assert Base.get_registered_type(proxy_type.speckle_type) is None
+    element.name
+    assert type(element) is Base
@@ -0,0 +1,114 @@
+from typing import List
+
+import pytest
+
+from specklepy.core.api import operations
+from specklepy.logging.exceptions import SpeckleWarning
+from specklepy.objects.base import Base
+from specklepy.objects.other import Collection
+from specklepy.serialization.object_cache import RECEIVED_OBJECTS, ObjectCache
+from specklepy.transports.memory import MemoryTransport
+from tests.conftest import CountingTransport
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    RECEIVED_OBJECTS.clear()
+    yield
+    RECEIVED_OBJECTS.clear()
+
+
+def version(elements: List[Base], name: str) -> Collection:
+    return Collection(name=name, collectionType="model", elements=elements)
+
+
+def test_object_cache_evicts_least_recently_used():
+    cache = ObjectCache(max_bytes=10)
+    a, b, c = Base(name="a"), Base(name="b"), Base(name="c")
+    cache.put("a", a, 4)
+    cache.put("b", b, 4)
+
+    assert cache.get("a") is a
+    cache.put("c", c, 4)
+    cache.put("too big", Base(), 11)
+
+    assert cache.get("b") is None
+    assert cache.get("c") is c
+    assert "too big" not in cache
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 1,
+        "objects": 2,
+        "bytes": 8,
+        "max_bytes": 10,
+    }
+
+
+def test_receive_reuses_shared_objects():
+    elements = [Base(name=f"element {i}") for i in range(10)]
+    for i, element in enumerate(elements):
+        element["@detail"] = Base(area=i)
+    transport = CountingTransport()
+    first_id = operations.send(version(elements, "first"), [transport], False)
+    changed = Base(name="changed")
+    second_id = operations.send(
+        version(elements[:-1] + [changed], "second"), [transport], False
+    )
+    transport.read_ids.clear()
+
+    first = operations.receive(first_id, local_transport=transport, cache_objects=True)
+    first_reads = len(transport.read_ids)
+    transport.read_ids.clear()
+    second = operations.receive(
+        second_id, local_transport=transport, cache_objects=True
+    )
+
+    assert first_reads == 21
+    # the root and the changed element
+    assert len(transport.read_ids) == 2
+    assert second.elements[0] is first.elements[0]
+    assert second.elements[-1].name == "changed"
+    assert RECEIVED_OBJECTS.hits == 9
+    assert (
+        operations.receive(first_id, local_transport=transport, cache_objects=True)
+        is first
+    )
+
+
+def test_receive_without_cache():
+    transport = MemoryTransport()
+    obj_id = operations.send(version([Base(name="element")], "v"), [transport], False)
+
+    first = operations.receive(obj_id, local_transport=transport)
+
+    assert operations.receive(obj_id, local_transport=transport) is not first
+    assert len(RECEIVED_OBJECTS) == 0
+
+
+def test_incomplete_receive_is_not_cached():
+    element = Base(name="element")
+    transport = MemoryTransport()
+    obj_id = operations.send(version([element], "v"), [transport], False)
+    del transport.objects[element.get_id()]
+
+    with pytest.warns(SpeckleWarning):
+        operations.receive(obj_id, local_transport=transport, cache_objects=True)
+
+    assert len(RECEIVED_OBJECTS) == 0
+
+
+def test_cached_objects_are_charged_for_their_children():
+    elements = [Base(name=f"element {i}") for i in range(10)]
+    for i, element in enumerate(elements):
+        element["@detail"] = Base(area=i)
+    transport = MemoryTransport()
+    obj_id = operations.send(version(elements, "v"), [transport], False)
+
+    operations.receive(obj_id, local_transport=transport, cache_objects=True)
+
+    element_id = elements[0].get_id(decompose=True)
+    detail_id = elements[0]["@detail"].get_id()
+    assert RECEIVED_OBJECTS.size(element_id) == len(
+        transport.objects[element_id]
+    ) + len(transport.objects[detail_id])
+    assert RECEIVED_OBJECTS.size(obj_id) == sum(map(len, transport.objects.values()))
@@ -0,0 +1,52 @@
+import pytest
+
+from specklepy.core.api import operations
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.objects.base import Base
+from specklepy.objects.other import Collection
+from specklepy.transports.memory import MemoryTransport
+
+
+@pytest.fixture()
+def model(model: Collection) -> Collection:
+    # in layers, with an object shared across them and an inlined object at the root
+    model.elements = [
+        Collection(name=f"layer {i}", elements=model.elements[i::2]) for i in range(2)
+    ]
+    model["@shared"] = model.elements[0].elements[0]["@shared"]
+    model.info = Base(name="inline")
+    return model
+
+
+def send(base: Base, **kwargs):
+    transport = MemoryTransport()
+    obj_id = operations.send(base, [transport], False, **kwargs)
+    return obj_id, transport.objects
+
+
+def test_parallel_send_matches_serial_send(model: Collection):
+    serial_id, serial_objects = send(model)
+    parallel_id, parallel_objects = send(model, workers=2)
+
+    assert parallel_id == serial_id
+    assert parallel_objects == serial_objects
+    assert list(parallel_objects) == list(serial_objects)
+
+
+def test_parallel_send_with_subtree_cache(model: Collection):
+    serial_id, _ = send(model)
+    transport = MemoryTransport()
+    first_id = operations.send(model, [transport], False, True, workers=2)
+    model.elements[0].elements[0]["@location"].x = 10
+    second_id = operations.send(model, [transport], False, True, workers=2)
+
+    assert first_id == serial_id
+    assert second_id == send(model)[0]
+    assert second_id != first_id
+
+
+def test_parallel_send_circular_reference(model: Collection):
+    model.elements[1].elements[0]["@parent"] = model.elements[1]
+
+    with pytest.raises(SpeckleException):
+        send(model, workers=2)
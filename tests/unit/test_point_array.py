@@ -0,0 +1,98 @@
+import pytest
+
+from specklepy.api import operations
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import (
+    Brep,
+    ControlPoint,
+    Mesh,
+    Point,
+    PointArray,
+    Vector,
+)
+from specklepy.transports.memory import MemoryTransport
+
+
+def points(count: int):
+    return [Point(x=i, y=i / 2, z=-i, units="m") for i in range(count)]
+
+
+def test_point_array_holds_points():
+    array = PointArray(points(5))
+
+    assert len(array) == 5
+    assert array.units == "m"
+    assert array.to_list()[3:6] == [1.0, 0.5, -1.0]
+    assert [p.get_id() for p in array] == [p.get_id() for p in points(5)]
+    assert array[-1].to_list() == [4.0, 2.0, -4.0]
+    assert array[-1].units == "m"
+    assert [p.x for p in array[1:4]] == [1.0, 2.0, 3.0]
+
+
+def test_point_array_is_mutable():
+    array = PointArray(points(3))
+
+    array[0] = Point(x=9, y=9, z=9, units="m")
+    array.insert(100, Point(x=5, y=5, z=5, units="m"))
+    array.insert(0, Point(x=-1, y=-1, z=-1, units="m"))
+    del array[1:3]
+
+    assert [p.x for p in array] == [-1.0, 2.0, 5.0]
+    with pytest.raises(IndexError):
+        array[3]
+    with pytest.raises(SpeckleException):
+        array.append(Point(x=1, units="mm"))
+    with pytest.raises(SpeckleException):
+        array.append(Vector(x=1, units="m"))
+
+
+def test_point_array_of_control_points():
+    array = PointArray(
+        [ControlPoint(x=1, weight=0.5), ControlPoint(x=2)], point_type=ControlPoint
+    )
+
+    assert [(p.x, p.weight) for p in array] == [(1.0, 0.5), (2.0, None)]
+    assert isinstance(array[0], ControlPoint)
+
+
+def test_point_array_from_list():
+    array = PointArray.from_list([0.0, 1.0, 2.0, 3.0, 4.0, 5.0], Vector, "mm")
+
+    assert [v.to_list() for v in array] == [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+    assert array[1].units == "mm"
+    with pytest.raises(SpeckleException):
+        PointArray.from_list([0.0, 1.0])
+
+
+@pytest.mark.parametrize("detach", [False, True])
+def test_point_array_serializes_as_list_of_points(detach: bool):
+    name = "@points" if detach else "points"
+    listed, compact = Base(), Base()
+    listed[name] = points(10)
+    compact[name] = PointArray(points(10))
+
+    assert operations.serialize(compact) == operations.serialize(listed)
+    transport = MemoryTransport()
+    obj_id = operations.send(compact, [transport], False)
+    assert obj_id == operations.send(listed, [MemoryTransport()], False)
+
+    received = operations.receive(obj_id, local_transport=transport)
+    assert [p.get_id() for p in received[name]] == [p.get_id() for p in points(10)]
+
+
+def test_point_array_on_typed_member():
+    listed, compact = Brep(), Brep()
+    listed.Vertices = points(10)
+    compact.Vertices = PointArray(points(10))
+
+    assert isinstance(compact.Vertices, PointArray)
+    assert operations.serialize(compact) == operations.serialize(listed)
+    # the vertices of a brep get chunked
+    assert operations.send(compact, [MemoryTransport()], False) == operations.send(
+        listed, [MemoryTransport()], False
+    )
+    with pytest.raises(SpeckleException):
+        Mesh().vertices = PointArray(points(10))
+    with pytest.raises(SpeckleException):
+        Brep().Vertices = PointArray(points(10), point_type=Vector)
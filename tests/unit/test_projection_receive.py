@@ -0,0 +1,125 @@
+import json
+from typing import List
+
+import pytest
+
+from specklepy.core.api import operations
+from specklepy.objects.base import Base
+from specklepy.objects.other import Collection
+from specklepy.transports.memory import MemoryTransport
+from tests.conftest import CountingTransport
+
+
+@pytest.fixture()
+def transport(model: Collection) -> CountingTransport:
+    transport = CountingTransport()
+    operations.send(model, [transport], False)
+    transport.read_ids.clear()
+    return transport
+
+
+def mesh_ids(model: Collection) -> List[str]:
+    return [e["@displayValue"][0].get_id(decompose=True) for e in model.elements]
+
+
+def test_include_name_at_any_depth(model: Collection, transport: CountingTransport):
+    obj_id = model.get_id(decompose=True)
+
+    received = operations.receive(
+        obj_id, local_transport=transport, include=["ListOfUnitFunctions"]
+    )
+
+    assert [e["@Data"].ListOfUnitFunctions for e in received.elements] == [
+        ["living", i] for i in range(10)
+    ]
+    assert "area" not in received.elements[0]["@Data"].get_member_names()
+    assert "name" not in received.elements[0].get_member_names()
+    # every object but the chunks of the meshes might hold the member
+    assert len(transport.objects) == 53
+    assert len(transport.read_ids) == 42
+
+
+def test_include_dotted_path(model: Collection, transport: CountingTransport):
+    obj_id = model.get_id(decompose=True)
+    data_ids = [e["@Data"].get_id() for e in model.elements]
+
+    received = operations.receive(
+        obj_id, local_transport=transport, include=["elements.name"]
+    )
+
+    assert [e.name for e in received.elements] == [f"element {i}" for i in range(10)]
+    assert "@Data" not in received.elements[0].get_member_names()
+    # the root, then the elements
+    assert len(transport.read_ids) == 11
+    assert not set(data_ids + mesh_ids(model)) & set(transport.read_ids)
+
+
+def test_include_referenced_member(model: Collection, transport: CountingTransport):
+    obj_id = model.get_id(decompose=True)
+
+    received = operations.receive(
+        obj_id, local_transport=transport, include=["elements.@displayValue"]
+    )
+
+    meshes = [e["@displayValue"][0] for e in received.elements]
+    assert [m.get_id(decompose=True) for m in meshes] == mesh_ids(model)
+    assert meshes[3].vertices == [0.0, 1.0, 3.0] * 3
+
+
+def test_include_missing_member(model: Collection, transport: CountingTransport):
+    obj_id = model.get_id(decompose=True)
+
+    received = operations.receive(
+        obj_id, local_transport=transport, include=["elements.missing"]
+    )
+
+    assert isinstance(received, Collection)
+    assert received.get_member_names() == Collection().get_member_names()
+
+
+def test_include_keeps_remote_children_locally(
+    model: Collection, transport: CountingTransport
+):
+    obj_id = model.get_id(decompose=True)
+    local = MemoryTransport()
+
+    for _ in range(2):
+        received = operations.receive(
+            obj_id,
+            remote_transport=transport,
+            local_transport=local,
+            include=["elements.name"],
+        )
+
+    assert [e.name for e in received.elements] == [f"element {i}" for i in range(10)]
+    # the elements are read from the remote once, and the root every time
+    assert len(transport.read_ids) == 12
+    assert len(local.objects) == 10 and obj_id not in local.objects
+
+
+def test_include_every_member_of_a_data_object():
+    # shaped like the dashboard models, whose data the front end extracts
+    data = Base(name="data", Area=120.5)
+    data["@Data"] = Base(
+        Levels=4, rooms=[Base(name=f"room {i}", Area=i) for i in range(3)]
+    )
+    model = Base(name="model")
+    model["@Data"] = data
+    model["@elements"] = [Base(Area=i, Levels=i) for i in range(5)]
+    transport = CountingTransport()
+    obj_id = operations.send(model, [transport], False)
+
+    # every member of the @Data object, as the front end's data extractor includes
+    data_id = json.loads(transport.get_object(obj_id))["@Data"]["referencedId"]
+    include = ["@Data." + name for name in json.loads(transport.get_object(data_id))]
+    transport.read_ids.clear()
+    received = operations.receive(obj_id, local_transport=transport, include=include)
+    read_ids = set(transport.read_ids)
+    full = operations.receive(obj_id, local_transport=transport)
+
+    assert received["@Data"]["@Data"].rooms[2].Area == 2
+    assert received["@Data"].get_id(decompose=True) == full["@Data"].get_id(
+        decompose=True
+    )
+    assert "@elements" not in received.get_member_names()
+    assert not {e.get_id() for e in model["@elements"]} & read_ids
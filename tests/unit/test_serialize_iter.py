@@ -0,0 +1,96 @@
+import tracemalloc
+from typing import List
+
+import ujson
+
+from specklepy.core.api import operations
+from specklepy.objects.base import Base
+from specklepy.objects.geometry import Mesh, Point
+from specklepy.transports.memory import MemoryTransport
+
+
+def model() -> Base:
+    shared = Base(name="shared")
+    elements = []
+    for i in range(5):
+        element = Base(name=f"element {i}", shared=shared)
+        element["@detail"] = Base(area=i)
+        element["@displayValue"] = [
+            Mesh(vertices=[0.5, 1.0, float(i)] * 3, faces=[3, 0, 1, 2])
+        ]
+        elements.append(element)
+    root = Base(name="root")
+    root["@elements"] = elements
+    root["@shared"] = shared
+    return root
+
+
+def test_serialize_iter_matches_send():
+    base = model()
+    transport = MemoryTransport()
+    obj_id = operations.send(base, [transport], False)
+
+    objects = list(operations.serialize_iter(base))
+
+    assert dict(objects) == transport.objects
+    assert objects[-1][0] == obj_id
+    # the equal chunks of the faces of the meshes turn up once per mesh
+    assert len(objects) == len(transport.objects) + 4
+
+
+def test_serialize_iter_yields_children_first():
+    written: List[str] = []
+    for obj_id, serialized in operations.serialize_iter(model()):
+        obj = ujson.loads(serialized)
+        assert obj["id"] == obj_id
+        assert set(obj.get("__closure", {})) <= set(written)
+        written.append(obj_id)
+
+
+def test_serialize_iter_is_lazy():
+    traversed = []
+
+    class CountedBase(Base):
+        def get_serializable_attributes(self) -> List[str]:
+            traversed.append(self.name)
+            return super().get_serializable_attributes()
+
+    root = CountedBase(name="root")
+    root["@children"] = [CountedBase(name=str(i)) for i in range(3)]
+
+    objects = operations.serialize_iter(root)
+    next(objects)
+
+    assert traversed == ["root", "0"]
+
+
+def test_serialize_iter_writes_to_transports():
+    base = model()
+    transport = MemoryTransport()
+
+    objects = dict(operations.serialize_iter(base, [transport]))
+
+    assert objects == transport.objects
+
+
+def test_serialize_iter_memory_stays_flat():
+    def peak(element_count: int) -> int:
+        root = Base(name="root")
+        root["@elements"] = [
+            Base(name=str(i), points=[Point(x=i, y=j) for j in range(20)])
+            for i in range(element_count)
+        ]
+        # the first pass also builds the `__dict__` of every object of the model
+        for _ in operations.serialize_iter(root):
+            pass
+        tracemalloc.start()
+        try:
+            for _ in operations.serialize_iter(root):
+                pass
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    # the ids of the elements are kept for the closure of the root, but not the
+    # dicts of their points
+    assert (peak(200) - peak(50)) / 150 < 2000
@@ -0,0 +1,106 @@
+import sqlite3
+
+from specklepy.transports.sqlite import SQLiteTransport
+
+
+def save(transport: SQLiteTransport, ids: range) -> None:
+    transport.begin_write()
+    for i in ids:
+        transport.save_object(f"{i:032x}", f'{{"id":"{i:032x}","data":"{"x" * 160}"}}')
+    transport.end_write()
+
+
+def test_evicts_least_recently_used_objects(tmp_path):
+    # 211 bytes per object, so 47 objects fit and 42 are kept
+    transport = SQLiteTransport(base_path=str(tmp_path), max_size_mb=0.01)
+    save(transport, range(30))
+    assert transport.get_object(f"{0:032x}") is not None
+    transport.get_objects([f"{i:032x}" for i in range(1, 5)])
+
+    save(transport, range(30, 60))
+    transport.close()
+
+    transport = SQLiteTransport(base_path=str(tmp_path), max_size_mb=0.01)
+    found = transport.has_objects([f"{i:032x}" for i in range(60)])
+    stats = transport.stats()
+    transport.close()
+
+    assert 0.8 * 10000 < stats["bytes"] <= 0.9 * 10000
+    assert all(found[f"{i:032x}"] for i in range(5))
+    assert not any(found[f"{i:032x}"] for i in range(5, 23))
+    assert all(found[f"{i:032x}"] for i in range(23, 60))
+
+
+def test_evicts_objects_saved_without_max_size(tmp_path):
+    transport = SQLiteTransport(base_path=str(tmp_path))
+    save(transport, range(100))
+    transport.close()
+
+    transport = SQLiteTransport(base_path=str(tmp_path), max_size_mb=0.01)
+    evicted = transport.evict()
+
+    assert evicted > 50
+    assert transport.stats()["objects"] == 100 - evicted
+    transport.close()
+
+
+def test_stats(tmp_path):
+    transport = SQLiteTransport(base_path=str(tmp_path))
+    save(transport, range(10))
+
+    transport.get_object(f"{0:032x}")
+    transport.get_object("missing")
+    transport.has_objects([f"{1:032x}", f"{2:032x}", "missing"])
+    stats = transport.stats()
+    transport.close()
+
+    assert stats["objects"] == 10
+    assert stats["bytes"] == 10 * len(f'{{"id":"{0:032x}","data":"{"x" * 160}"}}')
+    assert stats["max_bytes"] is None
+    # checking which objects are stored isn't counted
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert transport.evict() == 0
+
+
+def test_evicts(tmp_path):
+    transport = SQLiteTransport(base_path=str(tmp_path))
+    assert not transport.evicts
+
+    bounded = SQLiteTransport(base_path=str(tmp_path), max_size_mb=0.01)
+
+    # the objects it saves can be evicted by the bounded transport
+    assert bounded.evicts and transport.evicts
+    bounded.close()
+    transport.close()
+    assert SQLiteTransport(base_path=str(tmp_path)).evicts
+    assert not SQLiteTransport(base_path=str(tmp_path), scope="Other").evicts
+
+
+def test_tracks_objects_saved_while_evicting(tmp_path):
+    transport = SQLiteTransport(base_path=str(tmp_path))
+    save(transport, range(100))
+    transport.close()
+
+    bounded = SQLiteTransport(base_path=str(tmp_path), max_size_mb=0.01)
+    connect = bounded._SQLiteTransport__connect
+
+    def connect_saving_on_delete() -> sqlite3.Connection:
+        def trace(statement: str) -> None:
+            if statement.startswith("DELETE FROM objects"):
+                connection.set_trace_callback(None)
+                # kept in the batch, as the db is locked by the eviction
+                bounded.save_object("new", f'{{"id":"new","data":"{"x" * 160}"}}')
+
+        connection = connect()
+        connection.set_trace_callback(trace)
+        return connection
+
+    bounded._SQLiteTransport__connect = connect_saving_on_delete
+    bounded.evict()
+    with sqlite3.connect(tmp_path / "Objects.db") as connection:
+        evicted_size = connection.execute("SELECT SUM(size) FROM access").fetchone()[0]
+    size = len(f'{{"id":"new","data":"{"x" * 160}"}}')
+
+    assert bounded._tracked_bytes == evicted_size + size
+    bounded.close()
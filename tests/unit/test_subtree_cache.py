@@ -0,0 +1,70 @@
+from specklepy.core.api import operations
+from specklepy.objects.base import Base
+from specklepy.objects.other import Collection
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.memory import MemoryTransport
+from specklepy.transports.sqlite import SQLiteTransport
+
+
+def fresh_id(base: Base) -> str:
+    return BaseObjectSerializer(write_transports=[MemoryTransport()]).write_json(base)[
+        0
+    ]
+
+
+def test_resend_skips_stored_objects(model: Collection):
+    transport = MemoryTransport()
+    first_id = operations.send(model, [transport], False, cache_subtrees=True)
+    object_count = len(transport.objects)
+
+    transport.objects.clear()
+    second_id = operations.send(model, [transport], False, cache_subtrees=True)
+
+    assert first_id == second_id == fresh_id(model)
+    assert object_count == 53
+    assert transport.objects == {}
+
+
+def test_new_store_gets_all_objects(model: Collection):
+    operations.send(model, [MemoryTransport()], False, cache_subtrees=True)
+
+    transport = MemoryTransport()
+    operations.send(model, [transport], False, cache_subtrees=True)
+
+    assert len(transport.objects) == 53
+
+
+def test_modified_subtree_is_reserialized(model: Collection):
+    transport = MemoryTransport()
+    operations.send(model, [transport], False, cache_subtrees=True)
+    unmodified_id = model.get_id(cache_subtrees=True)
+
+    transport.objects.clear()
+    model.elements[3]["@location"].z = 7
+    obj_id = operations.send(model, [transport], False, cache_subtrees=True)
+
+    assert obj_id == fresh_id(model)
+    assert model.get_id(cache_subtrees=True) == model.get_id() != unmodified_id
+    # the point, the element holding it and the root
+    assert len(transport.objects) == 3
+
+
+def test_in_place_mutation_needs_marking_dirty(model: Collection):
+    transport = MemoryTransport()
+    unmodified_id = operations.send(model, [transport], False, cache_subtrees=True)
+
+    model.elements[0].tags.append("c")
+    stale_id = operations.send(model, [transport], False, cache_subtrees=True)
+    model.elements[0].mark_dirty()
+    obj_id = operations.send(model, [transport], False, cache_subtrees=True)
+
+    assert stale_id == unmodified_id
+    assert obj_id == fresh_id(model) != unmodified_id
+
+
+def test_sqlite_transports_share_a_store(tmp_path):
+    first = SQLiteTransport(base_path=str(tmp_path))
+    second = SQLiteTransport(base_path=str(tmp_path))
+
+    assert first.store_id == second.store_id
+    assert MemoryTransport().store_id != MemoryTransport().store_id
@@ -0,0 +1,186 @@
+from threading import Event
+from typing import Any
+
+import pytest
+import ujson
+
+from specklepy.core.api import operations
+from specklepy.logging.exceptions import SpeckleException, SpeckleWarning
+from specklepy.objects.base import Base
+from specklepy.transports.memory import MemoryTransport
+from specklepy.transports.sqlite import SQLiteTransport
+from specklepy.transports.tiered import TieredTransport
+
+
+class BlockedTransport(MemoryTransport):
+    """Holds its writes until `written` is set"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.written = Event()
+
+    def end_write(self) -> None:
+        self.written.wait(5)
+
+
+@pytest.fixture()
+def model() -> Base:
+    model = Base(name="model")
+    model["@elements"] = [Base(name=f"element {i}", area=i) for i in range(10)]
+    return model
+
+
+def obj(i: int) -> str:
+    return f'{{"id":"{i:032x}","x":"{"x" * 50}"}}'
+
+
+def test_memory_transport_max_size():
+    # 100 bytes per object, so 5 objects fit
+    transport = MemoryTransport(max_size_mb=0.0005)
+    for i in range(5):
+        transport.save_object(f"{i:032x}", obj(i))
+    assert transport.get_object(f"{0:032x}") == obj(0)
+    transport.save_object(f"{5:032x}", obj(5))
+
+    assert list(transport.objects) == [f"{i:032x}" for i in (2, 3, 4, 0, 5)]
+    assert transport.get_object(f"{1:032x}") is None
+
+
+def test_reads_fall_through_and_populate_faster_tiers():
+    fast, middle, slow = MemoryTransport(), MemoryTransport(), MemoryTransport()
+    slow.save_object("a", obj(1))
+    middle.save_object("b", obj(2))
+    transport = TieredTransport([fast, middle, slow])
+
+    assert transport.get_objects(["a", "b", "c"]) == {"a": obj(1), "b": obj(2)}
+    assert transport.has_objects(["a", "c"]) == {"a": True, "c": False}
+    transport.flush()
+
+    assert fast.objects == {"a": obj(1), "b": obj(2)}
+    assert middle.objects == {"a": obj(1), "b": obj(2)}
+    assert slow.objects == {"a": obj(1)}
+
+
+def test_writes_reach_slower_tiers_in_the_background():
+    fast, slow = MemoryTransport(max_size_mb=0.0002), BlockedTransport()
+    transport = TieredTransport([fast, slow])
+    transport.begin_write()
+    for i in range(5):
+        transport.save_object(str(i), obj(i))
+    transport.end_write()
+
+    # dropped by the fastest tier, but not written to the slower one yet
+    assert "0" not in fast.objects
+    assert transport.get_object("0") == obj(0)
+    assert transport.has_objects(["0"]) == {"0": True}
+
+    slow.written.set()
+    transport.flush()
+    assert slow.get_objects([str(i) for i in range(5)]) == {
+        str(i): obj(i) for i in range(5)
+    }
+    transport.close()
+
+
+def test_flush_raises_write_errors():
+    class FailingTransport(MemoryTransport):
+        def save_object(self, id: str, serialized_object: str) -> None:
+            raise ValueError("disk full")
+
+    transport = TieredTransport([MemoryTransport(), FailingTransport()])
+    transport.save_object("a", obj(1))
+
+    with pytest.raises(SpeckleException):
+        transport.flush()
+    transport.flush()
+
+
+def test_copy_object_and_children(model: Base):
+    source = MemoryTransport()
+    obj_id = operations.send(model, [source], False)
+    target = MemoryTransport()
+
+    TieredTransport([MemoryTransport(), source]).copy_object_and_children(
+        obj_id, target
+    )
+
+    assert target.objects == source.objects
+
+
+def test_default_cache(model: Base, tmp_path):
+    sqlite = SQLiteTransport(base_path=str(tmp_path))
+    obj_id = operations.send(model, [sqlite], False)
+    memory = MemoryTransport(max_size_mb=10)
+    operations.set_default_cache(TieredTransport([memory, sqlite]))
+    try:
+        received = operations.receive(obj_id)
+        assert received.get_id(decompose=True) == obj_id
+        assert len(memory.objects) == len(sqlite.get_all_objects())
+
+        assert operations.send(Base(name="new")) in memory.objects
+    finally:
+        operations.set_default_cache(None)
+        sqlite.close()
+
+
+def test_receive_refetches_children_evicted_from_the_local_transport(model: Base):
+    source = MemoryTransport()
+    obj_id = operations.send(model, [source], False)
+    remote = TieredTransport([MemoryTransport(), source])
+    local = MemoryTransport(max_size_mb=10)
+    operations.send(model, [local], False)
+    evicted = [id for id in local.objects if id != obj_id][:3]
+    for id in evicted:
+        del local.objects[id]
+
+    with pytest.raises(SpeckleException):
+        operations.receive(obj_id, local_transport=local)
+    partial = operations.receive(obj_id, remote, local, include=["area"])
+    received = operations.receive(obj_id, remote, local)
+
+    assert [e.area for e in partial["@elements"]] == list(range(10))
+    assert received.get_id(decompose=True) == obj_id
+    assert all(local.has_objects(evicted).values())
+
+
+def test_cached_subtrees_are_written_again_once_evicted(model: Base):
+    transport = MemoryTransport(max_size_mb=10)
+    operations.send(model, [transport], False, cache_subtrees=True)
+    evicted = model["@elements"][0].get_id()
+    del transport.objects[evicted]
+
+    operations.send(model, [transport], False, cache_subtrees=True)
+
+    assert evicted in transport.objects
+
+
+def too_big(data: str) -> Any:
+    # older versions of ujson can't decode ints beyond 64 bits
+    raise ValueError("Value is too big!")
+
+
+def test_receive_checks_the_children_of_roots_with_big_ints(model: Base, monkeypatch):
+    model.big = 2**70
+    local = MemoryTransport(max_size_mb=10)
+    obj_id = operations.send(model, [local], False)
+
+    monkeypatch.setattr(ujson, "loads", too_big)
+    with pytest.warns(SpeckleWarning):
+        received = operations.receive(obj_id, local_transport=local)
+
+    assert received.big == 2**70
+
+
+def test_copy_object_and_children_with_big_ints(model: Base, monkeypatch):
+    model.big = 2**70
+    source = MemoryTransport()
+    obj_id = operations.send(model, [source], False)
+    target = MemoryTransport()
+
+    monkeypatch.setattr(ujson, "loads", too_big)
+    with pytest.warns(SpeckleWarning):
+        TieredTransport([MemoryTransport(), source]).copy_object_and_children(
+            obj_id, target
+        )
+
+    assert target.objects == source.objects
@@ -3,8 +3,10 @@ from typing import List
 import pytest
 
 from specklepy.api import operations
-from specklepy.objects.geometry import Point, Vector
-from specklepy.objects.other import Transform
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.objects import other
+from specklepy.objects.geometry import Mesh, Point, Vector
+from specklepy.objects.other import BlockInstance, Transform
 
 
 @pytest.fixture()
@@ -127,3 +129,58 @@ def test_transform_serialisation(transform: Transform):
     deserialized = operations.deserialize(serialized)
 
     assert transform.get_id() == deserialized.get_id()
+
+
+@pytest.fixture()
+def skewed_transform():
+    """Rotates, scales, translates and has a projective row"""
+    return Transform.from_list(
+        [0.8, -0.6, 0.1, 3.3, 0.6, 0.8, 0.0, -1.7, 0.0, 0.2, 1.5, 0.25]
+        + [0.01, 0.0, 0.02, 1.1]
+    )
+
+
+def test_points_values_transform_without_numpy(
+    skewed_transform: Transform, monkeypatch: pytest.MonkeyPatch
+):
+    pytest.importorskip("numpy")
+    coords = [i * 0.37 - 11 for i in range(300)]
+    vectorized = skewed_transform.apply_to_points_values(coords)
+
+    monkeypatch.setattr(other, "np", None)
+
+    assert skewed_transform.apply_to_points_values(coords) == vectorized
+    with pytest.raises(SpeckleException):
+        skewed_transform.apply_to_points_array(coords)
+
+
+def test_points_array_transform(skewed_transform: Transform, points: List[Point]):
+    np = pytest.importorskip("numpy")
+    array = np.array([point.to_list() for point in points])
+
+    transformed = skewed_transform.apply_to_points_array(array)
+
+    assert transformed.shape == (5, 3)
+    for new_coords, point in zip(transformed.tolist(), points):
+        assert new_coords == skewed_transform.apply_to_point_value(point.to_list())
+    assert skewed_transform.apply_to_points(points)[2].to_list() == (
+        skewed_transform.apply_to_point(points[2]).to_list()
+    )
+
+
+def test_mesh_transform(transform: Transform, points_values: List[float]):
+    mesh = Mesh.create(vertices=points_values, faces=[3, 0, 1, 2], colors=[1, 2, 3])
+    mesh.area = 12.0
+    instance = BlockInstance(transform=transform)
+
+    placed = instance.transform_mesh(mesh)
+
+    assert placed.vertices == transform.apply_to_points_values(points_values)
+    assert placed.faces == mesh.faces
+    assert placed.colors == mesh.colors
+    assert placed.area is None
+    assert mesh.vertices == points_values
+    assert BlockInstance().transform_mesh(mesh).vertices == points_values
+    placed.faces.append(3)
+    placed.colors[0] = 4
+    assert (mesh.faces, mesh.colors) == ([3, 0, 1, 2], [1, 2, 3])
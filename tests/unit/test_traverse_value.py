@@ -1,7 +1,17 @@
+import sys
 from typing import List
 
+import pytest
+import ujson
+
+from specklepy.logging.exceptions import SpeckleException
 from specklepy.objects.base import Base
-from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.serialization import base_object_serializer
+from specklepy.serialization.base_object_serializer import (
+    BaseObjectSerializer,
+    hash_obj,
+)
+from specklepy.transports.memory import MemoryTransport
 
 
 class FakeBase(Base):
@@ -23,3 +33,176 @@ def test_traverse_value():
         "bar": 1,
         "totalChildrenCount": 0,
     }
+
+
+def test_traverse_deeper_than_recursion_limit():
+    depth = 300
+    root = Base(name="0")
+    current = root
+    for i in range(1, depth):
+        current["@child"] = Base(name=str(i))
+        current = current["@child"]
+
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(200)
+    try:
+        object_id, object_dict = BaseObjectSerializer(
+            write_transports=[MemoryTransport()]
+        ).traverse_base(root)
+    finally:
+        sys.setrecursionlimit(limit)
+
+    assert object_dict["totalChildrenCount"] == depth - 1
+    assert max(object_dict["__closure"].values()) == depth - 1
+
+
+def test_traverse_circular_reference():
+    base = Base(name="ouroboros")
+    base.tail = [base]
+
+    with pytest.raises(SpeckleException):
+        BaseObjectSerializer().traverse_base(base)
+
+
+def test_serialized_objects_hash_to_their_id(base: Base):
+    transport = MemoryTransport()
+    root_id, serialized = BaseObjectSerializer(write_transports=[transport]).write_json(
+        base
+    )
+
+    assert transport.objects[root_id] == serialized
+    for object_id, serialized_object in transport.objects.items():
+        obj = ujson.loads(serialized_object)
+        obj.pop("__closure", None)
+        obj["id"] = ""
+        assert hash_obj(obj) == object_id
+
+
+def test_closure_keeps_shallowest_depth():
+    shared = Base(name="shared")
+    deep = Base(name="deep")
+    deep["@shared"] = shared
+    root = Base(inline=Base(name="inline"))
+    root.inline["@deep"] = deep
+    root["@shared"] = shared
+    shared_id, deep_id = shared.get_id(), deep.get_id(decompose=True)
+
+    _, object_dict = BaseObjectSerializer(
+        write_transports=[MemoryTransport()]
+    ).traverse_base(root)
+
+    assert list(object_dict["__closure"].items()) == [(shared_id, 1), (deep_id, 2)]
+    assert object_dict["inline"]["__closure"] == {deep_id: 1, shared_id: 2}
+    assert object_dict["totalChildrenCount"] == 2
+
+
+def test_shared_instances_are_traversed_once():
+    traversed = []
+
+    class CountedBase(Base):
+        def get_serializable_attributes(self) -> List[str]:
+            traversed.append(self)
+            return super().get_serializable_attributes()
+
+    def material() -> Base:
+        material = CountedBase(name="material")
+        material["@texture"] = Base(path="texture.png")
+        return material
+
+    def model(shared_material: bool) -> Base:
+        shared = material()
+        elements = []
+        for i in range(10):
+            element = Base(name=str(i))
+            element.material = shared if shared_material else material()
+            element["@material"] = element.material
+            elements.append(element)
+        return Base(elements=elements)
+
+    shared_transport, copies_transport = MemoryTransport(), MemoryTransport()
+    shared_result = BaseObjectSerializer(
+        write_transports=[shared_transport]
+    ).write_json(model(shared_material=True))
+    # once detached, and once inlined
+    assert len(traversed) == 2
+    copies_result = BaseObjectSerializer(
+        write_transports=[copies_transport]
+    ).write_json(model(shared_material=False))
+
+    assert shared_result == copies_result
+    assert shared_transport.objects == copies_transport.objects
+
+
+def test_shared_detached_instances_with_children():
+    traversed = []
+
+    class CountedMaterial(Base):
+        def get_serializable_attributes(self) -> List[str]:
+            traversed.append(self)
+            return super().get_serializable_attributes()
+
+    def material() -> Base:
+        material = CountedMaterial(name="material")
+        material["@texture"] = Base(path="texture.png")
+        return material
+
+    def model(shared_material: bool) -> Base:
+        shared = material()
+        elements = []
+        for i in range(10):
+            element = Base(name=str(i))
+            element["@material"] = shared if shared_material else material()
+            elements.append(element)
+        return Base(elements=elements)
+
+    shared_transport, copies_transport = MemoryTransport(), MemoryTransport()
+    shared_result = BaseObjectSerializer(
+        write_transports=[shared_transport]
+    ).write_json(model(shared_material=True))
+    # its closure is only kept once it turns up again
+    assert len(traversed) == 2
+    copies_result = BaseObjectSerializer(
+        write_transports=[copies_transport]
+    ).write_json(model(shared_material=False))
+
+    assert shared_result == copies_result
+    assert shared_transport.objects == copies_transport.objects
+
+
+def test_shared_inline_instances_across_detached_objects(monkeypatch):
+    traversed = []
+
+    class CountedStyle(Base):
+        def get_serializable_attributes(self) -> List[str]:
+            traversed.append(self)
+            return super().get_serializable_attributes()
+
+    # the caller holds on to the shared instance too
+    style = CountedStyle(name="style")
+
+    def model(shared_style: bool) -> Base:
+        root = Base(name="root")
+        root["@elements"] = [
+            Base(
+                name=str(i), style=style if shared_style else CountedStyle(name="style")
+            )
+            for i in range(2)
+        ]
+        return root
+
+    copies_transport = MemoryTransport()
+    copies_result = BaseObjectSerializer(
+        write_transports=[copies_transport]
+    ).write_json(model(shared_style=False))
+    # without a window, it's let go once the first element is done
+    for window, traversal_count in ((1000, 1), (0, 2)):
+        monkeypatch.setattr(base_object_serializer, "SEEN_WINDOW", window)
+        traversed.clear()
+        shared_transport = MemoryTransport()
+        shared_result = BaseObjectSerializer(
+            write_transports=[shared_transport]
+        ).write_json(model(shared_style=True))
+
+        assert len(traversed) == traversal_count
+        assert shared_result == copies_result
+        assert shared_transport.objects == copies_transport.objects
@@ -0,0 +1,62 @@
+import pytest
+
+from specklepy.core.api import operations
+from specklepy.logging.exceptions import SpeckleException
+from specklepy.objects.base import Base
+from specklepy.objects.fakemesh import FakeDirection, FakeMesh
+from specklepy.objects.geometry import Point
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.memory import MemoryTransport
+
+
+def test_trusted_values_are_converted():
+    point = operations.deserialize(
+        '{"speckle_type": "Objects.Geometry.Point", "x": 1, "y": 2.5, "z": null,'
+        ' "units": "mm", "applicationId": 42}',
+        MemoryTransport(),
+    )
+
+    assert isinstance(point, Point)
+    assert isinstance(point.x, float) and point.x == 1.0
+    assert point.z is None
+    assert point.units == "mm"
+    assert "units" not in point.__dict__
+    assert point.applicationId == "42"
+
+
+def test_trusted_properties_and_enums():
+    mesh = FakeMesh(cardinal_dir=FakeDirection.WEST, origin=Point(x=4, y=2))
+    mesh["@detach"] = Base(name="detached base")
+    transport = MemoryTransport()
+    obj_id = operations.send(mesh, [transport], False)
+
+    received = operations.receive(obj_id, local_transport=transport)
+
+    assert received.cardinal_dir is FakeDirection.WEST
+    assert received.origin.x == 4.0
+    assert "origin" not in received.__dict__
+    assert received.get_id(decompose=True) == obj_id
+
+
+def test_strict_receive_type_checks():
+    obj_string = '{"speckle_type": "Objects.Geometry.Point", "x": "not a number"}'
+
+    assert operations.deserialize(obj_string, MemoryTransport()).x == "not a number"
+    with pytest.raises(SpeckleException):
+        operations.deserialize(obj_string, MemoryTransport(), strict=True)
+
+
+def test_trusted_receive_matches_strict_receive():
+    mesh = FakeMesh(vertices=[0.5, 1, 2.5] * 100, faces=list(range(100)), units="m")
+    mesh.test_bases = [Base(name=f"test {i}", area=i) for i in range(20)]
+    transport = MemoryTransport()
+    obj_id = operations.send(mesh, [transport], False)
+    root = transport.get_object(obj_id)
+
+    trusted = BaseObjectSerializer(read_transport=transport).read_json(root)
+    strict = BaseObjectSerializer(read_transport=transport, strict=True).read_json(root)
+
+    assert trusted.__dict__.keys() == strict.__dict__.keys()
+    assert trusted.vertices == strict.vertices
+    assert [b.area for b in trusted.test_bases] == list(range(20))
+    assert trusted.get_id(decompose=True) == strict.get_id(decompose=True) == obj_id
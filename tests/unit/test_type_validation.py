@@ -1,9 +1,9 @@
 from enum import Enum, IntEnum
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import pytest
 
-from specklepy.objects.base import Base, _validate_type
+from specklepy.objects.base import Base, _compile_validator, _validate_type
 from specklepy.objects.primitive import Interval
 
 test_base = Base()
@@ -116,10 +116,19 @@ fake_bases = [FakeBase("foo"), FakeBase("bar")]
         (Union[float, Dict[str, float]], {"foo": "bar"}, False, {"foo": "bar"}),
     ],
 )
+@pytest.mark.parametrize(
+    "validate",
+    [_validate_type, lambda t, value: _compile_validator(t)(value)],
+    ids=["validate_type", "compiled"],
+)
 def test_validate_type(
-    input_type: type, value: Any, is_valid: bool, return_value: Any
+    validate: Callable[[Any, Any], Tuple[bool, Any]],
+    input_type: type,
+    value: Any,
+    is_valid: bool,
+    return_value: Any,
 ) -> None:
-    assert (is_valid, return_value) == _validate_type(input_type, value)
+    assert (is_valid, return_value) == validate(input_type, value)
 
 
 def test_intervar_type():